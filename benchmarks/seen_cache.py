@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""ContentCache 기본(JSON) / compact(64비트 해시) 모드 비교
+
+항목 수별로 메모리, 저장/로드 시간, 파일 크기, 오탐(본 적 없는 ID를 본 것으로 판단) 비율을 측정한다.
+
+    python benchmarks/seen_cache.py --sizes 10000 100000 300000 --probes 200000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cache import ContentCache  # noqa: E402
+
+
+def make_id(i: int) -> str:
+    """실제 ID와 비슷한 길이의 문자열 (gdelt_<URL> 등)"""
+    return f"gdelt_https://www.example-news.com/world/2026/10/{i:08d}-markets-rally-on-rate-cut-hopes"
+
+
+def measure(size: int, probes: int, compact: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ContentCache(cache_dir=tmp, ttl_days=3650, max_entries=size, compact=compact)
+        for i in range(size):
+            cache.mark_seen(make_id(i))
+        start = time.perf_counter()
+        cache._save_cache()
+        save_time = time.perf_counter() - start
+        file_size = cache.cache_file.stat().st_size
+        del cache
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        cache = ContentCache(cache_dir=tmp, ttl_days=3650, max_entries=size, compact=compact)
+        load_time = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        false_positives = sum(cache.is_seen(make_id(size + i)) for i in range(probes))
+        lookup_time = (time.perf_counter() - start) / probes
+
+        assert all(cache.is_seen(make_id(i)) for i in range(0, size, max(1, size // 1000)))
+
+    return {
+        "memory": memory,
+        "file_size": file_size,
+        "save_time": save_time,
+        "load_time": load_time,
+        "lookup_us": lookup_time * 1e6,
+        "false_positives": false_positives,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 300000])
+    parser.add_argument("--probes", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"{'mode':8} {'size':>8} {'memory':>10} {'file':>10} {'save':>8} {'load':>8} {'lookup':>9} {'FP':>4} {'expected FP':>12}")
+    for size in args.sizes:
+        for compact in (False, True):
+            r = measure(size, args.probes, compact)
+            # 64비트 해시 n개 중 하나와 충돌할 확률 ≈ n / 2^64 (JSON 모드는 정확히 0)
+            expected = args.probes * size / 2 ** 64 if compact else 0
+            print(f"{'compact' if compact else 'json':8} {size:>8,} "
+                  f"{r['memory'] / 2**20:>8.1f}MB {r['file_size'] / 2**20:>8.1f}MB "
+                  f"{r['save_time']:>7.2f}s {r['load_time']:>7.3f}s {r['lookup_us']:>7.2f}us "
+                  f"{r['false_positives']:>4} {expected:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""TrendStorage 저장 경로별 처리량 (rows/s)
+
+- loop:     이전 방식 (save_item을 행마다 호출 후 commit, FTS/집계 트리거가 행마다 실행)
+- bulk:     save_items, executemany + 행마다 FTS 트리거 (집계는 배치 끝에 한 번)
+- deferred: save_items, executemany 후 새 행을 한 번에 FTS 색인 (집계는 배치 끝에 한 번)
+
+측정값이 흔들리는 환경에서는 --repeat로 여러 번 실행해 가장 빠른 값을 본다.
+
+    python benchmarks/storage_bulk.py --sizes 10000 100000 1000000 --repeat 3
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from storage import TrendStorage  # noqa: E402
+
+WORDS = ("ai model release market rate inflation chip nvidia rust python kernel "
+         "security patch treasury bond yield startup funding open source agent").split()
+
+
+def make_items(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        title = " ".join(rng.choices(WORDS, k=8))
+        items.append({
+            "source": rng.choice(("Hacker News", "GDELT", "RSS/Reuters", "arXiv")),
+            "category": rng.choice(("market", "dev")),
+            "title": f"{title} {i}",
+            "url": f"https://example.com/{i}",
+            "score": rng.randint(0, 500),
+            "body": " ".join(rng.choices(WORDS, k=40)),
+            "meta": f"comments:{rng.randint(0, 300)}",
+        })
+    return items
+
+
+def run(mode: str, items: list) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = TrendStorage(db_path=str(Path(tmp) / "bench.db"))
+        start = time.perf_counter()
+        if mode == "loop":
+            for item in items:
+                storage.save_item(**item)
+            storage.flush()
+        else:
+            storage.save_items(items, defer_fts=(mode == "deferred"))
+        elapsed = time.perf_counter() - start
+
+        # FTS 색인이 모든 행을 포함하는지, 집계가 항목과 맞는지 확인
+        indexed = storage.db.execute("SELECT COUNT(*) FROM items_fts WHERE items_fts MATCH 'nvidia OR rust OR ai'").fetchone()[0]
+        assert indexed > 0
+        rollup = storage.db.execute("SELECT SUM(item_count), SUM(score_sum) FROM item_rollup").fetchone()
+        assert rollup == storage.db.execute("SELECT COUNT(*), SUM(score) FROM items").fetchone()
+        storage.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--loop-max", type=int, default=100000, help="loop 방식을 측정할 최대 행 수")
+    parser.add_argument("--repeat", type=int, default=1, help="모드별 반복 횟수 (가장 빠른 값 출력)")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'mode':>9} {'seconds':>9} {'rows/s':>10}")
+    for size in args.sizes:
+        items = make_items(size)
+        for mode in ("loop", "bulk", "deferred"):
+            if mode == "loop" and size > args.loop_max:
+                continue
+            elapsed = min(run(mode, items) for _ in range(args.repeat))
+            print(f"{size:>10,} {mode:>9} {elapsed:>9.2f} {size / elapsed:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
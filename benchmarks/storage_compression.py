@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""TrendStorage body/meta 압축 전후 DB 크기와 지연 시간
+
+- plain:      압축 없음 (COMPRESS_MIN = None)
+- compressed: COMPRESS_MIN 이상인 body/meta를 zlib BLOB으로 저장 (첫 배치 뒤 공유 사전 생성)
+
+실행 한 번에 저장하는 양(--batch)씩 나눠 저장한다. DB 파일 크기와 함께,
+워크플로 캐시처럼 파일 전체를 다시 압축했을 때의 크기(gzip)도 출력한다.
+
+    python benchmarks/storage_compression.py --rows 50000
+"""
+
+import argparse
+import gzip
+import inspect
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from storage import TrendStorage  # noqa: E402
+from storage_bulk import WORDS  # noqa: E402
+
+
+class PlainStorage(TrendStorage):
+    COMPRESS_MIN = None
+
+
+def corpus_words() -> list:
+    """실제 영어 단어 빈도 표본 (표준 라이브러리 docstring의 단어, 중복 포함)"""
+    import asyncio, collections, email, http.client, json, logging, sqlite3, zipfile
+    text = []
+    for module in (argparse, asyncio, collections, email, http.client, json, logging, sqlite3, zipfile, os, random):
+        for _, obj in inspect.getmembers(module):
+            doc = inspect.getdoc(obj)
+            if doc:
+                text.append(doc)
+    return re.findall(r"[A-Za-z][A-Za-z'-]*", " ".join(text))
+
+
+def make_items(count: int, seed: int = 0) -> list:
+    """RSS 요약(짧음)부터 릴리스 노트/초록(긺)까지 섞인 본문
+
+    단어는 실제 영어 빈도로 뽑되 문장은 행마다 새로 만들어, 행 사이에 같은 문장이 반복되지 않게 한다.
+    """
+    rng = random.Random(seed)
+    words = corpus_words()
+    items = []
+    for i in range(count):
+        sentences = [" ".join(rng.choices(words, k=rng.randint(8, 24))).capitalize() + "."
+                     for _ in range(rng.choice((1, 2, 4, 8, 16)))]
+        items.append({
+            "source": rng.choice(("Hacker News", "RSS/Reuters", "arXiv", "Claude Code", "DEV.to")),
+            "category": rng.choice(("market", "dev")),
+            "title": " ".join(rng.choices(WORDS, k=8)) + f" {i}",
+            "url": f"https://example.com/{i}",
+            "score": rng.randint(0, 500),
+            "body": " ".join(sentences),
+            "meta": f"tags:{','.join(rng.choices(WORDS, k=3))} comments:{rng.randint(0, 300)}",
+        })
+    return items
+
+
+def run(cls, items: list, batch: int, lookups: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        storage = cls(db_path=str(path))
+
+        start = time.perf_counter()
+        for i in range(0, len(items), batch):
+            storage.save_items(items[i:i + batch])
+        save = time.perf_counter() - start
+        storage.db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        storage.db.execute("VACUUM")
+
+        rng = random.Random(1)
+        ids = [rng.randint(1, len(items)) for _ in range(lookups)]
+        start = time.perf_counter()
+        for i in range(0, lookups, 20):
+            storage.get_detail(ids[i:i + 20])
+        detail = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for word in WORDS:
+            storage.search(word, limit=20)
+        search = time.perf_counter() - start
+        storage.close()
+
+        raw = path.read_bytes()
+        return {
+            "size": os.path.getsize(path),
+            "gzip": len(gzip.compress(raw, 6)),
+            "save": save,
+            "detail_ms": detail / lookups * 1000,
+            "search_ms": search / len(WORDS) * 1000,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--batch", type=int, default=500, help="save_items 한 번에 저장할 항목 수")
+    parser.add_argument("--lookups", type=int, default=2000, help="get_detail로 조회할 항목 수")
+    args = parser.parse_args()
+
+    items = make_items(args.rows)
+    body_bytes = sum(len(item["body"].encode("utf-8")) for item in items)
+    print(f"rows={args.rows:,} body={body_bytes / 1e6:.1f}MB")
+    print(f"{'mode':>10} {'db MB':>7} {'gzip MB':>8} {'save s':>7} {'detail ms/item':>15} {'search ms':>10}")
+    for label, cls in (("plain", PlainStorage), ("compressed", TrendStorage)):
+        r = run(cls, items, args.batch, args.lookups)
+        print(f"{label:>10} {r['size'] / 1e6:>7.1f} {r['gzip'] / 1e6:>8.1f} {r['save']:>7.2f} "
+              f"{r['detail_ms']:>15.4f} {r['search_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""수집기별 @dataclass + 소스별 dict 변환(이전 방식)과 TrendItem 비교
+
+HN API 응답과 같은 모양의 dict N개로 레코드를 만들어 항목당 메모리(tracemalloc),
+레코드 생성 시간, 저장 행(dict) 변환 시간을 측정한다.
+
+    python benchmarks/trend_items.py --sizes 10000 100000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from items import TrendItem, iter_items  # noqa: E402
+
+
+@dataclass
+class HNStory:
+    """이전 수집기 레코드 (hackernews.HNStory)"""
+    id: int
+    title: str
+    url: str
+    score: int
+    num_comments: int
+    author: str
+    created_utc: datetime
+
+
+class SlottedHNStory(TrendItem):
+    """collectors/hackernews.py의 HNStory와 같은 모양 (수집기 모듈은 httpx가 필요해 직접 import하지 않음)"""
+    __slots__ = ("num_comments", "author")
+
+    def __init__(self, id: int, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, num_comments: int, author: str):
+        super().__init__("Hacker News", id, title, url, score, body, posted_at)
+        self.num_comments = num_comments
+        self.author = author
+
+    @property
+    def meta(self) -> str:
+        return f"comments:{self.num_comments} by:{self.author}"
+
+    @property
+    def metrics(self) -> dict:
+        return {"score": self.score, "comments": self.num_comments}
+
+
+def make_raw(count: int) -> list:
+    """HN API item 응답과 같은 모양의 dict"""
+    return [{"id": i, "title": f"Show HN: project number {i}", "url": f"https://example.com/{i}",
+             "score": i % 500, "descendants": i % 80, "by": f"user{i % 1000}", "time": 1_700_000_000 + i}
+            for i in range(count)]
+
+
+def make_legacy(raw: list) -> list:
+    """이전 HackerNewsCollector._fetch_story"""
+    return [HNStory(item["id"], item["title"], item["url"], item["score"], item["descendants"],
+                    item["by"], datetime.fromtimestamp(item["time"]))
+            for item in raw]
+
+
+def make_items(raw: list) -> list:
+    """HackerNewsCollector._fetch_story"""
+    return [SlottedHNStory(item["id"], item["title"], item["url"], score=item["score"],
+                           posted_at=float(item["time"]), num_comments=item["descendants"],
+                           author=item["by"])
+            for item in raw]
+
+
+def legacy_rows(stories: list) -> list:
+    """이전 main._extract_items의 Hacker News 분기"""
+    return [{"source": "Hacker News", "category": "dev",
+             "title": s.title, "url": s.url, "score": s.score,
+             "meta": f"comments:{s.num_comments} by:{s.author}",
+             "metrics": {"score": s.score, "comments": s.num_comments},
+             "posted_at": s.created_utc.timestamp()}
+            for s in stories]
+
+
+def item_rows(items: list) -> list:
+    return [item.to_row("dev") for item in iter_items({"top": items})]
+
+
+def best_of(func, *args) -> float:
+    """3회 실행 중 최솟값 (GC 시점에 따른 편차 제외)"""
+    elapsed = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed
+
+
+def measure(raw: list, make, to_rows) -> dict:
+    count = len(raw)
+    make(raw[:10])  # 문자열 캐시 등 초기화 비용 제외
+    tracemalloc.start()
+    records = make(raw)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(to_rows(records)) == count
+    return {"bytes_per_item": memory / count,
+            "build_us": best_of(make, raw) / count * 1e6,
+            "convert_us": best_of(to_rows, records) / count * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'items':>9} {'record':>10} {'bytes/item':>11} {'build us/item':>14} {'convert us/item':>16}")
+    for size in args.sizes:
+        raw = make_raw(size)
+        for name, make, to_rows in (("dataclass", make_legacy, legacy_rows),
+                                    ("TrendItem", make_items, item_rows)):
+            result = measure(raw, make, to_rows)
+            print(f"{size:>9,} {name:>10} {result['bytes_per_item']:>11.0f} "
+                  f"{result['build_us']:>14.2f} {result['convert_us']:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,69 @@
 """Google Gemini API를 사용한 트렌드 분석기"""
 
 import os
-import google.generativeai as genai
+import time
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 import pytz
 
+import profiler
+
+
+@dataclass
+class ReportJob:
+    """제출된 리포트 생성 작업"""
+    kind: str
+    future: Future
+    timeout: Optional[float]
+    submitted: float
+
+    def remaining(self) -> Optional[float]:
+        """남은 대기 시간(초). 제한 시간이 없으면 None"""
+        if self.timeout is None:
+            return None
+        return max(0.0, self.submitted + self.timeout - time.monotonic())
+
 
 class TrendAnalyzer:
-    """수집된 데이터를 Gemini API로 분석하는 클래스"""
+    """수집된 데이터를 Gemini API로 분석하는 클래스
+
+    submit_report / generate_reports로 여러 리포트를 동시에 생성할 수 있다.
+    리포트마다 제한 시간이 따로 적용되며, 한 리포트의 실패나 시간 초과는
+    분석 실패 리포트로 반환되어 다른 리포트에 영향을 주지 않는다.
+    """
+
+    # 리포트 종류별 생성 메서드
+    REPORTS = {
+        "market": "analyze_world_market",
+        "dev": "analyze_dev_ai",
+    }
+
+    MODEL_NAME = 'gemini-3-flash-preview'
 
-    def __init__(self):
-        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-        self.model = genai.GenerativeModel('gemini-3-flash-preview')
+    def __init__(self, report_timeout: Optional[float] = None):
+        self._model = None
+        self._model_lock = threading.Lock()
         self.kst = pytz.timezone('Asia/Seoul')
+        self.report_timeout = report_timeout
+        self._pool = ThreadPoolExecutor(max_workers=len(self.REPORTS), thread_name_prefix="analysis")
+        # 분석 구간이 분석기를 만든 컨텍스트(실행 루트) 아래에 기록되도록 보관
+        self._context = contextvars.copy_context()
+
+    @property
+    def model(self):
+        """Gemini 모델 (SDK는 첫 리포트 생성 시 import)"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    with profiler.span("import:google.generativeai"):
+                        import google.generativeai as genai
+                    genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+                    self._model = genai.GenerativeModel(self.MODEL_NAME)
+        return self._model
 
     def _get_base_rules(self, previous_titles: list = None) -> str:
         """공통 작성 규칙"""
@@ -41,7 +92,8 @@ class TrendAnalyzer:
 """
         return rules
 
-    def analyze_world_market(self, collected_data: str, previous_titles: list = None) -> tuple:
+    def analyze_world_market(self, collected_data: str, previous_titles: list = None,
+                             timeout: Optional[float] = None) -> tuple:
         """세계 정세 & 주식 리포트 생성. (title, report) 튜플 반환"""
         now_kst = datetime.now(self.kst)
         timestamp = now_kst.strftime("%Y-%m-%d %H:%M KST")
@@ -173,9 +225,10 @@ INSIGHT: 유가 급등 자체보다 유럽 제조업 셧다운 가능성이 진
 [세계 정세, 시장, 커뮤니티 여론을 종합한 2-3문장 인사이트]
 """
 
-        return self._generate_report(prompt)
+        return self._generate_report(prompt, timeout=timeout)
 
-    def analyze_dev_ai(self, collected_data: str, previous_titles: list = None) -> tuple:
+    def analyze_dev_ai(self, collected_data: str, previous_titles: list = None,
+                       timeout: Optional[float] = None) -> tuple:
         """개발 & AI 리포트 생성. (title, report) 튜플 반환"""
         now_kst = datetime.now(self.kst)
         timestamp = now_kst.strftime("%Y-%m-%d %H:%M KST")
@@ -305,17 +358,86 @@ INSIGHT: MCP 생태계가 본격화되면서 AI 에이전트의 도구 접근성
 [개발과 AI 트렌드를 종합한 2-3문장 인사이트]
 """
 
-        return self._generate_report(prompt)
+        return self._generate_report(prompt, timeout=timeout)
 
-    def _generate_report(self, prompt: str) -> tuple:
+    def _generate_report(self, prompt: str, timeout: Optional[float] = None) -> tuple:
         """Gemini API로 리포트 생성. (title, keywords, insight, report) 튜플 반환"""
+        request_options = {"timeout": timeout} if timeout else None
+        with profiler.span("analyzer.generate_report", prompt_chars=len(prompt)) as span:
+            try:
+                response = self.model.generate_content(prompt, request_options=request_options)
+                text = response.text
+                usage = getattr(response, "usage_metadata", None)
+                if usage is not None:
+                    span.set(prompt_tokens=getattr(usage, "prompt_token_count", None),
+                             output_tokens=getattr(usage, "candidates_token_count", None))
+                span.set(response_chars=len(text))
+                title, keywords, insight, report = self._extract_title(text)
+                return title, keywords, insight, self._clean_report(report)
+            except Exception as e:
+                span.fail(f"{type(e).__name__}: {e}")
+                return self._failed_report(e)
+
+    FAILED_PREFIX = "분석 실패: "
+
+    @classmethod
+    def _failed_report(cls, reason) -> tuple:
+        """분석 실패 시 반환할 (title, keywords, insight, report) 튜플"""
+        return "리포트", [], "", f"{cls.FAILED_PREFIX}{reason}"
+
+    @classmethod
+    def is_failed(cls, result: tuple) -> bool:
+        """_failed_report로 만든 결과인지 확인"""
+        return result[3].startswith(cls.FAILED_PREFIX)
+
+    # ── 배치 생성 ──
+
+    def submit_report(self, kind: str, collected_data: str, previous_titles: list = None,
+                      timeout: Optional[float] = None) -> ReportJob:
+        """리포트 생성 작업 제출 (즉시 반환). kind: REPORTS의 키"""
+        timeout = timeout if timeout is not None else self.report_timeout
+        future = self._pool.submit(
+            self._context.copy().run, self._run_report, kind, collected_data, previous_titles, timeout
+        )
+        return ReportJob(kind=kind, future=future, timeout=timeout, submitted=time.monotonic())
+
+    def _run_report(self, kind: str, collected_data: str, previous_titles: list,
+                    timeout: Optional[float]) -> tuple:
+        """워커 스레드에서 리포트 생성"""
+        method = getattr(self, self.REPORTS[kind])
+        print(f"  - {kind} 리포트 생성 중...")
+        with profiler.span(f"analysis.{kind}"):
+            return method(collected_data, previous_titles=previous_titles, timeout=timeout)
+
+    def result(self, job: ReportJob) -> tuple:
+        """작업 결과 대기. 시간 초과/예외는 분석 실패 리포트로 반환"""
         try:
-            response = self.model.generate_content(prompt)
-            text = response.text
-            title, keywords, insight, report = self._extract_title(text)
-            return title, keywords, insight, self._clean_report(report)
+            return job.future.result(timeout=job.remaining())
+        except FutureTimeoutError:
+            job.future.cancel()
+            print(f"[분석] {job.kind} 리포트 시간 초과 ({job.timeout:.0f}초)")
+            return self._failed_report(f"{job.timeout:.0f}초 제한 시간 초과")
         except Exception as e:
-            return "리포트", [], "", f"분석 실패: {e}"
+            print(f"[분석] {job.kind} 리포트 생성 실패: {e}")
+            return self._failed_report(e)
+
+    def generate_reports(self, requests: Dict[str, Tuple[str, list]],
+                         submitted: Optional[Dict[str, ReportJob]] = None) -> Dict[str, tuple]:
+        """여러 리포트를 동시에 생성. {kind: (title, keywords, insight, report)} 반환
+
+        Args:
+            requests: {kind: (collected_data, previous_titles)}
+            submitted: 이미 submit_report로 제출한 작업 (다시 제출하지 않고 결과만 수집)
+        """
+        jobs = dict(submitted or {})
+        for kind, (collected_data, previous_titles) in requests.items():
+            if kind not in jobs:
+                jobs[kind] = self.submit_report(kind, collected_data, previous_titles)
+        return {kind: self.result(job) for kind, job in jobs.items()}
+
+    def close(self):
+        """워커 정리 (시간 초과로 남은 작업은 기다리지 않음)"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
     def _extract_title(self, text: str) -> tuple:
         """응답에서 제목, 키워드, 인사이트, 본문 분리. (title, keywords, insight, report) 튜플 반환"""
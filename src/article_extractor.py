@@ -1,10 +1,13 @@
 """기사 본문에서 핵심 문장을 추출하는 유틸리티"""
 
 import re
-import requests
+import contextvars
 from html.parser import HTMLParser
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import profiler
+from http_client import get_transport
+
 
 class _TextExtractor(HTMLParser):
     """HTML에서 <p> 태그 텍스트만 추출"""
@@ -57,7 +60,8 @@ def extract_key_sentences(url: str, max_sentences: int = 5, timeout: int = 5) ->
     2. 숫자/데이터가 있는 문장 우선 추가
     """
     try:
-        resp = requests.get(url, timeout=timeout, headers={
+        # 본문 추출은 부가 정보이므로 재시도 없이 공용 커넥션 풀 사용
+        resp = get_transport().get(url, timeout=timeout, retries=0, headers={
             'User-Agent': 'TrendReporter/1.0 (article summary extraction)'
         })
         resp.raise_for_status()
@@ -95,9 +99,11 @@ def extract_batch(urls: list, max_sentences: int = 5, timeout: int = 5, max_work
     """여러 URL을 병렬로 추출. {url: extracted_text} 반환."""
     results = {}
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with profiler.span("extract_batch", urls=len(urls)) as span, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # 요청 통계가 extract_batch 구간에 쌓이도록 컨텍스트를 복사해 제출
         futures = {
-            executor.submit(extract_key_sentences, url, max_sentences, timeout): url
+            executor.submit(contextvars.copy_context().run, extract_key_sentences, url, max_sentences, timeout): url
             for url in urls if url
         }
         for future in as_completed(futures):
@@ -106,5 +112,6 @@ def extract_batch(urls: list, max_sentences: int = 5, timeout: int = 5, max_work
                 results[url] = future.result()
             except Exception:
                 results[url] = ""
+        span.add(items=sum(1 for text in results.values() if text))
 
     return results
@@ -1,61 +1,756 @@
-"""수집된 컨텐츠 캐시 관리"""
+"""수집된 컨텐츠 캐시 관리
 
+컨텐츠 ID별로 처음 본 시각(first_seen)을 기록하고, ttl_days가 지난 ID는 만료시킨다.
+- is_seen / mark_seen은 O(1)
+- 수집기별 네임스페이스마다 TTL / 최대 항목 수를 따로 적용
+- 실행마다 새로 본 ID만 저널에 추가하고, 저널이 커지면 스냅샷으로 합침 (ContentCache 참고)
+
+저장 방식은 두 가지:
+- 기본 (cache/seen_content.json): {"version": 3, "namespaces": {ns: {id: first_seen(epoch 초)}}}
+  dict는 삽입 순서를 유지하므로 만료 정리는 앞에서부터 만료된 개수만큼만 본다.
+  이전 형식({"seen": {...}} / {"ids": [...], "last_cleanup": ...})은 로드 시 ID 접두사로 네임스페이스를 나눈다.
+- compact (cache/seen_content.bin): ID 문자열 대신 64비트 blake2b 해시를 array 기반
+  open addressing 테이블에 보관한다. 항목당 12바이트(해시 8 + 시각 4)라 수십만 건에서도
+  메모리와 로드 시간이 거의 늘지 않는다. 해시 충돌 시 새 항목을 본 것으로 잘못 판단할 수 있으나
+  n개 보관 시 확률은 약 n / 2^64 (benchmarks/seen_cache.py로 측정).
+
+수집 작업은 ClaimScope 안에서 실행된다 (claim_scope). 작업을 포기하면(제한 시간 초과 등) scope를
+cancelled로 표시하고, 그 뒤 멈추지 않은 워커가 호출한 claim은 아무것도 표시하지 않고 False를 반환한다.
+트랜잭션 중 표시한 ID는 scope 이름별로 모아 두므로 작업 단위로 commit / rollback할 수 있다.
+"""
+
+import hashlib
+import heapq
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Set
+import struct
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 
+class _DictTable:
+    """ID 문자열 -> first_seen (삽입 순서 = first_seen 오름차순)"""
+
+    def __init__(self, entries: Optional[Dict[str, int]] = None):
+        self.entries: Dict[str, int] = {}
+        # 파일 순서가 깨져 있어도 만료 정리가 앞에서부터 동작하도록 정렬
+        for key, first_seen in sorted((entries or {}).items(), key=lambda kv: kv[1]):
+            self.entries[key] = int(first_seen)
+
+    def get(self, key: str) -> Optional[int]:
+        return self.entries.get(key)
+
+    def put(self, key: str, first_seen: int):
+        # 만료된 ID는 지우고 다시 넣어 순서를 유지
+        self.entries.pop(key, None)
+        self.entries[key] = first_seen
+
+    def delete(self, key: str):
+        self.entries.pop(key, None)
+
+    def restore(self, entries: Iterable[Tuple[str, int]]):
+        """롤백한 항목의 이전 first_seen 복원 (put과 달리 first_seen 순서 자리로 되돌림)
+
+        기존 항목은 이미 first_seen 순이므로 복원할 k개만 정렬해 병합한다 (O(n + k log k)).
+        테이블 전체를 다시 만드므로 롤백할 항목은 모아서 한 번에 넘길 것.
+        """
+        restored = sorted(entries, key=lambda kv: kv[1])
+        if not restored:
+            return
+        for key, _ in restored:
+            self.entries.pop(key, None)  # 트랜잭션 중 put으로 뒤에 붙은 항목
+        self.entries = dict(heapq.merge(self.entries.items(), restored, key=lambda kv: kv[1]))
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        return iter(self.entries.items())
+
+    def evict(self, cutoff: float, max_entries: int) -> int:
+        """cutoff 이전 항목과 max_entries를 넘는 오래된 항목 정리. 정리한 개수 반환"""
+        expired = []
+        for key, first_seen in self.entries.items():
+            if first_seen >= cutoff and len(self.entries) - len(expired) <= max_entries:
+                break
+            expired.append(key)
+        for key in expired:
+            del self.entries[key]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class HashedSeenTable:
+    """64비트 해시 -> first_seen open addressing 테이블 (선형 탐사)
+
+    keys는 array('Q'), times는 array('I')로 보관하며 키 0은 빈 슬롯을 뜻한다.
+    파일 형식: 헤더(MAGIC, 용량, 항목 수, 가장 오래된 시각) + keys 바이트 + times 바이트
+    """
+
+    MAGIC = b"TRSEEN1\0"
+    HEADER = struct.Struct("<8sQQQ")
+    MAX_LOAD = 0.5
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(16, 1 << (max(capacity, 1) - 1).bit_length())
+        self.keys = array('Q', bytes(8 * capacity))
+        self.times = array('I', bytes(4 * capacity))
+        self.mask = capacity - 1
+        self.count = 0
+        self.oldest = 0  # 가장 오래된 first_seen (만료 항목이 없으면 테이블을 훑지 않기 위함)
+
+    @staticmethod
+    def hash_id(content_id: str) -> int:
+        """ID 문자열의 64비트 해시 (0은 빈 슬롯 표시용이라 1로 대체)"""
+        digest = hashlib.blake2b(content_id.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little') or 1
+
+    def _slot(self, key: int) -> int:
+        """키가 있는 슬롯 또는 들어갈 빈 슬롯"""
+        keys, mask = self.keys, self.mask
+        i = key & mask
+        while True:
+            k = keys[i]
+            if k == key or k == 0:
+                return i
+            i = (i + 1) & mask
+
+    def get(self, key: int) -> Optional[int]:
+        i = self._slot(key)
+        return self.times[i] if self.keys[i] else None
+
+    def put(self, key: int, first_seen: int):
+        i = self._slot(key)
+        if not self.keys[i]:
+            if (self.count + 1) > len(self.keys) * self.MAX_LOAD:
+                self._resize(len(self.keys) * 2)
+                i = self._slot(key)
+            self.keys[i] = key
+            self.count += 1
+        self.times[i] = first_seen
+        if not self.oldest or first_seen < self.oldest:
+            self.oldest = first_seen
+
+    def delete(self, key: int):
+        """키 삭제 (뒤따르는 항목을 당겨 탐사 경로 유지)"""
+        keys, times, mask = self.keys, self.times, self.mask
+        i = self._slot(key)
+        if not keys[i]:
+            return
+        j = i
+        while True:
+            j = (j + 1) & mask
+            k = keys[j]
+            if k == 0:
+                break
+            home = k & mask
+            # home이 (i, j] 구간 밖이면 빈 자리 i로 당길 수 있음
+            between = i < home <= j if i <= j else (home > i or home <= j)
+            if not between:
+                keys[i] = k
+                times[i] = times[j]
+                i = j
+        keys[i] = 0
+        times[i] = 0
+        self.count -= 1
+
+    def restore(self, entries: Iterable[Tuple[int, int]]):
+        """롤백한 항목의 이전 first_seen 복원 (슬롯 순서는 만료 정리와 무관)"""
+        for key, first_seen in entries:
+            self.put(key, first_seen)
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        for key, first_seen in zip(self.keys, self.times):
+            if key:
+                yield key, first_seen
+
+    def _resize(self, capacity: int):
+        """새 용량으로 다시 배치"""
+        self._rebuild(capacity, list(self.items()))
+
+    def _rebuild(self, capacity: int, items):
+        self.__init__(capacity)
+        for key, first_seen in items:
+            self.put(key, first_seen)
+
+    def evict(self, cutoff: float, max_entries: int) -> int:
+        """cutoff 이전 항목과 max_entries를 넘는 오래된 항목 정리 (테이블 재구성). 정리한 개수 반환"""
+        if self.count <= max_entries and (not self.count or self.oldest >= cutoff):
+            return 0
+
+        survivors = [(key, first_seen) for key, first_seen in self.items() if first_seen >= cutoff]
+        if len(survivors) > max_entries:
+            survivors.sort(key=lambda item: item[1])
+            survivors = survivors[len(survivors) - max_entries:]
+        before = self.count
+        self._rebuild(int(len(survivors) / self.MAX_LOAD) + 1, survivors)
+        return before - self.count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def to_bytes(self) -> bytes:
+        header = self.HEADER.pack(self.MAGIC, len(self.keys), self.count, self.oldest)
+        return header + self.keys.tobytes() + self.times.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HashedSeenTable":
+        magic, capacity, count, oldest = cls.HEADER.unpack_from(data)
+        expected = cls.HEADER.size + capacity * 12
+        if magic != cls.MAGIC or len(data) != expected or capacity & (capacity - 1):
+            raise ValueError("잘못된 compact 캐시 파일")
+
+        table = cls.__new__(cls)
+        offset = cls.HEADER.size
+        table.keys = array('Q')
+        table.keys.frombytes(data[offset:offset + capacity * 8])
+        table.times = array('I')
+        table.times.frombytes(data[offset + capacity * 8:])
+        table.mask = capacity - 1
+        table.count = count
+        table.oldest = oldest
+        return table
+
+
+# ID 접두사 -> 네임스페이스 (config/sources.yaml 섹션 이름). 긴 접두사를 먼저 검사
+NAMESPACE_PREFIXES = (
+    ("claude_code_", "claude_code"),
+    ("gh_api_", "github_api"),
+    ("geeknews_", "geeknews_new"),
+    ("treasury_", "treasury"),
+    ("lobsters_", "lobsters"),
+    ("devto_", "devto"),
+    ("arxiv_", "arxiv"),
+    ("gdelt_", "gdelt"),
+    ("fred_", "fred"),
+    ("sec_", "sec"),
+    ("osv_", "osv"),
+    ("rss_", "rss"),
+    ("hn_", "hackernews"),
+    ("hf_", "huggingface"),
+    ("gh_", "github_trending"),
+)
+DEFAULT_NAMESPACE = "default"
+
+
+def namespace_of(content_id: str) -> str:
+    """ID 접두사로 네임스페이스 판단 (알 수 없으면 default)"""
+    for prefix, namespace in NAMESPACE_PREFIXES:
+        if content_id.startswith(prefix):
+            return namespace
+    return DEFAULT_NAMESPACE
+
+
+class ClaimScope:
+    """claim을 호출하는 작업 하나 (수집기 실행 단위)
+
+    CollectionEngine이 작업마다 만들어 실행 컨텍스트에 설정한다. cancelled가 되면
+    이 작업 안의 claim / mark_seen은 캐시에 아무 흔적도 남기지 않는다.
+    """
+
+    __slots__ = ("name", "cancelled")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cancelled = False
+
+    def __repr__(self) -> str:
+        return f"ClaimScope({self.name!r}{', cancelled' if self.cancelled else ''})"
+
+
+_current_scope: ContextVar[Optional[ClaimScope]] = ContextVar("claim_scope", default=None)
+
+
+@contextmanager
+def claim_scope(scope: ClaimScope):
+    """with 블록 안(과 여기서 복사한 컨텍스트)의 claim을 scope에 속하게 함"""
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def _scope_cancelled() -> bool:
+    scope = _current_scope.get()
+    return scope is not None and scope.cancelled
+
+
+class _Partition:
+    """네임스페이스 하나의 테이블, 보관 정책, 정리 통계"""
+
+    def __init__(self, table, ttl_days: float, max_entries: int):
+        self.table = table
+        self.ttl = ttl_days * 86400
+        self.max_entries = max_entries
+        self.added = 0
+        self.hits = 0
+        self.evicted_ttl = 0
+        self.evicted_capacity = 0
+
+    def evict(self, now: float) -> int:
+        """TTL 만료 항목과 용량을 넘는 오래된 항목 정리. 정리한 개수 반환"""
+        expired = self.table.evict(now - self.ttl, len(self.table))
+        overflow = self.table.evict(0, self.max_entries)
+        self.evicted_ttl += expired
+        self.evicted_capacity += overflow
+        return expired + overflow
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.table),
+            "ttl_days": self.ttl / 86400,
+            "max_entries": self.max_entries,
+            "added": self.added,
+            "hits": self.hits,
+            "evicted_ttl": self.evicted_ttl,
+            "evicted_capacity": self.evicted_capacity,
+        }
+
+
 class ContentCache:
-    """이미 수집한 컨텐츠를 추적하여 중복 수집 방지"""
+    """이미 수집한 컨텐츠를 추적하여 중복 수집 방지
+
+    모든 공개 메서드는 RLock으로 보호되어 여러 수집기 스레드가 함께 사용할 수 있다.
+    claim / claim_many는 확인과 표시를 한 번에 하므로 같은 항목을 두 수집기가 함께 보고하지 않는다.
+
+    begin() 이후 표시한 ID는 commit() 전까지 저장되지 않으며, rollback()하면 메모리에서도 지워진다.
+    ID는 표시한 ClaimScope 이름별로 모이므로 commit(scopes) / rollback(scopes)로 작업별로 정할 수 있고,
+    scopes 없이 호출하면 남은 ID를 모두 처리하고 트랜잭션을 끝낸다.
+    결과가 버려졌거나 리포트 발행이 실패한 작업의 항목은 다음 실행에서 다시 수집된다.
+
+    ID는 수집기별 네임스페이스(hn_ -> hackernews, sec_ -> sec 등)로 나뉘어 저장되며,
+    네임스페이스마다 TTL과 최대 항목 수를 따로 지정할 수 있다 (namespaces 인자).
+    변화가 많은 소스(RSS, GDELT)가 용량을 채워도 느린 소스(SEC, Claude Code)의 ID는 밀려나지 않는다.
+
+    실행마다 새로 본 ID만 저널(<캐시 파일>.journal)에 한 줄씩 추가하고,
+    저널이 스냅샷 크기에 비해 커지면 스냅샷을 새로 써서(임시 파일 + os.replace) 저널을 비운다.
+    로드 시에는 스냅샷 위에 저널을 다시 적용하며, 중단된 실행이 남긴 잘린 줄은 건너뛴다.
+    """
+
+    VERSION = 3
+    BIN_MAGIC = b"TRSEEN2\0"
+    COMPACT_MIN = 1000       # 저널 항목이 이 개수 이상이고
+    COMPACT_RATIO = 0.5      # 스냅샷 항목 수의 이 비율 이상이면 스냅샷으로 합침
 
-    def __init__(self, cache_dir: str = None):
+    def __init__(self, cache_dir: str = None, ttl_days: float = 7, max_entries: int = 10000,
+                 compact: bool = False, namespaces: Optional[Dict[str, dict]] = None):
         if cache_dir is None:
             cache_dir = os.path.join(os.path.dirname(__file__), "..", "cache")
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
-        self.cache_file = self.cache_dir / "seen_content.json"
+        self.compact = compact
+        self.cache_file = self.cache_dir / ("seen_content.bin" if compact else "seen_content.json")
+        self.journal_file = self._journal_path(self.cache_file)
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self.policies = namespaces or {}
+        self._pending: List[Tuple[int, object, str]] = []   # 저널에 아직 쓰지 않은 (first_seen, key, namespace)
+        self._journal_entries = 0
+        self._needs_compaction = False
+        # 트랜잭션 중 표시한 ID. scope 이름(scope 밖이면 None) -> [(first_seen, key, namespace, 이전 first_seen)]
+        self._staged: Optional[Dict[Optional[str], List[tuple]]] = None
+        self._lock = threading.RLock()
         self._load_cache()
 
+    @staticmethod
+    def _journal_path(snapshot: Path) -> Path:
+        return snapshot.with_suffix(snapshot.suffix + ".journal")
+
+    def _key(self, content_id: str):
+        """테이블 키 (compact 모드는 64비트 해시)"""
+        return HashedSeenTable.hash_id(content_id) if self.compact else content_id
+
+    def _new_table(self):
+        return HashedSeenTable() if self.compact else _DictTable()
+
+    def partition(self, namespace: str) -> _Partition:
+        """네임스페이스 파티션 (없으면 설정된 정책으로 생성)"""
+        part = self.partitions.get(namespace)
+        if part is None:
+            policy = self.policies.get(namespace) or {}
+            part = self.partitions[namespace] = _Partition(
+                self._new_table(),
+                ttl_days=policy.get("ttl_days", self.ttl_days),
+                max_entries=policy.get("max_entries", self.max_entries),
+            )
+        return part
+
     def _load_cache(self):
-        """캐시 파일 로드"""
-        if self.cache_file.exists():
-            with open(self.cache_file, 'r') as f:
-                data = json.load(f)
-                self.seen_ids = set(data.get("ids", []))
-                self.last_cleanup = datetime.fromisoformat(
-                    data.get("last_cleanup", datetime.now().isoformat())
-                )
+        """스냅샷 로드 후 저널 적용 (이전 형식은 변환, 손상된 스냅샷은 빈 캐시로 시작)"""
+        self.partitions: Dict[str, _Partition] = {}
+        try:
+            if self.compact:
+                self._load_compact()
+            else:
+                self._load_json()
+        except (OSError, ValueError, struct.error) as e:
+            print(f"[캐시] 캐시 파일 로드 실패, 새로 시작합니다: {e}")
+            self.partitions = {}
+            self._needs_compaction = True
+
+        self._journal_entries = self._replay_journal(self.journal_file)
+        self.cleanup_old()
+
+    def _replay_journal(self, journal_file: Path) -> int:
+        """저널의 [first_seen, key, namespace] 줄을 적용. 적용한 줄 수 반환"""
+        if not journal_file.exists():
+            return 0
+
+        applied = skipped = 0
+        with open(journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    first_seen, key = entry[0], entry[1]
+                    # 네임스페이스 도입 전 줄은 [first_seen, key]
+                    namespace = entry[2] if len(entry) > 2 else namespace_of(str(key))
+                    self.partition(namespace).table.put(key, int(first_seen))
+                    applied += 1
+                except (ValueError, TypeError, IndexError, OverflowError):
+                    # 중단된 실행이 남긴 잘린 줄 등
+                    skipped += 1
+        if skipped:
+            print(f"[캐시] 저널의 손상된 줄 {skipped}개를 건너뜁니다")
+            self._needs_compaction = True
+        return applied
+
+    def _load_ids(self, seen: Dict[str, int]):
+        """네임스페이스 구분 없는 {id: first_seen}을 ID 접두사 기준으로 분배"""
+        for content_id, first_seen in sorted(seen.items(), key=lambda kv: kv[1]):
+            self.partition(namespace_of(content_id)).table.put(self._key(content_id), int(first_seen))
+
+    def _load_json(self):
+        json_file = self.cache_dir / "seen_content.json"
+        if not json_file.exists():
+            return
+        with open(json_file, 'r') as f:
+            data = json.load(f)
+
+        if "namespaces" in data:
+            if self.compact:
+                for seen in data["namespaces"].values():
+                    self._load_ids(seen)
+            else:
+                for namespace, seen in data["namespaces"].items():
+                    self.partition(namespace).table = _DictTable(seen)
+        elif "seen" in data:
+            self._load_ids(data["seen"])
+            self._needs_compaction = True
         else:
-            self.seen_ids: Set[str] = set()
-            self.last_cleanup = datetime.now()
+            self._load_ids(self._migrate(data))
+            self._needs_compaction = True
+
+    def _load_compact(self):
+        if not self.cache_file.exists():
+            # compact 모드 첫 실행: 기존 JSON 캐시(와 저널)의 ID를 해시로 변환
+            self._load_json()
+            self._replay_json_journal()
+            if self.partitions:
+                total = sum(len(p.table) for p in self.partitions.values())
+                print(f"[캐시] JSON 캐시 {total}개를 compact 형식으로 변환합니다")
+                self._needs_compaction = True
+            return
+
+        data = self.cache_file.read_bytes()
+        magic, count = struct.unpack_from("<8sH", data)
+        if magic != self.BIN_MAGIC:
+            raise ValueError("지원하지 않는 compact 캐시 형식")
+        offset = struct.calcsize("<8sH")
+        for _ in range(count):
+            name_len, = struct.unpack_from("<H", data, offset)
+            offset += 2
+            namespace = data[offset:offset + name_len].decode('utf-8')
+            offset += name_len
+            size, = struct.unpack_from("<Q", data, offset)
+            offset += 8
+            self.partition(namespace).table = HashedSeenTable.from_bytes(data[offset:offset + size])
+            offset += size
+
+    def _replay_json_journal(self):
+        """JSON 모드 저널의 ID를 해시로 변환해 적용"""
+        journal_file = self._journal_path(self.cache_dir / "seen_content.json")
+        if not journal_file.exists():
+            return
+        with open(journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    content_id = str(entry[1])
+                    self.partition(namespace_of(content_id)).table.put(self._key(content_id), int(entry[0]))
+                except (ValueError, TypeError, IndexError, OverflowError):
+                    continue
+
+    @staticmethod
+    def _migrate(data: dict) -> Dict[str, int]:
+        """이전 형식(ID 목록) 변환. 처음 본 시각을 알 수 없으므로 마지막 정리 시각으로 기록"""
+        try:
+            first_seen = int(datetime.fromisoformat(data["last_cleanup"]).timestamp())
+        except (KeyError, TypeError, ValueError):
+            first_seen = int(time.time())
+        ids = data.get("ids", [])
+        print(f"[캐시] 이전 형식 캐시 {len(ids)}개를 변환합니다")
+        return {str(content_id): first_seen for content_id in ids}
+
+    def _append_journal(self):
+        """새로 본 ID를 저널 끝에 추가 (O(신규 항목 수))"""
+        lines = "".join(
+            json.dumps([first_seen, key, namespace], ensure_ascii=False) + "\n"
+            for first_seen, key, namespace in self._pending
+        )
+        with open(self.journal_file, 'a+', encoding='utf-8') as f:
+            # 이전 실행이 줄 중간에서 중단됐으면 새 줄부터 기록 (잘린 줄만 버려지도록)
+            if f.tell() > 0:
+                f.seek(f.tell() - 1)
+                if f.read(1) != "\n":
+                    lines = "\n" + lines
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_entries += len(self._pending)
+        self._pending = []
+
+    def _snapshot_bytes(self) -> bytes:
+        """compact 스냅샷: 헤더(MAGIC, 네임스페이스 수) + 네임스페이스별 (이름, 테이블)"""
+        parts = [struct.pack("<8sH", self.BIN_MAGIC, len(self.partitions))]
+        for namespace, part in sorted(self.partitions.items()):
+            name = namespace.encode('utf-8')
+            table = part.table.to_bytes()
+            parts.append(struct.pack("<H", len(name)) + name + struct.pack("<Q", len(table)))
+            parts.append(table)
+        return b"".join(parts)
 
     def _save_cache(self):
-        """캐시 파일 저장"""
-        with open(self.cache_file, 'w') as f:
-            json.dump({
-                "ids": list(self.seen_ids),
-                "last_cleanup": self.last_cleanup.isoformat()
-            }, f)
-
-    def is_seen(self, content_id: str) -> bool:
-        """이미 본 컨텐츠인지 확인"""
-        return content_id in self.seen_ids
-
-    def mark_seen(self, content_id: str):
-        """컨텐츠를 본 것으로 표시"""
-        self.seen_ids.add(content_id)
-
-    def cleanup_old(self, days: int = 3):
-        """오래된 캐시 정리 (3일 이상)"""
-        if datetime.now() - self.last_cleanup > timedelta(days=1):
-            # 캐시 크기가 10000개 이상이면 절반으로 줄임
-            if len(self.seen_ids) > 10000:
-                self.seen_ids = set(list(self.seen_ids)[-5000:])
-            self.last_cleanup = datetime.now()
+        """스냅샷 저장 (임시 파일에 쓴 뒤 교체) 후 저널 비우기
+
+        교체 후 저널을 지우기 전에 중단되어도 저널 재적용은 같은 결과라 안전하다.
+        """
+        tmp = self.cache_file.with_suffix(self.cache_file.suffix + ".tmp")
+        if self.compact:
+            with open(tmp, 'wb') as f:
+                f.write(self._snapshot_bytes())
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(tmp, 'w') as f:
+                json.dump({
+                    "version": self.VERSION,
+                    "namespaces": {ns: part.table.entries for ns, part in sorted(self.partitions.items())},
+                }, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, self.cache_file)
+        self.journal_file.unlink(missing_ok=True)
+        self._pending = []
+        self._journal_entries = 0
+        self._needs_compaction = False
+
+    def _lookup(self, content_id: str, namespace: Optional[str]) -> Tuple[_Partition, object, str, bool]:
+        """(파티션, 키, 네임스페이스, TTL 안에 본 적 있는지). 락 안에서 호출"""
+        namespace = namespace or namespace_of(content_id)
+        part = self.partition(namespace)
+        key = self._key(content_id)
+        first_seen = part.table.get(key)
+        seen = first_seen is not None and time.time() - first_seen < part.ttl
+        return part, key, namespace, seen
+
+    def _mark(self, part: _Partition, key, namespace: str):
+        """락 안에서 호출 (트랜잭션 중이면 commit 전까지 저널에 기록하지 않음)"""
+        now = int(time.time())
+        if self._staged is not None:
+            scope = _current_scope.get()
+            self._staged.setdefault(scope.name if scope else None, []).append(
+                (now, key, namespace, part.table.get(key)))
+        else:
+            self._pending.append((now, key, namespace))
+        part.table.put(key, now)
+        part.added += 1
+
+    # ── 트랜잭션 ──
+
+    def begin(self):
+        """트랜잭션 시작. 이후 표시한 ID는 실행 중 중복 확인에는 쓰이지만 commit 전까지 저장되지 않음"""
+        with self._lock:
+            if self._staged is not None:
+                raise RuntimeError("이미 진행 중인 캐시 트랜잭션이 있습니다")
+            self._staged = {}
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._staged is not None
+
+    def _take_staged(self, scopes: Optional[Iterable[Optional[str]]]) -> List[tuple]:
+        """처리할 staged 항목을 꺼냄. scopes가 None이면 전부 꺼내고 트랜잭션 종료. 락 안에서 호출"""
+        if self._staged is None:
+            return []
+        if scopes is None:
+            groups, self._staged = list(self._staged.values()), None
+        else:
+            groups = [self._staged.pop(scope, []) for scope in scopes]
+        return [entry for group in groups for entry in group]
+
+    def commit(self, scopes: Optional[Iterable[Optional[str]]] = None) -> int:
+        """트랜잭션 중 표시한 ID 확정 (다음 save()에서 저장). 확정한 개수 반환
+
+        scopes를 주면 해당 scope 이름으로 표시한 ID만 확정하고 트랜잭션은 유지한다.
+        """
+        with self._lock:
+            staged = self._take_staged(scopes)
+            self._pending.extend((now, key, namespace) for now, key, namespace, _ in staged)
+        return len(staged)
+
+    def rollback(self, scopes: Optional[Iterable[Optional[str]]] = None) -> int:
+        """트랜잭션 중 표시한 ID 취소 (다음 실행에서 다시 수집됨). 취소한 개수 반환
+
+        scopes를 주면 해당 scope 이름으로 표시한 ID만 취소하고 트랜잭션은 유지한다.
+        """
+        with self._lock:
+            staged = self._take_staged(scopes)
+            restored: Dict[str, list] = {}
+            for _, key, namespace, previous in staged:
+                part = self.partitions[namespace]
+                if previous is None:
+                    part.table.delete(key)
+                else:
+                    restored.setdefault(namespace, []).append((key, previous))
+                part.added -= 1
+            for namespace, entries in restored.items():
+                self.partitions[namespace].table.restore(entries)
+        return len(staged)
+
+    def is_seen(self, content_id: str, namespace: Optional[str] = None) -> bool:
+        """이미 본 컨텐츠인지 확인 (TTL이 지난 ID는 보지 않은 것으로 처리)"""
+        with self._lock:
+            part, _, _, seen = self._lookup(content_id, namespace)
+            if seen:
+                part.hits += 1
+            return seen
+
+    def mark_seen(self, content_id: str, namespace: Optional[str] = None):
+        """컨텐츠를 본 것으로 표시 (처음 본 시각은 유지)"""
+        with self._lock:
+            if _scope_cancelled():
+                return
+            part, key, namespace, seen = self._lookup(content_id, namespace)
+            if not seen:
+                self._mark(part, key, namespace)
+
+    def claim(self, content_id: str, namespace: Optional[str] = None) -> bool:
+        """확인과 표시를 한 번에 수행. 처음 본 ID면 True (동시에 호출해도 한 곳만 True)
+
+        취소된 작업(ClaimScope.cancelled) 안에서는 표시하지 않고 False를 반환한다.
+        """
+        with self._lock:
+            if _scope_cancelled():
+                return False
+            part, key, namespace, seen = self._lookup(content_id, namespace)
+            if seen:
+                part.hits += 1
+                return False
+            self._mark(part, key, namespace)
+            return True
+
+    def filter_unseen(self, content_ids: Iterable[str], namespace: Optional[str] = None) -> List[str]:
+        """본 적 없는 ID만 순서대로 반환 (표시하지 않음, 목록 안 중복은 하나만)"""
+        unseen = []
+        batch = set()
+        with self._lock:
+            for content_id in content_ids:
+                if content_id in batch:
+                    continue
+                batch.add(content_id)
+                part, _, _, seen = self._lookup(content_id, namespace)
+                if seen:
+                    part.hits += 1
+                else:
+                    unseen.append(content_id)
+        return unseen
+
+    def mark_seen_many(self, content_ids: Iterable[str], namespace: Optional[str] = None):
+        """여러 ID를 한 번에 표시"""
+        with self._lock:
+            if _scope_cancelled():
+                return
+            for content_id in content_ids:
+                part, key, ns, seen = self._lookup(content_id, namespace)
+                if not seen:
+                    self._mark(part, key, ns)
+
+    def claim_many(self, content_ids: Iterable[str], namespace: Optional[str] = None) -> List[str]:
+        """여러 ID를 한 번에 claim. 이번 호출에서 처음 차지한 ID만 순서대로 반환"""
+        claimed = []
+        with self._lock:
+            if _scope_cancelled():
+                return claimed
+            for content_id in content_ids:
+                part, key, ns, seen = self._lookup(content_id, namespace)
+                if seen:
+                    part.hits += 1
+                    continue
+                self._mark(part, key, ns)
+                claimed.append(content_id)
+        return claimed
+
+    def first_seen(self, content_id: str, namespace: Optional[str] = None) -> Optional[datetime]:
+        """처음 본 시각 (기록이 없으면 None)"""
+        with self._lock:
+            part = self.partition(namespace or namespace_of(content_id))
+            first_seen = part.table.get(self._key(content_id))
+        return datetime.fromtimestamp(first_seen) if first_seen is not None else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(part.table) for part in self.partitions.values())
+
+    def __bool__(self) -> bool:
+        # __len__ 때문에 빈 캐시가 거짓이 되지 않도록 (수집기는 `if self.cache and ...`로 캐시 유무를 확인)
+        return True
+
+    def stats(self) -> Dict[str, dict]:
+        """{네임스페이스: {entries, ttl_days, max_entries, added, hits, evicted_ttl, evicted_capacity}}"""
+        with self._lock:
+            return {namespace: part.stats() for namespace, part in sorted(self.partitions.items())}
+
+    def cleanup_old(self):
+        """만료된 캐시 정리 (파일에는 다음 스냅샷 저장 때 반영, 만료된 ID는 is_seen에서 무시됨)"""
+        now = time.time()
+        with self._lock:
+            for part in self.partitions.values():
+                part.evict(now)
+
+    def _should_compact(self) -> bool:
+        # 트랜잭션 중에는 테이블에 확정되지 않은 ID가 있으므로 스냅샷을 쓰지 않음
+        if self._staged is not None:
+            return False
+        journal_entries = self._journal_entries + len(self._pending)
+        return self._needs_compaction or (
+            journal_entries >= self.COMPACT_MIN
+            and journal_entries >= len(self) * self.COMPACT_RATIO
+        )
+
+    def print_summary(self):
+        """이번 실행에서 변화가 있는 네임스페이스 출력"""
+        for namespace, s in self.stats().items():
+            if s["added"] or s["evicted_ttl"] or s["evicted_capacity"]:
+                print(f"  - {namespace}: 신규 {s['added']}개, 중복 {s['hits']}개, "
+                      f"만료 {s['evicted_ttl']}개, 용량 초과 {s['evicted_capacity']}개 (총 {s['entries']:,}개)")
 
     def save(self):
-        """캐시 저장 및 정리"""
-        self.cleanup_old()
-        self._save_cache()
+        """새 항목은 저널에 추가하고, 저널이 커지면 스냅샷으로 합침 (변경이 없으면 쓰지 않음)"""
+        with self._lock:
+            self.cleanup_old()
+            added = sum(part.added for part in self.partitions.values())
+            if self._should_compact():
+                self._save_cache()
+                print(f"[캐시] 스냅샷 저장: 신규 {added}개, 총 {len(self):,}개")
+            elif self._pending:
+                self._append_journal()
+                print(f"[캐시] 신규 {added}개 저널 기록 (저널 {self._journal_entries}개, 총 {len(self):,}개)")
+            else:
+                return
+            self.print_summary()
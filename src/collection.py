@@ -0,0 +1,571 @@
+"""수집기 병렬 실행 엔진
+
+수집기를 제한된 워커 풀에서 동시에 실행하여 전체 수집 시간이
+모든 소스의 합이 아닌 가장 느린 소스에 가까워지도록 한다.
+- 수집기별 제한 시간 (collect_all + format_for_analysis 포함)
+- 전체 수집 데드라인 (초과 시 미시작 작업 취소, 실행 중 작업 결과 폐기)
+- 결과는 완료 순서와 무관하게 step 순서로 병합
+- 버킷(market/dev)에 속한 수집기가 모두 끝나면 on_bucket_done 콜백 호출
+  (다른 버킷 수집이 진행 중이어도 해당 버킷 분석을 바로 시작할 수 있음)
+- on_collected(task, raw_data)를 주면 수집기가 끝나는 즉시 워커 스레드에서 호출하고
+  (예: 저장 큐로 전달) 결과의 raw_data를 버려 원본 객체를 일찍 해제
+- 우선순위(1이 가장 높음) 순서로 시작하고, 남은 시간이 low_water * (priority - 1)초보다
+  적어지면 해당 우선순위 수집기는 시작하지 않거나(skipped) 실행 중이면 중단(cancelled)
+  (우선순위 1은 전체 데드라인까지 실행)
+- 결과를 버린 작업(timeout, cancelled)은 ClaimScope를 cancelled로 표시한다. 스레드는 멈출 수 없으므로
+  계속 실행되더라도 캐시 claim, on_collected 등 아무 흔적도 남기지 않는다
+- 수집기는 데몬 스레드 풀(_DaemonExecutor)에서 실행하므로 버린 작업이 멈춰 있어도 프로세스 종료를
+  막지 않는다 (ThreadPoolExecutor 워커는 인터프리터 종료 시 join됨)
+- 결과 전달(on_collected) 시작과 작업 포기는 같은 락에서 정한다. 전달을 시작한 작업은 제한 시간이
+  지나도 버리지 않고 끝날 때까지 기다리므로, on_collected로 넘어간 결과는 항상 ok로 기록된다
+
+mode="async"이면 모든 수집기의 collect_all_async를 하나의 이벤트 루프에서
+공유 AsyncHTTPClient로 실행한다 (format_for_analysis와 동기 collect_all은 데몬 스레드 풀에서 실행,
+루프의 기본 실행기는 asyncio.run 종료 시 join되므로 쓰지 않음).
+동시에 실행하는 수집기 수는 max_workers 세마포어로 제한하며, 우선순위 순으로 자리를 얻는다.
+"""
+
+import asyncio
+import contextvars
+import functools
+import queue
+import threading
+import time
+from concurrent.futures import Executor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import profiler
+from cache import ClaimScope, claim_scope
+from http_client import AsyncHTTPClient, create_async_client
+
+
+def _count_items(data: Any) -> int:
+    """수집 결과의 항목 수 (list는 길이, dict는 값들의 합)"""
+    if data is None:
+        return 0
+    if isinstance(data, (list, tuple)):
+        return len(data)
+    if isinstance(data, dict):
+        return sum(_count_items(value) for value in data.values())
+    return 1
+
+
+class _DaemonExecutor(Executor):
+    """데몬 스레드로 실행하는 최소 스레드 풀
+
+    ThreadPoolExecutor는 shutdown(wait=False)여도 인터프리터 종료 시 워커를 join하므로
+    멈춘 수집기가 전체 데드라인 이후에도 프로세스를 붙잡는다. 이 풀의 워커는 join하지 않는다.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "collector"):
+        self._max_workers = max_workers
+        self._prefix = thread_name_prefix
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("종료된 실행기에는 작업을 제출할 수 없습니다")
+            future = Future()
+            self._queue.put((future, fn, args, kwargs))
+            # 쉬는 워커가 없을 때만 새 스레드 시작
+            if not self._idle.acquire(blocking=False) and len(self._threads) < self._max_workers:
+                thread = threading.Thread(target=self._work, daemon=True,
+                                          name=f"{self._prefix}_{len(self._threads)}")
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:  # shutdown
+                return
+            future, fn, args, kwargs = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+            del item, future
+            self._idle.release()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            # 쉬는 워커는 바로 종료, 실행 중인 워커는 작업이 끝나면 종료
+            for _ in self._threads:
+                self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+@dataclass
+class CollectionTask:
+    """수집 단계 정의"""
+    step: int
+    label: str
+    collector: Any
+    category: Optional[str]  # None이면 splits 기준으로 market/dev 분리
+    collect_kwargs: dict = field(default_factory=dict)
+    format_kwargs: dict = field(default_factory=dict)
+    timeout: Optional[float] = None  # None이면 엔진 기본값
+    splits: Optional[Dict[str, List[str]]] = None  # {bucket: format categories}
+    priority: int = 2  # 1: 핵심, 2: 보통, 3: 낮음
+
+    @property
+    def buckets(self) -> List[str]:
+        """결과 텍스트가 들어갈 버킷 목록"""
+        return list(self.splits) if self.splits else [self.category]
+
+
+@dataclass
+class CollectionResult:
+    """수집 단계 실행 결과"""
+    task: CollectionTask
+    status: str = "pending"  # ok, error, timeout, cancelled, skipped
+    raw_data: Any = None
+    texts: Dict[str, str] = field(default_factory=dict)  # bucket -> 분석용 텍스트
+    error: str = ""
+    elapsed: float = 0.0
+
+
+class CollectionEngine:
+    """수집기를 제한된 스레드 풀(또는 단일 이벤트 루프)에서 동시에 실행"""
+
+    def __init__(self, max_workers: int = 6, collector_timeout: float = 120.0,
+                 run_deadline: Optional[float] = None, poll_interval: float = 0.5,
+                 mode: str = "threads", low_water: float = 0.0):
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self.collector_timeout = collector_timeout
+        self.run_deadline = run_deadline
+        self.poll_interval = poll_interval
+        self.low_water = low_water
+        self._deadline: Optional[float] = None
+        self._started: Dict[int, float] = {}
+        self._results: Dict[int, CollectionResult] = {}
+        self._scopes: Dict[int, ClaimScope] = {}
+        self._finishing: set = set()  # on_collected를 시작해 더 이상 버리지 않는 step
+        self._executor: Optional[_DaemonExecutor] = None  # async 모드의 블로킹 작업용
+        self._waiting: Dict[str, set] = {}
+        self._on_bucket_done: Optional[Callable[[str, List[CollectionResult]], None]] = None
+        self._on_collected: Optional[Callable[[CollectionTask, Any], None]] = None
+        self._lock = threading.Lock()
+
+    def _reset(self, tasks: List[CollectionTask],
+               on_bucket_done: Optional[Callable[[str, List[CollectionResult]], None]],
+               on_collected: Optional[Callable[[CollectionTask, Any], None]] = None):
+        """실행 상태 초기화 (버킷별 대기 중인 step 집합 구성)"""
+        self._started = {}
+        self._results = {}
+        self._scopes = {task.step: ClaimScope(task.label) for task in tasks}
+        self._finishing = set()
+        self._waiting = {}
+        for task in tasks:
+            for bucket in task.buckets:
+                self._waiting.setdefault(bucket, set()).add(task.step)
+        self._on_bucket_done = on_bucket_done
+        self._on_collected = on_collected
+
+    def scope(self, task: CollectionTask) -> ClaimScope:
+        """작업의 ClaimScope (run 이후 결과별 캐시 확정/취소에 사용)"""
+        return self._scopes[task.step]
+
+    def _abandon(self, task: CollectionTask) -> bool:
+        """작업 결과를 버리기로 하고 취소 표시. 이미 결과 전달을 시작한 작업이면 False (끝날 때까지 기다림)"""
+        with self._lock:
+            if task.step in self._finishing:
+                return False
+            self._scopes[task.step].cancelled = True
+            return True
+
+    def _record(self, result: CollectionResult):
+        """결과 기록. 버킷의 마지막 수집기가 끝나면 콜백 호출
+
+        ok가 아닌 결과는 작업을 취소 표시해 아직 실행 중인 워커가 흔적을 남기지 않게 한다.
+        """
+        step = result.task.step
+        self._results[step] = result
+        if result.status != "ok":
+            self._scopes[step].cancelled = True
+
+        for bucket, waiting in self._waiting.items():
+            if step not in waiting:
+                continue
+            waiting.discard(step)
+            if waiting or self._on_bucket_done is None:
+                continue
+            bucket_results = sorted(
+                (r for r in self._results.values() if bucket in r.task.buckets),
+                key=lambda r: r.task.step,
+            )
+            try:
+                self._on_bucket_done(bucket, bucket_results)
+            except Exception as e:
+                print(f"[수집] {bucket} 완료 콜백 실패: {e}")
+
+    @staticmethod
+    def _schedule(tasks: List[CollectionTask]) -> List[CollectionTask]:
+        """시작 순서: 우선순위, step 순"""
+        return sorted(tasks, key=lambda t: (t.priority, t.step))
+
+    def _cutoff(self, task: CollectionTask) -> float:
+        """이 수집기를 중단할 남은 시간 기준(초). 0이면 데드라인까지 실행"""
+        return self.low_water * max(0, task.priority - 1)
+
+    def _over_budget(self, task: CollectionTask, now: float) -> bool:
+        """남은 수집 시간이 수집기의 우선순위 기준보다 적은지"""
+        if self._deadline is None:
+            return False
+        cutoff = self._cutoff(task)
+        return cutoff > 0 and self._deadline - now < cutoff
+
+    def _skipped(self, task: CollectionTask) -> CollectionResult:
+        """남은 시간 부족으로 시작하지 않은 수집기 결과"""
+        print(f"[{task.label}] 남은 수집 시간 부족 - 건너뜁니다 (우선순위 {task.priority})")
+        return CollectionResult(task=task, status="skipped", error="수집 예산 부족")
+
+    def _execute(self, task: CollectionTask, total_steps: int) -> CollectionResult:
+        """워커 스레드에서 단일 수집기 실행 (수집 + 포맷)"""
+        if self._scopes[task.step].cancelled:  # 시작 직전에 포기한 작업
+            return CollectionResult(task=task, status="cancelled", error="결과 폐기됨")
+        if self._over_budget(task, time.monotonic()):
+            return self._skipped(task)
+        with self._lock:
+            self._started[task.step] = time.monotonic()
+        print(f"\n[{task.step}/{total_steps}] {task.label} 데이터 수집 중...")
+
+        with profiler.span(f"collector:{task.label}", step=task.step, mode="threads"), \
+                claim_scope(self._scopes[task.step]):
+            with profiler.span("collect_all") as span:
+                raw_data = task.collector.collect_all(**task.collect_kwargs)
+                span.add(items=_count_items(raw_data))
+            return self._complete(task, raw_data)
+
+    def _complete(self, task: CollectionTask, raw_data: Any) -> CollectionResult:
+        """포맷 후 on_collected 호출 (워커 스레드에서 실행, 이미 포기한 작업이면 호출하지 않음)
+
+        포맷이 끝나면 락 안에서 포기 여부를 확인하고 전달 시작을 표시한다 (_abandon과 배타적).
+        """
+        scope = self._scopes[task.step]
+        if scope.cancelled:
+            return CollectionResult(task=task, status="cancelled", error="결과 폐기됨")
+        result = self._format(task, raw_data)
+        with self._lock:
+            if scope.cancelled:
+                return CollectionResult(task=task, status="cancelled", error="결과 폐기됨")
+            self._finishing.add(task.step)
+        if self._on_collected is not None:
+            with profiler.span("on_collected"):
+                try:
+                    self._on_collected(task, raw_data)
+                except Exception as e:
+                    print(f"[{task.label}] 수집 결과 전달 실패: {e}")
+            # 분석용 텍스트만 남기고 원본 객체는 해제
+            result.raw_data = None
+        return result
+
+    @staticmethod
+    def _format(task: CollectionTask, raw_data: Any) -> CollectionResult:
+        """수집 데이터를 버킷별 분석용 텍스트로 변환"""
+        result = CollectionResult(task=task, raw_data=raw_data)
+
+        with profiler.span("format_for_analysis") as span:
+            if task.splits:
+                for bucket, categories in task.splits.items():
+                    result.texts[bucket] = task.collector.format_for_analysis(raw_data, categories=categories)
+            else:
+                result.texts[task.category] = task.collector.format_for_analysis(raw_data, **task.format_kwargs)
+            span.set(text_chars=sum(len(text) for text in result.texts.values()))
+
+        result.status = "ok"
+        return result
+
+    def run(self, tasks: List[CollectionTask],
+            on_bucket_done: Optional[Callable[[str, List[CollectionResult]], None]] = None,
+            on_collected: Optional[Callable[[CollectionTask, Any], None]] = None) -> List[CollectionResult]:
+        """모든 수집 작업 실행. step 순서로 정렬된 결과 반환
+
+        on_bucket_done(bucket, results)는 버킷에 속한 수집기가 모두 끝난 시점에
+        엔진 스레드(async 모드는 이벤트 루프)에서 호출되므로 오래 걸리는 작업은 별도 스레드로 넘길 것.
+        on_collected(task, raw_data)는 수집기마다 포맷이 끝난 직후 워커 스레드에서 호출된다.
+        """
+        self._reset(tasks, on_bucket_done, on_collected)
+        if self.mode == "async":
+            return asyncio.run(self._run_async(tasks))
+        return self._run_threads(tasks)
+
+    def _run_threads(self, tasks: List[CollectionTask]) -> List[CollectionResult]:
+        """스레드 풀에서 collect_all 실행"""
+        run_start = time.monotonic()
+        deadline = run_start + self.run_deadline if self.run_deadline else None
+        self._deadline = deadline
+        total_steps = len(tasks)
+
+        executor = _DaemonExecutor(max_workers=self.max_workers, thread_name_prefix="collector")
+        # 우선순위 순으로 제출 (워커가 비는 순서대로 시작)
+        # 수집기 구간이 현재(collection) 구간 아래에 기록되도록 작업마다 컨텍스트 복사
+        futures = {
+            executor.submit(contextvars.copy_context().run, self._execute, task, total_steps): task
+            for task in self._schedule(tasks)
+        }
+        pending = set(futures)
+
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                now = time.monotonic()
+
+                for future in done:
+                    task = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = CollectionResult(task=task, status="error", error=str(e))
+                        print(f"[{task.label}] 수집 실패: {e}")
+                    result.elapsed = now - self._started.get(task.step, now)
+                    self._record(result)
+
+                # 수집기별 제한 시간 초과 확인 (시작된 작업만)
+                for future in list(pending):
+                    task = futures[future]
+                    started = self._started.get(task.step)
+                    timeout = task.timeout or self.collector_timeout
+                    if started is not None and timeout and now - started > timeout:
+                        if not self._abandon(task):
+                            continue  # 결과 전달 중인 작업은 끝날 때까지 기다림
+                        pending.discard(future)
+                        self._record(CollectionResult(
+                            task=task, status="timeout", elapsed=now - started,
+                            error=f"{timeout:.0f}초 제한 시간 초과",
+                        ))
+                        print(f"[{task.label}] 수집 시간 초과 ({timeout:.0f}초) - 결과를 건너뜁니다")
+
+                # 남은 시간이 우선순위 기준보다 적으면 낮은 우선순위부터 정리
+                for future in list(pending):
+                    task = futures[future]
+                    if self._over_budget(task, now) and self._abandon(task):
+                        pending.discard(future)
+                        started = self._started.get(task.step)
+                        if future.cancel() or started is None:
+                            self._record(self._skipped(task))
+                        else:
+                            self._record(self._budget_cancelled(task, now - started))
+
+                # 전체 데드라인 초과 시 남은 작업 정리 (결과 전달 중인 작업은 기다림)
+                abandoned = [f for f in pending if self._abandon(futures[f])] \
+                    if deadline and now > deadline else []
+                if abandoned:
+                    for future in abandoned:
+                        task = futures[future]
+                        started = self._started.get(task.step)
+                        status = "timeout" if future.running() or started else "cancelled"
+                        future.cancel()
+                        self._record(CollectionResult(
+                            task=task, status=status,
+                            elapsed=now - started if started else 0.0,
+                            error="전체 수집 데드라인 초과",
+                        ))
+                    print(f"[수집] 전체 데드라인({self.run_deadline:.0f}초) 초과 - {len(abandoned)}개 수집기 중단")
+                    pending.difference_update(abandoned)
+        finally:
+            # 멈춘 수집기를 기다리지 않음 (결과는 이미 폐기됨, 데몬 스레드라 종료 시에도 join하지 않음)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return self._finish(tasks, run_start)
+
+    @staticmethod
+    def _budget_cancelled(task: CollectionTask, elapsed: float) -> CollectionResult:
+        """남은 시간 부족으로 중단한 수집기 결과 (결과 폐기)"""
+        print(f"[{task.label}] 남은 수집 시간 부족 - 중단합니다 (우선순위 {task.priority})")
+        return CollectionResult(task=task, status="cancelled", elapsed=elapsed, error="수집 예산 부족")
+
+    async def _execute_async(self, client: AsyncHTTPClient, task: CollectionTask,
+                             total_steps: int) -> CollectionResult:
+        """이벤트 루프에서 단일 수집기 실행 (수집 + 포맷)"""
+        if self._scopes[task.step].cancelled:  # 자리를 기다리는 동안 포기한 작업
+            return CollectionResult(task=task, status="cancelled", error="결과 폐기됨")
+        if self._over_budget(task, time.monotonic()):
+            return self._skipped(task)
+        self._started[task.step] = time.monotonic()
+        print(f"\n[{task.step}/{total_steps}] {task.label} 데이터 수집 중...")
+
+        with profiler.span(f"collector:{task.label}", step=task.step, mode="async"), \
+                claim_scope(self._scopes[task.step]):
+            with profiler.span("collect_all") as span:
+                if hasattr(task.collector, "collect_all_async"):
+                    raw_data = await task.collector.collect_all_async(client, **task.collect_kwargs)
+                else:
+                    raw_data = await self._in_thread(task.collector.collect_all, **task.collect_kwargs)
+                span.add(items=_count_items(raw_data))
+
+            # 포맷 단계는 본문 추출(블로킹 요청)을 포함하므로 스레드에서 실행
+            return await self._in_thread(self._complete, task, raw_data)
+
+    async def _in_thread(self, fn, *args, **kwargs):
+        """asyncio.to_thread처럼 컨텍스트를 복사해 실행하되 엔진의 데몬 스레드 풀 사용"""
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(context.run, fn, *args, **kwargs))
+
+    async def _run_task_async(self, client: AsyncHTTPClient, task: CollectionTask,
+                              total_steps: int, slots: asyncio.Semaphore) -> CollectionResult:
+        """워커 자리를 얻은 뒤 실행하고, 수집기별 제한 시간과 예외를 결과로 변환
+
+        제한 시간은 자리를 얻은 시점부터 잰다.
+        """
+        timeout = task.timeout or self.collector_timeout
+        try:
+            async with slots:
+                job = asyncio.ensure_future(self._execute_async(client, task, total_steps))
+                try:
+                    done, _ = await asyncio.wait({job}, timeout=timeout)
+                except asyncio.CancelledError:
+                    job.cancel()
+                    raise
+                # 스레드에서 실행 중인 부분은 멈추지 않으므로 _abandon이 바로 취소 표시
+                # (결과 전달을 시작한 작업은 버리지 않고 끝날 때까지 기다림)
+                if not done and self._abandon(task):
+                    job.cancel()
+                    raise asyncio.TimeoutError
+                result = await job
+        except asyncio.TimeoutError:
+            print(f"[{task.label}] 수집 시간 초과 ({timeout:.0f}초) - 결과를 건너뜁니다")
+            result = CollectionResult(task=task, status="timeout", error=f"{timeout:.0f}초 제한 시간 초과")
+        except Exception as e:
+            print(f"[{task.label}] 수집 실패: {e}")
+            result = CollectionResult(task=task, status="error", error=str(e))
+
+        now = time.monotonic()
+        result.elapsed = now - self._started.get(task.step, now)
+        return result
+
+    async def _run_async(self, tasks: List[CollectionTask]) -> List[CollectionResult]:
+        """하나의 이벤트 루프와 공유 HTTP 클라이언트로 collect_all_async 실행"""
+        run_start = time.monotonic()
+        deadline = run_start + self.run_deadline if self.run_deadline else None
+        self._deadline = deadline
+
+        # 동시 실행 수집기 수 제한. 대기열은 FIFO이므로 우선순위 순으로 생성하면 그 순서로 시작
+        slots = asyncio.Semaphore(self.max_workers)
+        # 작업당 블로킹 단계는 한 번에 하나이므로 작업 수만큼이면 버린 스레드가 남아도 다음 작업이 기다리지 않음
+        self._executor = _DaemonExecutor(max_workers=max(1, len(tasks)), thread_name_prefix="collector")
+
+        try:
+            return await self._run_async_tasks(tasks, run_start, deadline, slots)
+        finally:
+            # 버린 작업의 스레드를 기다리지 않음
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run_async_tasks(self, tasks: List[CollectionTask], run_start: float,
+                               deadline: Optional[float], slots: asyncio.Semaphore) -> List[CollectionResult]:
+        """태스크 생성 후 완료/예산/데드라인 처리"""
+        total_steps = len(tasks)
+        async with create_async_client() as client:
+            # 우선순위 순으로 생성 (공유 HTTP 세마포어 대기열에도 먼저 들어감)
+            running = {
+                asyncio.create_task(self._run_task_async(client, task, total_steps, slots)): task
+                for task in self._schedule(tasks)
+            }
+            pending = set(running)
+            stopped = []
+
+            while pending:
+                wait_for = self.poll_interval if deadline else None
+                done, pending = await asyncio.wait(pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+                now = time.monotonic()
+
+                for future in done:
+                    result = future.result()
+                    self._record(result)
+
+                # 남은 시간이 우선순위 기준보다 적으면 낮은 우선순위부터 정리 (자리를 기다리던 작업은 skipped)
+                for future in list(pending):
+                    task = running[future]
+                    if self._over_budget(task, now) and self._abandon(task):
+                        pending.discard(future)
+                        future.cancel()
+                        stopped.append(future)
+                        started = self._started.get(task.step)
+                        if started is None:
+                            self._record(self._skipped(task))
+                        else:
+                            self._record(self._budget_cancelled(task, now - started))
+
+                abandoned = [f for f in pending if self._abandon(running[f])] \
+                    if deadline and now > deadline else []
+                if abandoned:
+                    print(f"[수집] 전체 데드라인({self.run_deadline:.0f}초) 초과 - {len(abandoned)}개 수집기 중단")
+                    for future in abandoned:
+                        future.cancel()
+                        task = running[future]
+                        started = self._started.get(task.step)
+                        self._record(CollectionResult(
+                            task=task, status="timeout" if started else "cancelled",
+                            error="전체 수집 데드라인 초과",
+                            elapsed=now - started if started else 0.0,
+                        ))
+                    stopped.extend(abandoned)
+                    pending.difference_update(abandoned)
+
+            await asyncio.gather(*stopped, return_exceptions=True)
+
+        return self._finish(tasks, run_start)
+
+    def _finish(self, tasks: List[CollectionTask], run_start: float) -> List[CollectionResult]:
+        """요약 출력 후 step 순서로 정렬된 결과 반환"""
+        results = self._results
+        elapsed = time.monotonic() - run_start
+        ok = sum(1 for r in results.values() if r.status == "ok")
+        print(f"\n[수집] {ok}/{len(tasks)}개 수집기 완료 ({elapsed:.1f}초)")
+        dropped = [r.task.label for r in results.values() if r.status in ("skipped", "cancelled")]
+        if dropped:
+            print(f"[수집] 예산 부족으로 제외: {', '.join(dropped)}")
+
+        return [results[task.step] for task in sorted(tasks, key=lambda t: t.step)]
+
+    @staticmethod
+    def bucket_text(results: List[CollectionResult], bucket: str) -> str:
+        """버킷의 분석용 텍스트 (merge 후 data_buckets[bucket]을 합친 것과 같음)"""
+        texts = [
+            result.texts.get(bucket)
+            for result in sorted(results, key=lambda r: r.task.step)
+            if result.status == "ok"
+        ]
+        return "\n".join(text for text in texts if text).strip()
+
+    @staticmethod
+    def merge(results: List[CollectionResult], data_buckets: Dict[str, list],
+              raw_collected: Optional[dict] = None):
+        """결과를 step 순서대로 data_buckets(/raw_collected)에 병합"""
+        for result in sorted(results, key=lambda r: r.task.step):
+            if result.status != "ok":
+                continue
+            task = result.task
+            for bucket, text in result.texts.items():
+                if text:
+                    data_buckets[bucket].append(text)
+
+            if raw_collected is None:
+                continue
+            raw_collected[task.label] = (task.collector, result.raw_data, task.category or "dev")
+            # splits 수집기(RSS)는 버킷별로도 저장
+            if task.splits:
+                for bucket in task.splits:
+                    raw_collected[f"{task.label}/{bucket}"] = (task.collector, result.raw_data, bucket)
@@ -1,20 +1,96 @@
-from .hackernews import HackerNewsCollector
-from .rss import RSSCollector
-from .devto import DevToCollector
-from .lobsters import LobstersCollector
-from .github_trending import GitHubTrendingCollector
-from .huggingface import HuggingFaceCollector
-from .github_api import GitHubAPICollector
-from .arxiv import ArxivCollector
-from .osv import OSVCollector
-from .gdelt import GDELTCollector
-from .fred import FREDCollector
-from .sec_filings import SECFilingsCollector
-from .treasury_press import TreasuryPressCollector
-from .claude_code import ClaudeCodeCollector
-from .geeknews_new import GeekNewsNewCollector
+"""데이터 수집기 레지스트리
+
+config/sources.yaml의 섹션 이름으로 수집기를 찾는다.
+수집기 모듈(과 feedparser 같은 의존성)은 해당 소스를 실제로 사용할 때 처음 import하며,
+모듈별 import 소요 시간을 기록한다 (import_times).
+
+    from collectors import create_collector
+    hn = create_collector("hackernews", cache=cache)
+
+기존처럼 `from collectors import HackerNewsCollector`도 지원한다 (해당 모듈만 import).
+"""
+
+import importlib
+import sys
+import threading
+import time
+from typing import Dict, List, Tuple
+
+
+# 섹션 이름 -> (모듈, 클래스)
+REGISTRY: Dict[str, Tuple[str, str]] = {
+    "hackernews": ("hackernews", "HackerNewsCollector"),
+    "devto": ("devto", "DevToCollector"),
+    "lobsters": ("lobsters", "LobstersCollector"),
+    "rss": ("rss", "RSSCollector"),
+    "github_trending": ("github_trending", "GitHubTrendingCollector"),
+    "github_api": ("github_api", "GitHubAPICollector"),
+    "claude_code": ("claude_code", "ClaudeCodeCollector"),
+    "geeknews_new": ("geeknews_new", "GeekNewsNewCollector"),
+    "arxiv": ("arxiv", "ArxivCollector"),
+    "osv": ("osv", "OSVCollector"),
+    "gdelt": ("gdelt", "GDELTCollector"),
+    "fred": ("fred", "FREDCollector"),
+    "sec": ("sec_filings", "SECFilingsCollector"),
+    "treasury": ("treasury_press", "TreasuryPressCollector"),
+    "huggingface": ("huggingface", "HuggingFaceCollector"),
+}
+
+_CLASS_MODULES = {class_name: module for module, class_name in REGISTRY.values()}
+_import_times: Dict[str, float] = {}
+_import_lock = threading.Lock()
+
+
+def _import_module(module: str):
+    """수집기 모듈 import (처음 import할 때 소요 시간 기록)"""
+    full_name = f"{__name__}.{module}"
+    if full_name in sys.modules:
+        return sys.modules[full_name]
+
+    with _import_lock:
+        start = time.perf_counter()
+        loaded = importlib.import_module(full_name)
+        _import_times.setdefault(module, time.perf_counter() - start)
+    return loaded
+
+
+def get_collector_class(section: str):
+    """섹션 이름으로 수집기 클래스 반환"""
+    if section not in REGISTRY:
+        raise KeyError(f"등록되지 않은 소스: {section}")
+    module, class_name = REGISTRY[section]
+    return getattr(_import_module(module), class_name)
+
+
+def create_collector(section: str, **kwargs):
+    """섹션 이름으로 수집기 생성 (kwargs는 생성자 인자)"""
+    return get_collector_class(section)(**kwargs)
+
+
+def available_sources() -> List[str]:
+    """등록된 섹션 이름 목록"""
+    return list(REGISTRY)
+
+
+def import_times() -> Dict[str, float]:
+    """{모듈: import 소요 시간(초)} (이번 프로세스에서 import된 모듈만)"""
+    return {module: round(elapsed, 4) for module, elapsed in _import_times.items()}
+
+
+def __getattr__(name: str):
+    """`from collectors import XxxCollector` 지연 import"""
+    module = _CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(_import_module(module), name)
+
 
 __all__ = [
+    'REGISTRY',
+    'get_collector_class',
+    'create_collector',
+    'available_sources',
+    'import_times',
     'HackerNewsCollector',
     'RSSCollector',
     'DevToCollector',
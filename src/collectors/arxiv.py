@@ -1,62 +1,76 @@
 """arXiv Atom API 수집기"""
 
 import os
+import asyncio
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
 from typing import List, Optional
 
-import requests
-
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
 ARXIV_API_URL = "https://export.arxiv.org/api/query"
 ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
 
 
-@dataclass
-class ArxivPaper:
-    """arXiv 논문 데이터"""
-    title: str
-    url: str
-    updated: str
-    summary: str
-    authors: List[str]
-    query_name: str
+class ArxivPaper(TrendItem):
+    """arXiv 논문 (초록은 body)"""
+    __slots__ = ("updated", "authors", "query_name")
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, updated: str, authors: List[str],
+                 query_name: str):
+        super().__init__("arXiv", id, title, url, score, body, posted_at)
+        self.updated = updated
+        self.authors = authors
+        self.query_name = query_name
+
+    @property
+    def meta(self) -> str:
+        return f"authors:{','.join(self.authors[:3])}"
 
 
 class ArxivCollector:
     """arXiv API를 사용한 최신 AI/개발 논문 수집"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "TrendReporter/1.0"
-        })
+        }
+        self.http = get_transport()
         self.cache = cache
 
-    def collect_query(self, query_cfg: dict, per_query: int = 5) -> List[ArxivPaper]:
-        """단일 검색 쿼리 실행"""
-        params = {
+    def _build_params(self, query_cfg: dict, per_query: int) -> dict:
+        """검색 요청 파라미터"""
+        return {
             "search_query": query_cfg.get("search_query", ""),
             "start": 0,
             "max_results": per_query * 2,
             "sortBy": "lastUpdatedDate",
             "sortOrder": "descending",
         }
+
+    def collect_query(self, query_cfg: dict, per_query: int = 5) -> List[ArxivPaper]:
+        """단일 검색 쿼리 실행"""
+        params = self._build_params(query_cfg, per_query)
         if not params["search_query"]:
             return []
 
         try:
-            resp = self.session.get(ARXIV_API_URL, params=params, timeout=30)
+            resp = self.http.get(ARXIV_API_URL, params=params, headers=self.headers, timeout=30)
             resp.raise_for_status()
             root = ET.fromstring(resp.text)
         except Exception as e:
             print(f"[arXiv] {query_cfg.get('name', 'query')} 수집 실패: {e}")
             return []
 
+        return self._parse_entries(root, query_cfg, per_query)
+
+    def _parse_entries(self, root: ET.Element, query_cfg: dict, per_query: int) -> List[ArxivPaper]:
+        """Atom 피드에서 논문 목록 추출 (캐시된 논문 제외)"""
         papers = []
         for entry in root.findall("atom:entry", ATOM_NS):
             url = entry.findtext("atom:id", default="", namespaces=ATOM_NS)
@@ -72,21 +86,19 @@ class ArxivCollector:
                 continue
 
             cache_id = f"arxiv_{url}"
-            if self.cache and self.cache.is_seen(cache_id):
+            if self.cache and not self.cache.claim(cache_id):
                 continue
 
             papers.append(ArxivPaper(
+                url,
                 title=title,
                 url=url,
+                body=summary[:400],
                 updated=updated,
-                summary=summary[:400],
                 authors=[a for a in authors if a][:4],
                 query_name=query_cfg.get("name", "general"),
             ))
 
-            if self.cache:
-                self.cache.mark_seen(cache_id)
-
             if len(papers) >= per_query:
                 break
 
@@ -94,12 +106,16 @@ class ArxivCollector:
 
     def collect_all(self, queries: List[dict], per_query: int = 5) -> dict:
         """여러 arXiv 쿼리 실행"""
+        return self._merge_results(queries, [
+            self.collect_query(query_cfg, per_query=per_query) for query_cfg in queries
+        ])
+
+    def _merge_results(self, queries: List[dict], paper_lists: List[List[ArxivPaper]]) -> dict:
+        """쿼리 이름별 결과 구성"""
         results = {}
         total = 0
-
-        for query_cfg in queries:
+        for query_cfg, papers in zip(queries, paper_lists):
             name = query_cfg.get("name", "general")
-            papers = self.collect_query(query_cfg, per_query=per_query)
             results[name] = papers
             total += len(papers)
             print(f"[arXiv] {name}: {len(papers)}개 논문 수집")
@@ -107,6 +123,32 @@ class ArxivCollector:
         print(f"[arXiv] 총 {total}개 논문 수집")
         return results
 
+    async def _fetch_query_async(self, client: AsyncHTTPClient, query_cfg: dict,
+                                 per_query: int) -> Optional[ET.Element]:
+        """단일 검색 쿼리 응답 가져오기 (비동기)"""
+        params = self._build_params(query_cfg, per_query)
+        if not params["search_query"]:
+            return None
+
+        try:
+            resp = await client.get(ARXIV_API_URL, params=params, headers=self.headers, timeout=30)
+            resp.raise_for_status()
+            return ET.fromstring(resp.text)
+        except Exception as e:
+            print(f"[arXiv] {query_cfg.get('name', 'query')} 수집 실패: {e}")
+            return None
+
+    async def collect_all_async(self, client: AsyncHTTPClient, queries: List[dict], per_query: int = 5) -> dict:
+        """여러 arXiv 쿼리를 동시에 실행"""
+        roots = await asyncio.gather(*(
+            self._fetch_query_async(client, query_cfg, per_query) for query_cfg in queries
+        ))
+
+        return self._merge_results(queries, [
+            self._parse_entries(root, query_cfg, per_query) if root is not None else []
+            for query_cfg, root in zip(queries, roots)
+        ])
+
     def format_for_analysis(self, data: dict) -> str:
         """분석용 텍스트 포맷"""
         output = []
@@ -119,13 +161,13 @@ class ArxivCollector:
             output.append(f"\n## arXiv - {name.upper()}\n")
             for i, paper in enumerate(papers[:5], 1):
                 authors = ", ".join(paper.authors[:3]) if paper.authors else "unknown"
-                output.append(
-                    f"{i}. {paper.title}\n"
-                    f"   Authors: {authors}\n"
-                    f"   Updated: {paper.updated}\n"
-                    f"   Summary: {paper.summary[:220]}\n"
-                    f"   URL: {paper.url}\n"
-                )
+                output.append(format_entry(
+                    f"{i}.", paper.title,
+                    f"Authors: {authors}",
+                    f"Updated: {paper.updated}",
+                    f"Summary: {paper.body[:220]}",
+                    f"URL: {paper.url}",
+                ))
                 total += 1
 
         if total == 0:
@@ -1,14 +1,15 @@
 """Claude Code 공식 신호 수집기"""
 
 import os
+import asyncio
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
-import requests
-
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
 NPM_PACKAGE_URL = "https://registry.npmjs.org/@anthropic-ai/claude-code"
@@ -24,51 +25,59 @@ class ClaudeCodePackageInfo:
     latest_published_at: str
 
 
-@dataclass
-class ClaudeCodeRelease:
-    """GitHub release 정보"""
-    tag_name: str
-    published_at: str
-    body: str
-    url: str
+class ClaudeCodeRelease(TrendItem):
+    """GitHub release (id는 태그, 제목은 "Release <태그>", 릴리스 노트는 body)"""
+    __slots__ = ("published_at",)
 
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, published_at: str):
+        super().__init__("Claude Code", id, title, url, score, body, posted_at)
+        self.published_at = published_at
 
-@dataclass
-class ClaudeCodeIssue:
-    """GitHub issue 정보"""
-    number: int
-    title: str
-    created_at: str
-    labels: List[str]
-    url: str
-    bucket: str
+
+class ClaudeCodeIssue(TrendItem):
+    """GitHub issue (id는 이슈 번호)"""
+    __slots__ = ("created_at", "labels")
+
+    def __init__(self, id: int, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, created_at: str, labels: List[str]):
+        super().__init__("Claude Code", id, title, url, score, body, posted_at)
+        self.created_at = created_at
+        self.labels = labels
+
+    @property
+    def meta(self) -> str:
+        return f"labels:{','.join(self.labels[:3])}"
 
 
 class ClaudeCodeCollector:
     """Claude Code 공식 릴리스, npm, 이슈 수집"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        headers = {
+        self.headers = {
             "Accept": "application/vnd.github+json",
             "User-Agent": "TrendReporter/1.0",
         }
         token = os.getenv("GITHUB_TOKEN")
         if token:
-            headers["Authorization"] = f"Bearer {token}"
-        self.session.headers.update(headers)
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.http = get_transport()
         self.cache = cache
 
     def collect_package_info(self) -> Optional[ClaudeCodePackageInfo]:
         """npm 배포 메타데이터 수집"""
         try:
-            resp = self.session.get(NPM_PACKAGE_URL, timeout=20)
-            resp.raise_for_status()
+            resp = self.http.get(NPM_PACKAGE_URL, headers=self.headers, timeout=20, revalidate=True)
+            resp.raise_for_status()  # 304도 저장된 본문으로 파싱 (본 조합은 claim이 제외)
             payload = resp.json()
         except Exception as e:
             print(f"[Claude Code] npm 정보 수집 실패: {e}")
             return None
 
+        return self._parse_package_info(payload)
+
+    def _parse_package_info(self, payload: dict) -> Optional[ClaudeCodePackageInfo]:
+        """npm packument에서 dist-tags 추출 (이미 본 조합이면 None)"""
         dist_tags = payload.get("dist-tags", {})
         latest = dist_tags.get("latest", "")
         stable = dist_tags.get("stable", "")
@@ -76,12 +85,9 @@ class ClaudeCodeCollector:
         latest_published_at = payload.get("time", {}).get(latest, "")
 
         cache_id = f"claude_code_npm_{latest}_{stable}_{next_version}"
-        if self.cache and self.cache.is_seen(cache_id):
+        if self.cache and not self.cache.claim(cache_id):
             return None
 
-        if self.cache:
-            self.cache.mark_seen(cache_id)
-
         return ClaudeCodePackageInfo(
             latest=latest,
             stable=stable,
@@ -92,10 +98,12 @@ class ClaudeCodeCollector:
     def collect_releases(self, limit: int = 3) -> List[ClaudeCodeRelease]:
         """최근 GitHub release 수집"""
         try:
-            resp = self.session.get(
+            resp = self.http.get(
                 f"{GITHUB_API_BASE}/releases",
                 params={"per_page": limit * 2},
+                headers=self.headers,
                 timeout=20,
+                revalidate=True,
             )
             resp.raise_for_status()
             payload = resp.json()
@@ -103,6 +111,10 @@ class ClaudeCodeCollector:
             print(f"[Claude Code] release 수집 실패: {e}")
             return []
 
+        return self._parse_releases(payload, limit)
+
+    def _parse_releases(self, payload: list, limit: int) -> List[ClaudeCodeRelease]:
+        """release 목록 변환 (캐시된 release 제외)"""
         releases = []
         for item in payload:
             tag_name = item.get("tag_name", "")
@@ -110,41 +122,44 @@ class ClaudeCodeCollector:
                 continue
 
             cache_id = f"claude_code_release_{tag_name}"
-            if self.cache and self.cache.is_seen(cache_id):
+            if self.cache and not self.cache.claim(cache_id):
                 continue
 
-            body = " ".join((item.get("body") or "").split())[:1200]
+            body = " ".join((item.get("body") or "").split())[:500]
             releases.append(ClaudeCodeRelease(
-                tag_name=tag_name,
-                published_at=item.get("published_at", ""),
-                body=body,
+                tag_name,
+                title=f"Release {tag_name}",
                 url=item.get("html_url", ""),
+                body=body,
+                published_at=item.get("published_at", ""),
             ))
 
-            if self.cache:
-                self.cache.mark_seen(cache_id)
-
             if len(releases) >= limit:
                 break
 
         return releases
 
+    def _issue_params(self, bucket: dict, limit_per_bucket: int) -> dict:
+        """버킷별 issue 요청 파라미터"""
+        params = {
+            "state": "open",
+            "per_page": limit_per_bucket * 2,
+        }
+        label = bucket.get("label", "")
+        if label:
+            params["labels"] = label
+        return params
+
     def collect_issues(self, buckets: List[dict], limit_per_bucket: int = 3) -> Dict[str, List[ClaudeCodeIssue]]:
         """버킷별 open issue 수집"""
         results: Dict[str, List[ClaudeCodeIssue]] = {}
 
         for bucket in buckets:
             name = bucket.get("name", "issues")
-            label = bucket.get("label", "")
-            params = {
-                "state": "open",
-                "per_page": limit_per_bucket * 2,
-            }
-            if label:
-                params["labels"] = label
-
             try:
-                resp = self.session.get(f"{GITHUB_API_BASE}/issues", params=params, timeout=20)
+                resp = self.http.get(f"{GITHUB_API_BASE}/issues",
+                                     params=self._issue_params(bucket, limit_per_bucket),
+                                     headers=self.headers, timeout=20, revalidate=True)
                 resp.raise_for_status()
                 payload = resp.json()
             except Exception as e:
@@ -152,38 +167,38 @@ class ClaudeCodeCollector:
                 results[name] = []
                 continue
 
-            issues = []
-            for item in payload:
-                if "pull_request" in item:
-                    continue
-
-                number = item.get("number")
-                if not number:
-                    continue
-
-                cache_id = f"claude_code_issue_{number}"
-                if self.cache and self.cache.is_seen(cache_id):
-                    continue
-
-                issues.append(ClaudeCodeIssue(
-                    number=number,
-                    title=item.get("title", ""),
-                    created_at=item.get("created_at", ""),
-                    labels=[label_obj.get("name", "") for label_obj in item.get("labels", [])[:4]],
-                    url=item.get("html_url", ""),
-                    bucket=name,
-                ))
+            results[name] = self._parse_issues(payload, name, limit_per_bucket)
+            print(f"[Claude Code] {name}: {len(results[name])}개 이슈 수집")
+
+        return results
+
+    def _parse_issues(self, payload: list, name: str, limit_per_bucket: int) -> List[ClaudeCodeIssue]:
+        """issue 목록 변환 (PR/캐시된 issue 제외)"""
+        issues = []
+        for item in payload:
+            if "pull_request" in item:
+                continue
 
-                if self.cache:
-                    self.cache.mark_seen(cache_id)
+            number = item.get("number")
+            if not number:
+                continue
 
-                if len(issues) >= limit_per_bucket:
-                    break
+            cache_id = f"claude_code_issue_{number}"
+            if self.cache and not self.cache.claim(cache_id):
+                continue
 
-            results[name] = issues
-            print(f"[Claude Code] {name}: {len(issues)}개 이슈 수집")
+            issues.append(ClaudeCodeIssue(
+                number,
+                title=item.get("title", ""),
+                url=item.get("html_url", ""),
+                created_at=item.get("created_at", ""),
+                labels=[label_obj.get("name", "") for label_obj in item.get("labels", [])[:4]],
+            ))
 
-        return results
+            if len(issues) >= limit_per_bucket:
+                break
+
+        return issues
 
     def collect_all(self, release_limit: int = 3, issue_buckets: Optional[List[dict]] = None, issue_limit: int = 3) -> dict:
         """Claude Code 관련 공식 신호 수집"""
@@ -193,7 +208,11 @@ class ClaudeCodeCollector:
         package_info = self.collect_package_info()
         releases = self.collect_releases(limit=release_limit)
         issues = self.collect_issues(issue_buckets, limit_per_bucket=issue_limit)
+        return self._merge_results(package_info, releases, issues)
 
+    def _merge_results(self, package_info: Optional[ClaudeCodePackageInfo], releases: List[ClaudeCodeRelease],
+                       issues: Dict[str, List[ClaudeCodeIssue]]) -> dict:
+        """npm, release, issue 결과 구성"""
         print(f"[Claude Code] release {len(releases)}개, issue {sum(len(v) for v in issues.values())}개 수집")
         return {
             "package": package_info,
@@ -201,6 +220,51 @@ class ClaudeCodeCollector:
             "issues": issues,
         }
 
+    async def _get_json_async(self, client: AsyncHTTPClient, url: str, params: Optional[dict] = None):
+        """JSON 응답 가져오기 (비동기, 304는 저장된 본문). 실패 시 예외 전달"""
+        resp = await client.get(url, params=params, headers=self.headers, timeout=20, revalidate=True)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def collect_all_async(self, client: AsyncHTTPClient, release_limit: int = 3,
+                                issue_buckets: Optional[List[dict]] = None, issue_limit: int = 3) -> dict:
+        """npm, release, issue 버킷을 동시에 요청 후 순서대로 파싱"""
+        if issue_buckets is None:
+            issue_buckets = []
+
+        responses = await asyncio.gather(
+            self._get_json_async(client, NPM_PACKAGE_URL),
+            self._get_json_async(client, f"{GITHUB_API_BASE}/releases", {"per_page": release_limit * 2}),
+            *(self._get_json_async(client, f"{GITHUB_API_BASE}/issues", self._issue_params(bucket, issue_limit))
+              for bucket in issue_buckets),
+            return_exceptions=True,
+        )
+        package_payload, releases_payload, issue_payloads = responses[0], responses[1], responses[2:]
+
+        package_info = None
+        if isinstance(package_payload, Exception):
+            print(f"[Claude Code] npm 정보 수집 실패: {package_payload}")
+        else:
+            package_info = self._parse_package_info(package_payload)
+
+        releases = []
+        if isinstance(releases_payload, Exception):
+            print(f"[Claude Code] release 수집 실패: {releases_payload}")
+        else:
+            releases = self._parse_releases(releases_payload, release_limit)
+
+        issues: Dict[str, List[ClaudeCodeIssue]] = {}
+        for bucket, payload in zip(issue_buckets, issue_payloads):
+            name = bucket.get("name", "issues")
+            if isinstance(payload, Exception):
+                print(f"[Claude Code] issue 수집 실패 ({name}): {payload}")
+                issues[name] = []
+                continue
+            issues[name] = self._parse_issues(payload, name, issue_limit)
+            print(f"[Claude Code] {name}: {len(issues[name])}개 이슈 수집")
+
+        return self._merge_results(package_info, releases, issues)
+
     def format_for_analysis(self, data: dict) -> str:
         """분석용 텍스트 포맷"""
         output = ["\n## Claude Code Official Signals\n"]
@@ -221,11 +285,12 @@ class ClaudeCodeCollector:
         if releases:
             output.append("\n### Recent Releases\n")
             for release in releases:
-                output.append(
-                    f"- {release.tag_name} ({release.published_at})\n"
-                    f"  {release.body[:260]}\n"
-                    f"  URL: {release.url}\n"
-                )
+                output.append(format_entry(
+                    "-", f"{release.id} ({release.published_at})",
+                    release.body[:260],
+                    f"URL: {release.url}",
+                    indent="  ",
+                ))
                 total += 1
 
         issues = data.get("issues", {})
@@ -235,11 +300,12 @@ class ClaudeCodeCollector:
             output.append(f"\n### Open Issues - {bucket}\n")
             for issue in bucket_issues:
                 labels = ", ".join(issue.labels) if issue.labels else "N/A"
-                output.append(
-                    f"- #{issue.number} {issue.title}\n"
-                    f"  Labels: {labels} | Created: {issue.created_at}\n"
-                    f"  URL: {issue.url}\n"
-                )
+                output.append(format_entry(
+                    "-", f"#{issue.id} {issue.title}",
+                    f"Labels: {labels} | Created: {issue.created_at}",
+                    f"URL: {issue.url}",
+                    indent="  ",
+                ))
                 total += 1
 
         if total == 0:
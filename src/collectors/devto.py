@@ -1,60 +1,72 @@
 """DEV.to 데이터 수집기"""
 
 import os
-import time
-import requests
 from typing import List, Optional
-from dataclasses import dataclass
 from datetime import datetime
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry, unique
 
 
 DEVTO_API_BASE = "https://dev.to/api"
 
 
-@dataclass
-class DevToArticle:
-    """DEV.to 아티클 데이터"""
-    id: int
-    title: str
-    url: str
-    description: str
-    tags: List[str]
-    positive_reactions_count: int
-    comments_count: int
-    author: str
-    published_at: datetime
+class DevToArticle(TrendItem):
+    """DEV.to 아티클 (반응 수는 score, 설명은 body)"""
+    __slots__ = ("tags", "comments_count", "author")
+
+    def __init__(self, id: int, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, tags: List[str], comments_count: int,
+                 author: str):
+        super().__init__("DEV.to", id, title, url, score, body, posted_at)
+        self.tags = tags
+        self.comments_count = comments_count
+        self.author = author
+
+    @property
+    def meta(self) -> str:
+        return f"tags:{','.join(self.tags[:3])} comments:{self.comments_count}"
+
+    @property
+    def metrics(self) -> dict:
+        return {"reactions": self.score, "comments": self.comments_count}
 
 
 class DevToCollector:
     """DEV.to API를 사용하여 아티클을 수집하는 클래스"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "TrendReporter/1.0"
-        })
+        }
+        self.http = get_transport()
         self.cache = cache
+        # 이미 수집한(캐시된) 항목의 현재 수치. main이 item_metrics 시계열에 기록
+        self.metric_samples: List[dict] = []
 
-    def collect_articles(
-        self,
-        tag: Optional[str] = None,
-        limit: int = 30
-    ) -> List[DevToArticle]:
-        """아티클 수집 (최신순)"""
+    def _build_params(self, tag: Optional[str], limit: int) -> dict:
+        """목록 요청 파라미터"""
         params = {
             "per_page": limit * 2,  # 캐시 고려
         }
         if tag:
             params["tag"] = tag
+        return params
 
+    def collect_articles(
+        self,
+        tag: Optional[str] = None,
+        limit: int = 30
+    ) -> List[DevToArticle]:
+        """아티클 수집 (최신순)"""
         try:
-            resp = self.session.get(
+            resp = self.http.get(
                 f"{DEVTO_API_BASE}/articles",
-                params=params,
+                params=self._build_params(tag, limit),
+                headers=self.headers,
                 timeout=15
             )
             resp.raise_for_status()
@@ -63,36 +75,37 @@ class DevToCollector:
             print(f"[DEV.to] 수집 실패: {e}")
             return []
 
+        return self._parse_articles(articles_data, limit)
+
+    def _parse_articles(self, articles_data: list, limit: int) -> List[DevToArticle]:
+        """API 응답을 아티클 목록으로 변환 (캐시된 항목 제외)"""
         articles = []
         for item in articles_data:
-            article_id = f"devto_{item['id']}"
-
-            # 캐시된 아티클 스킵
-            if self.cache and self.cache.is_seen(article_id):
-                continue
-
             try:
                 published = datetime.fromisoformat(
                     item.get("published_at", "").replace("Z", "+00:00")
-                )
+                ).timestamp()
             except:
-                published = datetime.now()
+                published = None
 
-            articles.append(DevToArticle(
-                id=item["id"],
+            article = DevToArticle(
+                item["id"],
                 title=item.get("title", ""),
                 url=item.get("url", ""),
-                description=item.get("description", ""),
+                score=item.get("positive_reactions_count", 0),
+                body=item.get("description", ""),
+                posted_at=published,
                 tags=item.get("tag_list", []),
-                positive_reactions_count=item.get("positive_reactions_count", 0),
                 comments_count=item.get("comments_count", 0),
                 author=item.get("user", {}).get("username", "unknown"),
-                published_at=published
-            ))
+            )
+
+            # 캐시된 아티클은 수치만 기록하고 스킵
+            if self.cache and not self.cache.claim(f"devto_{article.id}"):
+                self.metric_samples.append(article.metric_sample())
+                continue
 
-            # 캐시에 추가
-            if self.cache:
-                self.cache.mark_seen(article_id)
+            articles.append(article)
 
             if len(articles) >= limit:
                 break
@@ -109,22 +122,63 @@ class DevToCollector:
             "general": self.collect_articles(limit=general_limit)
         }
 
-        # 태그별 수집 (rate limit 방지를 위해 딜레이 추가)
-        if tags:
-            for tag in tags:
-                time.sleep(1)  # 1초 딜레이
-                tag_articles = self.collect_articles(tag=tag, limit=10)
-                # 일반에서 이미 있는 것 제외
-                general_ids = {a.id for a in results["general"]}
-                tag_articles = [a for a in tag_articles if a.id not in general_ids]
-                if tag_articles:
-                    results[tag] = tag_articles
+        # 태그별 수집 (요청 간격은 http.rate_limits의 dev.to 설정이 보장)
+        for tag in tags or []:
+            self._add_tag_articles(results, tag, self.collect_articles(tag=tag, limit=10))
+
+        return self._merge_results(results)
+
+    def _add_tag_articles(self, results: dict, tag: str, tag_articles: List[DevToArticle]):
+        """태그 결과 추가 (일반에서 이미 있는 것 제외)"""
+        tag_articles = unique(tag_articles, exclude=results["general"])
+        if tag_articles:
+            results[tag] = tag_articles
 
+    def _merge_results(self, results: dict) -> dict:
+        """수집 결과 집계 출력 후 반환"""
         total = sum(len(v) for v in results.values())
         print(f"[DEV.to] 총 {total}개 새 아티클 수집")
 
         return results
 
+    async def collect_articles_async(
+        self,
+        client: AsyncHTTPClient,
+        tag: Optional[str] = None,
+        limit: int = 30
+    ) -> List[DevToArticle]:
+        """아티클 수집 (비동기)"""
+        try:
+            resp = await client.get(
+                f"{DEVTO_API_BASE}/articles",
+                params=self._build_params(tag, limit),
+                headers=self.headers,
+                timeout=15
+            )
+            resp.raise_for_status()
+            articles_data = resp.json()
+        except Exception as e:
+            print(f"[DEV.to] 수집 실패: {e}")
+            return []
+
+        return self._parse_articles(articles_data, limit)
+
+    async def collect_all_async(
+        self,
+        client: AsyncHTTPClient,
+        general_limit: int = 20,
+        tags: Optional[List[str]] = None
+    ) -> dict:
+        """일반 + 태그별 아티클 수집 (비동기, 속도 제한 대기 동안 다른 수집기는 계속 진행)"""
+        results = {
+            "general": await self.collect_articles_async(client, limit=general_limit)
+        }
+
+        for tag in tags or []:
+            self._add_tag_articles(results, tag, await self.collect_articles_async(client, tag=tag, limit=10))
+
+        return self._merge_results(results)
+
     def format_for_analysis(self, data: dict) -> str:
         """분석을 위한 텍스트 포맷"""
         output = ["\n## DEV.to\n"]
@@ -134,30 +188,19 @@ class DevToCollector:
             all_articles.extend(articles)
 
         # 중복 제거 후 반응 수로 정렬
-        seen_ids = set()
-        unique_articles = []
-        for a in all_articles:
-            if a.id not in seen_ids:
-                seen_ids.add(a.id)
-                unique_articles.append(a)
-
-        unique_articles.sort(
-            key=lambda x: x.positive_reactions_count,
-            reverse=True
-        )
+        unique_articles = unique(all_articles)
+        unique_articles.sort(key=lambda x: x.score, reverse=True)
 
         if not unique_articles:
             return "[DEV.to] 새로운 아티클 없음\n"
 
         for i, article in enumerate(unique_articles[:20], 1):
             tags_str = ", ".join(article.tags[:3]) if article.tags else "no tags"
-            output.append(
-                f"{i}. {article.title}\n"
-                f"   ❤️ {article.positive_reactions_count} | "
-                f"💬 {article.comments_count} | Tags: {tags_str}\n"
-                f"   URL: {article.url}\n"
-            )
-            if article.description:
-                output.append(f"   요약: {article.description[:500]}\n")
+            output.append(format_entry(
+                f"{i}.", article.title,
+                f"❤️ {article.score} | 💬 {article.comments_count} | Tags: {tags_str}",
+                f"URL: {article.url}",
+                f"요약: {article.body[:500]}" if article.body else None,
+            ))
 
         return "\n".join(output)
@@ -1,58 +1,58 @@
 """FRED 경제지표 수집기"""
 
 import os
-from dataclasses import dataclass
+import asyncio
 from typing import List, Optional
 
-import requests
-
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
 FRED_API_BASE = "https://api.stlouisfed.org/fred"
 
 
-@dataclass
-class FREDSeriesObservation:
-    """FRED 시계열 최근 관측치"""
-    series_id: str
-    name: str
-    date: str
-    value: str
-    previous_value: str
-    category: str
+class FREDObservation(TrendItem):
+    """FRED 시계열 최근 관측치 (제목은 "이름 (ID)", 본문은 관측치 요약)"""
+    __slots__ = ("date", "value", "previous_value", "category")
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, date: str, value: str, previous_value: str,
+                 category: str):
+        super().__init__("FRED", id, title, url, score, body, posted_at)
+        self.date = date
+        self.value = value
+        self.previous_value = previous_value
+        self.category = category
+
+    @property
+    def meta(self) -> str:
+        return f"category:{self.category}"
 
 
 class FREDCollector:
     """FRED API를 사용한 거시경제 지표 수집"""
 
     def __init__(self, cache: Optional[ContentCache] = None, api_key: Optional[str] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "TrendReporter/1.0"
-        })
+        }
+        self.http = get_transport()
         self.cache = cache
         self.api_key = api_key or os.getenv("FRED_API_KEY")
 
-    def collect_series(self, series_cfg: dict) -> Optional[FREDSeriesObservation]:
+    def collect_series(self, series_cfg: dict) -> Optional[FREDObservation]:
         """단일 시계열의 최신 관측치 수집"""
         if not self.api_key:
             return None
 
-        params = {
-            "series_id": series_cfg["id"],
-            "api_key": self.api_key,
-            "file_type": "json",
-            "sort_order": "desc",
-            "limit": 2,
-        }
-
         try:
-            resp = self.session.get(
+            resp = self.http.get(
                 f"{FRED_API_BASE}/series/observations",
-                params=params,
+                params=self._build_params(series_cfg),
+                headers=self.headers,
                 timeout=20,
             )
             resp.raise_for_status()
@@ -61,6 +61,20 @@ class FREDCollector:
             print(f"[FRED] {series_cfg['id']} 수집 실패: {e}")
             return None
 
+        return self._parse_observations(series_cfg, payload)
+
+    def _build_params(self, series_cfg: dict) -> dict:
+        """observations 요청 파라미터"""
+        return {
+            "series_id": series_cfg["id"],
+            "api_key": self.api_key,
+            "file_type": "json",
+            "sort_order": "desc",
+            "limit": 2,
+        }
+
+    def _parse_observations(self, series_cfg: dict, payload: dict) -> Optional[FREDObservation]:
+        """최신/직전 관측치 추출 (이미 본 관측치면 None)"""
         observations = payload.get("observations", [])
         if not observations:
             return None
@@ -69,46 +83,77 @@ class FREDCollector:
         previous = observations[1] if len(observations) > 1 else {"value": "N/A"}
 
         cache_id = f"fred_{series_cfg['id']}_{latest.get('date', '')}_{latest.get('value', '')}"
-        if self.cache and self.cache.is_seen(cache_id):
+        if self.cache and not self.cache.claim(cache_id):
             return None
 
-        if self.cache:
-            self.cache.mark_seen(cache_id)
-
-        return FREDSeriesObservation(
-            series_id=series_cfg["id"],
-            name=series_cfg.get("name", series_cfg["id"]),
-            date=latest.get("date", ""),
-            value=latest.get("value", "N/A"),
-            previous_value=previous.get("value", "N/A"),
+        series_id = series_cfg["id"]
+        date = latest.get("date", "")
+        value = latest.get("value", "N/A")
+        previous_value = previous.get("value", "N/A")
+        # URL이 없으므로 제목+본문(관측일, 값)이 저장 키
+        return FREDObservation(
+            series_id,
+            title=f"{series_cfg.get('name', series_id)} ({series_id})",
+            body=f"{date}: {value} (prev: {previous_value})",
+            date=date,
+            value=value,
+            previous_value=previous_value,
             category=series_cfg.get("category", "macro"),
         )
 
-    def collect_all(self, series: List[dict]) -> List[FREDSeriesObservation]:
+    def collect_all(self, series: List[dict]) -> List[FREDObservation]:
         """설정된 FRED 시계열 수집"""
         if not self.api_key:
             print("[FRED] FRED_API_KEY가 없어 수집을 건너뜁니다.")
             return []
 
-        results = []
-        for series_cfg in series:
-            item = self.collect_series(series_cfg)
-            if item:
-                results.append(item)
+        return self._merge_results([self.collect_series(series_cfg) for series_cfg in series])
+
+    def _merge_results(self, items: List[Optional[FREDObservation]]) -> List[FREDObservation]:
+        """새 관측치만 모아 반환"""
+        results = [item for item in items if item]
 
         print(f"[FRED] {len(results)}개 지표 수집")
         return results
 
-    def format_for_analysis(self, data: List[FREDSeriesObservation]) -> str:
+    async def collect_series_async(self, client: AsyncHTTPClient, series_cfg: dict) -> Optional[FREDObservation]:
+        """단일 시계열의 최신 관측치 수집 (비동기)"""
+        try:
+            resp = await client.get(
+                f"{FRED_API_BASE}/series/observations",
+                params=self._build_params(series_cfg),
+                headers=self.headers,
+                timeout=20,
+            )
+            resp.raise_for_status()
+            payload = resp.json()
+        except Exception as e:
+            print(f"[FRED] {series_cfg['id']} 수집 실패: {e}")
+            return None
+
+        return self._parse_observations(series_cfg, payload)
+
+    async def collect_all_async(self, client: AsyncHTTPClient, series: List[dict]) -> List[FREDObservation]:
+        """설정된 FRED 시계열을 동시에 수집"""
+        if not self.api_key:
+            print("[FRED] FRED_API_KEY가 없어 수집을 건너뜁니다.")
+            return []
+
+        items = await asyncio.gather(*(
+            self.collect_series_async(client, series_cfg) for series_cfg in series
+        ))
+        return self._merge_results(items)
+
+    def format_for_analysis(self, data: List[FREDObservation]) -> str:
         """분석용 텍스트 포맷"""
         if not data:
             return "[FRED] 새로운 경제지표 없음\n"
 
         output = ["\n## FRED Macro Data\n"]
         for i, item in enumerate(data, 1):
-            output.append(
-                f"{i}. {item.name} ({item.series_id})\n"
-                f"   Latest: {item.value} | Previous: {item.previous_value} | Date: {item.date}\n"
-            )
+            output.append(format_entry(
+                f"{i}.", item.title,
+                f"Latest: {item.value} | Previous: {item.previous_value} | Date: {item.date}",
+            ))
 
         return "\n".join(output)
@@ -1,40 +1,49 @@
-"""GDELT 문서 API 수집기"""
+"""GDELT 문서 API 수집기
+
+요청 간격(6초)과 429 대기는 http.rate_limits의 api.gdeltproject.org 설정으로
+공용 전송 계층이 호스트 단위로 처리한다.
+"""
 
-import time
-from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
-import requests
-
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
 GDELT_API_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
 
 
-@dataclass
-class GDELTArticle:
-    """GDELT 기사 데이터"""
-    title: str
-    url: str
-    source: str
-    domain: str
-    seendate: str
-    category: str
+class GDELTArticle(TrendItem):
+    """GDELT 기사 (source_name은 언론사 이름)"""
+    __slots__ = ("source_name", "domain", "seendate", "category")
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, source_name: str, domain: str, seendate: str,
+                 category: str):
+        super().__init__("GDELT", id, title, url, score, body, posted_at)
+        self.source_name = source_name
+        self.domain = domain
+        self.seendate = seendate
+        self.category = category
+
+    @property
+    def meta(self) -> str:
+        return f"domain:{self.domain}"
 
 
 class GDELTCollector:
     """GDELT DOC 2 API를 사용해 최근 기사 클러스터를 수집"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "TrendReporter/1.0"
-        })
+        }
+        self.http = get_transport()
         self.cache = cache
 
     def collect_query(
@@ -45,31 +54,35 @@ class GDELTCollector:
         timespan: str = "24h"
     ) -> List[GDELTArticle]:
         """단일 GDELT 쿼리 실행"""
-        params = {
-            "query": query,
-            "mode": "artlist",
-            "format": "json",
-            "maxrecords": max_records * 2,
-            "timespan": timespan,
-        }
+        params = self._build_params(query, max_records, timespan)
 
         payload = {}
         for attempt in range(2):
             try:
-                resp = self.session.get(GDELT_API_URL, params=params, timeout=30)
-                if resp.status_code == 429 and attempt == 0:
-                    time.sleep(6)
-                    continue
+                resp = self.http.get(GDELT_API_URL, params=params, headers=self.headers, timeout=30, retries=0)
                 resp.raise_for_status()
                 payload = resp.json()
                 break
             except Exception as e:
                 if attempt == 0:
-                    time.sleep(6)
-                    continue
+                    continue  # 재시도 간격은 속도 제한이 보장
                 print(f"[GDELT] 쿼리 실패: {e}")
                 return []
 
+        return self._parse_articles(payload, category, max_records)
+
+    def _build_params(self, query: str, max_records: int, timespan: str) -> dict:
+        """DOC API 요청 파라미터"""
+        return {
+            "query": query,
+            "mode": "artlist",
+            "format": "json",
+            "maxrecords": max_records * 2,
+            "timespan": timespan,
+        }
+
+    def _parse_articles(self, payload: dict, category: str, max_records: int) -> List[GDELTArticle]:
+        """artlist 응답을 기사 목록으로 변환 (캐시된 기사 제외)"""
         articles = []
         for item in payload.get("articles", []):
             url = item.get("url", "")
@@ -78,48 +91,90 @@ class GDELTCollector:
                 continue
 
             cache_id = f"gdelt_{url}"
-            if self.cache and self.cache.is_seen(cache_id):
+            if self.cache and not self.cache.claim(cache_id):
                 continue
 
             articles.append(GDELTArticle(
+                url,
                 title=title,
                 url=url,
-                source=item.get("sourceCommonName", ""),
+                source_name=item.get("sourceCommonName", ""),
                 domain=item.get("domain", ""),
                 seendate=item.get("seendate", ""),
                 category=category,
             ))
 
-            if self.cache:
-                self.cache.mark_seen(cache_id)
-
             if len(articles) >= max_records:
                 break
 
         return articles
 
-    def collect_all(self, queries: List[dict], max_records: int = 8, timespan: str = "24h") -> dict:
-        """쿼리 목록을 순차적으로 실행"""
-        results = {}
-
-        for index, query_cfg in enumerate(queries):
+    def _iter_queries(self, queries: List[dict]):
+        """실행할 (카테고리, 쿼리) 목록 (빈 쿼리 제외)"""
+        for query_cfg in queries:
             category = query_cfg.get("category", query_cfg.get("name", "general"))
             query = query_cfg.get("query", "").strip()
-            if not query:
-                continue
+            if query:
+                yield category, query
 
-            if index > 0:
-                time.sleep(6)
+    def _add_results(self, results: dict, category: str, articles: List[GDELTArticle]):
+        """카테고리별 결과에 기사 추가"""
+        results.setdefault(category, []).extend(articles)
+        print(f"[GDELT] {category}: {len(articles)}개 기사 수집")
 
+    def collect_all(self, queries: List[dict], max_records: int = 8, timespan: str = "24h") -> dict:
+        """쿼리 목록을 순차적으로 실행"""
+        results = {}
+        for category, query in self._iter_queries(queries):
             articles = self.collect_query(
                 query=query,
                 category=category,
                 max_records=max_records,
                 timespan=timespan,
             )
-            results.setdefault(category, []).extend(articles)
-            print(f"[GDELT] {category}: {len(articles)}개 기사 수집")
+            self._add_results(results, category, articles)
+        return results
+
+    async def collect_query_async(
+        self,
+        client: AsyncHTTPClient,
+        query: str,
+        category: str,
+        max_records: int = 8,
+        timespan: str = "24h"
+    ) -> List[GDELTArticle]:
+        """단일 GDELT 쿼리 실행 (비동기, 속도 제한 대기 중에도 다른 수집기는 진행)"""
+        params = self._build_params(query, max_records, timespan)
 
+        payload = {}
+        for attempt in range(2):
+            try:
+                resp = await client.get(GDELT_API_URL, params=params, headers=self.headers,
+                                        timeout=30, retries=0)
+                resp.raise_for_status()
+                payload = resp.json()
+                break
+            except Exception as e:
+                if attempt == 0:
+                    continue  # 재시도 간격은 속도 제한이 보장
+                print(f"[GDELT] 쿼리 실패: {e}")
+                return []
+
+        return self._parse_articles(payload, category, max_records)
+
+    async def collect_all_async(self, client: AsyncHTTPClient, queries: List[dict],
+                                max_records: int = 8, timespan: str = "24h") -> dict:
+        """쿼리 목록을 순차적으로 실행 (비동기)"""
+        results = {}
+        for category, query in self._iter_queries(queries):
+            articles = await self.collect_query_async(
+                client,
+                query=query,
+                category=category,
+                max_records=max_records,
+                timespan=timespan,
+            )
+            self._add_results(results, category, articles)
         return results
 
     def format_for_analysis(self, data: dict) -> str:
@@ -143,14 +198,13 @@ class GDELTCollector:
 
             output.append(f"\n## GDELT - {category.upper()}\n")
             for i, article in enumerate(articles[:10], 1):
-                source = article.source or article.domain or "unknown"
-                output.append(
-                    f"{i}. [{source}] {article.title}\n"
-                    f"   URL: {article.url}\n"
-                )
+                source = article.source_name or article.domain or "unknown"
                 body = extracted.get(article.url, "")
-                if body:
-                    output.append(f"   본문: {body[:500]}\n")
+                output.append(format_entry(
+                    f"{i}.", f"[{source}] {article.title}",
+                    f"URL: {article.url}",
+                    f"본문: {body[:500]}" if body else None,
+                ))
                 total += 1
 
         if total == 0:
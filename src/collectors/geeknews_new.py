@@ -1,34 +1,40 @@
 """GeekNews 새 소식 수집기"""
 
 import re
-from dataclasses import dataclass
 from html import unescape
 from typing import List, Optional
 
-import requests
-
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
 GEEKNEWS_NEW_URL = "https://news.hada.io/new"
 TOPIC_SPLIT = "<div class='topic_row'>"
 
 
-@dataclass
-class GeekNewsItem:
-    """GeekNews 최신 등록 항목"""
-    topic_id: str
-    title: str
-    source_url: str
-    source_domain: str
-    summary: str
-    points: int
-    age_text: str
-    comments_text: str
-    discussion_url: str
+class GeekNewsItem(TrendItem):
+    """GeekNews 최신 등록 항목 (원문 URL은 url, 포인트는 score, 요약은 body)"""
+    __slots__ = ("source_domain", "age_text", "discussion_url")
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, source_domain: str, age_text: str,
+                 discussion_url: str):
+        super().__init__("GeekNews", id, title, url, score, body, posted_at)
+        self.source_domain = source_domain
+        self.age_text = age_text
+        self.discussion_url = discussion_url
+
+    @property
+    def meta(self) -> str:
+        return f"domain:{self.source_domain}"
+
+    @property
+    def metrics(self) -> dict:
+        return {"points": self.score}
 
 
 class GeekNewsNewCollector:
@@ -48,11 +54,13 @@ class GeekNewsNewCollector:
     )
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "TrendReporter/1.0"
-        })
+        }
+        self.http = get_transport()
         self.cache = cache
+        # 이미 수집한(캐시된) 항목의 현재 수치. main이 item_metrics 시계열에 기록
+        self.metric_samples: List[dict] = []
 
     def _clean_text(self, text: str) -> str:
         text = re.sub(r"<[^>]+>", " ", text)
@@ -61,13 +69,29 @@ class GeekNewsNewCollector:
     def collect_all(self, limit: int = 12) -> List[GeekNewsItem]:
         """GeekNews /new 최신 등록 항목 수집"""
         try:
-            resp = self.session.get(GEEKNEWS_NEW_URL, timeout=20)
+            resp = self.http.get(GEEKNEWS_NEW_URL, headers=self.headers, timeout=20)
+            resp.raise_for_status()
+            html = resp.text
+        except Exception as e:
+            print(f"[GeekNews] 수집 실패: {e}")
+            return []
+
+        return self._parse_page(html, limit)
+
+    async def collect_all_async(self, client: AsyncHTTPClient, limit: int = 12) -> List[GeekNewsItem]:
+        """GeekNews /new 최신 등록 항목 수집 (비동기)"""
+        try:
+            resp = await client.get(GEEKNEWS_NEW_URL, headers=self.headers, timeout=20)
             resp.raise_for_status()
             html = resp.text
         except Exception as e:
             print(f"[GeekNews] 수집 실패: {e}")
             return []
 
+        return self._parse_page(html, limit)
+
+    def _parse_page(self, html: str, limit: int) -> List[GeekNewsItem]:
+        """/new 페이지 HTML 파싱 (캐시된 항목 제외)"""
         items: List[GeekNewsItem] = []
         parts = html.split(TOPIC_SPLIT)[1:]
 
@@ -82,25 +106,23 @@ class GeekNewsNewCollector:
             discussion_path, raw_summary = desc_match.groups()
             topic_id, points, age_text, comments_path = info_match.groups()
 
-            cache_id = f"geeknews_{topic_id}"
-            if self.cache and self.cache.is_seen(cache_id):
-                continue
-
             item = GeekNewsItem(
-                topic_id=topic_id,
+                topic_id,
                 title=self._clean_text(raw_title),
-                source_url=source_url,
+                url=source_url,
+                score=int(points),
+                body=self._clean_text(raw_summary)[:400],
                 source_domain=self._clean_text(domain),
-                summary=self._clean_text(raw_summary)[:400],
-                points=int(points),
                 age_text=self._clean_text(age_text),
-                comments_text="댓글과 토론",
                 discussion_url=f"https://news.hada.io/{discussion_path}",
             )
-            items.append(item)
 
-            if self.cache:
-                self.cache.mark_seen(cache_id)
+            # 캐시된 항목은 수치만 기록하고 스킵
+            if self.cache and not self.cache.claim(f"geeknews_{topic_id}"):
+                self.metric_samples.append(item.metric_sample())
+                continue
+
+            items.append(item)
 
             if len(items) >= limit:
                 break
@@ -115,12 +137,12 @@ class GeekNewsNewCollector:
 
         output = ["\n## GeekNews New\n"]
         for i, item in enumerate(data, 1):
-            output.append(
-                f"{i}. [{item.source_domain}] {item.title}\n"
-                f"   Points: {item.points} | Age: {item.age_text}\n"
-                f"   Summary: {item.summary[:220]}\n"
-                f"   Source: {item.source_url}\n"
-                f"   Discussion: {item.discussion_url}\n"
-            )
+            output.append(format_entry(
+                f"{i}.", f"[{item.source_domain}] {item.title}",
+                f"Points: {item.score} | Age: {item.age_text}",
+                f"Summary: {item.body[:220]}",
+                f"Source: {item.url}",
+                f"Discussion: {item.discussion_url}",
+            ))
 
         return "\n".join(output)
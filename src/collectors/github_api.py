@@ -1,69 +1,87 @@
 """GitHub 공식 API 기반 최근 저장소 수집기"""
 
 import os
-from dataclasses import dataclass
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
-import requests
-
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
 GITHUB_API_BASE = "https://api.github.com"
 
 
-@dataclass
-class GitHubRepo:
-    """GitHub 검색 결과 저장소"""
-    full_name: str
-    description: str
-    language: str
-    stars: int
-    updated_at: str
-    url: str
-    query_name: str
+class GitHubRepo(TrendItem):
+    """GitHub 검색 결과 저장소 (full_name은 title, 스타는 score, 설명은 body)"""
+    __slots__ = ("language", "updated_at", "query_name")
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, language: str, updated_at: str,
+                 query_name: str):
+        super().__init__("GitHub API", id, title, url, score, body, posted_at)
+        self.language = language
+        self.updated_at = updated_at
+        self.query_name = query_name
+
+    @property
+    def meta(self) -> str:
+        return f"lang:{self.language} query:{self.query_name}"
+
+    @property
+    def metrics(self) -> dict:
+        return {"stars": self.score}
 
 
 class GitHubAPICollector:
     """GitHub Search API를 사용한 최근 활발한 저장소 수집"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        headers = {
+        self.headers = {
             "Accept": "application/vnd.github+json",
             "User-Agent": "TrendReporter/1.0",
         }
         token = os.getenv("GITHUB_TOKEN")
         if token:
-            headers["Authorization"] = f"Bearer {token}"
-        self.session.headers.update(headers)
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.http = get_transport()
         self.cache = cache
 
-    def collect_query(self, query_cfg: dict, days_back: int = 7, per_query: int = 5) -> List[GitHubRepo]:
-        """단일 GitHub 검색 쿼리 실행"""
+    def _build_params(self, query_cfg: dict, days_back: int, per_query: int) -> Optional[dict]:
+        """검색 요청 파라미터 (쿼리가 비어 있으면 None)"""
         cutoff = (datetime.now(timezone.utc) - timedelta(days=days_back)).strftime("%Y-%m-%d")
         base_query = query_cfg.get("query", "").strip()
         if not base_query:
-            return []
+            return None
 
-        params = {
+        return {
             "q": f"{base_query} pushed:>={cutoff}",
             "sort": "stars",
             "order": "desc",
             "per_page": per_query * 2,
         }
 
+    def collect_query(self, query_cfg: dict, days_back: int = 7, per_query: int = 5) -> List[GitHubRepo]:
+        """단일 GitHub 검색 쿼리 실행"""
+        params = self._build_params(query_cfg, days_back, per_query)
+        if params is None:
+            return []
+
         try:
-            resp = self.session.get(f"{GITHUB_API_BASE}/search/repositories", params=params, timeout=20)
+            resp = self.http.get(f"{GITHUB_API_BASE}/search/repositories", params=params, headers=self.headers, timeout=20)
             resp.raise_for_status()
             payload = resp.json()
         except Exception as e:
             print(f"[GitHub API] {query_cfg.get('name', 'query')} 수집 실패: {e}")
             return []
 
+        return self._parse_repos(payload, query_cfg, per_query)
+
+    def _parse_repos(self, payload: dict, query_cfg: dict, per_query: int) -> List[GitHubRepo]:
+        """검색 결과를 저장소 목록으로 변환 (캐시된 저장소 제외)"""
         repos = []
         for item in payload.get("items", []):
             full_name = item.get("full_name", "")
@@ -71,22 +89,20 @@ class GitHubAPICollector:
                 continue
 
             cache_id = f"gh_api_{full_name}"
-            if self.cache and self.cache.is_seen(cache_id):
+            if self.cache and not self.cache.claim(cache_id):
                 continue
 
             repos.append(GitHubRepo(
-                full_name=full_name,
-                description=item.get("description", "") or "",
+                full_name,
+                title=full_name,
+                url=item.get("html_url", ""),
+                score=item.get("stargazers_count", 0),
+                body=item.get("description", "") or "",
                 language=item.get("language", "") or "",
-                stars=item.get("stargazers_count", 0),
                 updated_at=item.get("updated_at", ""),
-                url=item.get("html_url", ""),
                 query_name=query_cfg.get("name", "general"),
             ))
 
-            if self.cache:
-                self.cache.mark_seen(cache_id)
-
             if len(repos) >= per_query:
                 break
 
@@ -94,11 +110,17 @@ class GitHubAPICollector:
 
     def collect_all(self, queries: List[dict], days_back: int = 7, per_query: int = 5) -> dict:
         """쿼리별 저장소 검색"""
+        return self._merge_results(queries, [
+            self.collect_query(query_cfg, days_back=days_back, per_query=per_query)
+            for query_cfg in queries
+        ])
+
+    def _merge_results(self, queries: List[dict], repo_lists: List[List[GitHubRepo]]) -> dict:
+        """쿼리 이름별 결과 구성"""
         results = {}
         total = 0
-        for query_cfg in queries:
+        for query_cfg, repos in zip(queries, repo_lists):
             name = query_cfg.get("name", "general")
-            repos = self.collect_query(query_cfg, days_back=days_back, per_query=per_query)
             results[name] = repos
             total += len(repos)
             print(f"[GitHub API] {name}: {len(repos)}개 저장소 수집")
@@ -106,6 +128,35 @@ class GitHubAPICollector:
         print(f"[GitHub API] 총 {total}개 저장소 수집")
         return results
 
+    async def _fetch_query_async(self, client: AsyncHTTPClient, query_cfg: dict,
+                                 days_back: int, per_query: int) -> Optional[dict]:
+        """단일 검색 쿼리 응답 가져오기 (비동기)"""
+        params = self._build_params(query_cfg, days_back, per_query)
+        if params is None:
+            return None
+
+        try:
+            resp = await client.get(f"{GITHUB_API_BASE}/search/repositories",
+                                    params=params, headers=self.headers, timeout=20)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception as e:
+            print(f"[GitHub API] {query_cfg.get('name', 'query')} 수집 실패: {e}")
+            return None
+
+    async def collect_all_async(self, client: AsyncHTTPClient, queries: List[dict],
+                                days_back: int = 7, per_query: int = 5) -> dict:
+        """쿼리별 저장소 검색 (비동기, 모든 쿼리를 동시에 요청)"""
+        payloads = await asyncio.gather(*(
+            self._fetch_query_async(client, query_cfg, days_back, per_query)
+            for query_cfg in queries
+        ))
+
+        return self._merge_results(queries, [
+            self._parse_repos(payload, query_cfg, per_query) if payload else []
+            for query_cfg, payload in zip(queries, payloads)
+        ])
+
     def format_for_analysis(self, data: dict) -> str:
         """분석용 텍스트 포맷"""
         output = []
@@ -117,12 +168,12 @@ class GitHubAPICollector:
 
             output.append(f"\n## GitHub Search API - {name.upper()}\n")
             for i, repo in enumerate(repos[:5], 1):
-                output.append(
-                    f"{i}. {repo.full_name}\n"
-                    f"   Stars: {repo.stars:,} | Language: {repo.language or 'N/A'} | Updated: {repo.updated_at}\n"
-                    f"   {repo.description[:200]}\n"
-                    f"   URL: {repo.url}\n"
-                )
+                output.append(format_entry(
+                    f"{i}.", repo.title,
+                    f"Stars: {repo.score:,} | Language: {repo.language or 'N/A'} | Updated: {repo.updated_at}",
+                    repo.body[:200],
+                    f"URL: {repo.url}",
+                ))
                 total += 1
 
         if total == 0:
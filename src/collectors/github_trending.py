@@ -2,36 +2,47 @@
 
 import os
 import re
-import requests
+import asyncio
 from typing import List, Optional
-from dataclasses import dataclass
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
-@dataclass
-class TrendingRepo:
-    """GitHub Trending 레포지토리 데이터"""
-    name: str
-    description: str
-    language: str
-    stars: int
-    stars_today: int
-    forks: int
-    url: str
+class TrendingRepo(TrendItem):
+    """GitHub Trending 레포 (전체 이름은 title, 전체 스타는 score, 설명은 body)"""
+    __slots__ = ("language", "stars_today", "forks")
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, language: str, stars_today: int, forks: int):
+        super().__init__("GitHub Trending", id, title, url, score, body, posted_at)
+        self.language = language
+        self.stars_today = stars_today
+        self.forks = forks
+
+    @property
+    def meta(self) -> str:
+        return f"lang:{self.language} today:+{self.stars_today}"
+
+    @property
+    def metrics(self) -> dict:
+        return {"stars": self.score, "forks": self.forks, "stars_today": self.stars_today}
 
 
 class GitHubTrendingCollector:
     """GitHub Trending 페이지에서 인기 레포를 수집하는 클래스"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        }
+        self.http = get_transport()
         self.cache = cache
+        # 이미 수집한(캐시된) 항목의 현재 수치. main이 item_metrics 시계열에 기록
+        self.metric_samples: List[dict] = []
 
     def _parse_number(self, text: str) -> int:
         """숫자 파싱 (1,234 -> 1234, 1.2k -> 1200)"""
@@ -56,13 +67,17 @@ class GitHubTrendingCollector:
         url = f"https://github.com/trending/{language}?since={since}"
 
         try:
-            resp = self.session.get(url, timeout=15)
+            resp = self.http.get(url, headers=self.headers, timeout=15)
             resp.raise_for_status()
             html = resp.text
         except Exception as e:
             print(f"[GitHub] Trending 페이지 요청 실패: {e}")
             return []
 
+        return self._parse_trending(html, limit)
+
+    def _parse_trending(self, html: str, limit: int) -> List[TrendingRepo]:
+        """Trending 페이지 HTML에서 레포 목록 추출 (캐시된 레포 제외)"""
         repos = []
 
         # 각 레포 article 태그 파싱
@@ -81,11 +96,6 @@ class GitHubTrendingCollector:
 
                 full_name = name_match.group(1).strip()
 
-                # 캐시된 레포 스킵
-                repo_id = f"gh_{full_name}"
-                if self.cache and self.cache.is_seen(repo_id):
-                    continue
-
                 # 설명
                 desc_match = re.search(r'<p class="[^"]*col-9[^"]*"[^>]*>(.*?)</p>', repo_html, re.DOTALL)
                 description = ""
@@ -112,19 +122,23 @@ class GitHubTrendingCollector:
                 forks_match = re.search(r'href="/[^/]+/[^/]+/forks"[^>]*>\s*<[^>]+>\s*</[^>]+>\s*([\d,]+)', repo_html)
                 forks = self._parse_number(forks_match.group(1)) if forks_match else 0
 
-                repos.append(TrendingRepo(
-                    name=full_name,
-                    description=description[:200] if description else "",
+                repo = TrendingRepo(
+                    full_name,
+                    title=full_name,
+                    url=f"https://github.com/{full_name}",
+                    score=stars,
+                    body=description[:200] if description else "",
                     language=language,
-                    stars=stars,
                     stars_today=stars_today,
                     forks=forks,
-                    url=f"https://github.com/{full_name}"
-                ))
+                )
+
+                # 캐시된 레포는 수치만 기록하고 스킵
+                if self.cache and not self.cache.claim(f"gh_{full_name}"):
+                    self.metric_samples.append(repo.metric_sample())
+                    continue
 
-                # 캐시에 추가
-                if self.cache:
-                    self.cache.mark_seen(repo_id)
+                repos.append(repo)
 
             except Exception as e:
                 continue
@@ -138,7 +152,35 @@ class GitHubTrendingCollector:
             "python": self.collect_trending(language="python", limit=5),
             "typescript": self.collect_trending(language="typescript", limit=5),
         }
+        return self._merge_results(results)
+
+    async def _fetch_trending_async(self, client: AsyncHTTPClient, language: str, since: str = "daily") -> str:
+        """Trending 페이지 HTML 가져오기 (비동기)"""
+        url = f"https://github.com/trending/{language}?since={since}"
+        try:
+            resp = await client.get(url, headers=self.headers, timeout=15)
+            resp.raise_for_status()
+            return resp.text
+        except Exception as e:
+            print(f"[GitHub] Trending 페이지 요청 실패: {e}")
+            return ""
+
+    async def collect_all_async(self, client: AsyncHTTPClient, limit: int = 15) -> dict:
+        """전체/언어별 트렌딩 페이지를 동시에 요청 후 순서대로 파싱"""
+        pages = await asyncio.gather(
+            self._fetch_trending_async(client, ""),
+            self._fetch_trending_async(client, "python"),
+            self._fetch_trending_async(client, "typescript"),
+        )
+        results = {
+            "all": self._parse_trending(pages[0], limit),
+            "python": self._parse_trending(pages[1], 5),
+            "typescript": self._parse_trending(pages[2], 5),
+        }
+        return self._merge_results(results)
 
+    def _merge_results(self, results: dict) -> dict:
+        """수집 결과 집계 출력 후 반환"""
         total = sum(len(v) for v in results.values())
         print(f"[GitHub] 총 {total}개 트렌딩 레포 수집")
 
@@ -157,25 +199,25 @@ class GitHubTrendingCollector:
         for i, repo in enumerate(all_repos[:10], 1):
             lang_str = f"[{repo.language}] " if repo.language else ""
             stars_today_str = f" (+{repo.stars_today} today)" if repo.stars_today else ""
-            output.append(
-                f"{i}. {lang_str}{repo.name}\n"
-                f"   {repo.description}\n"
-                f"   Stars: {repo.stars:,}{stars_today_str}\n"
-                f"   {repo.url}\n"
-            )
+            output.append(format_entry(
+                f"{i}.", f"{lang_str}{repo.title}",
+                repo.body,
+                f"Stars: {repo.score:,}{stars_today_str}",
+                repo.url,
+            ))
 
         # Python 트렌딩
         python_repos = data.get("python", [])
         if python_repos:
             output.append("\n### Python 트렌딩\n")
             for repo in python_repos[:3]:
-                output.append(f"- {repo.name}: {repo.description[:100]}\n")
+                output.append(f"- {repo.title}: {repo.body[:100]}\n")
 
         # TypeScript 트렌딩
         ts_repos = data.get("typescript", [])
         if ts_repos:
             output.append("\n### TypeScript 트렌딩\n")
             for repo in ts_repos[:3]:
-                output.append(f"- {repo.name}: {repo.description[:100]}\n")
+                output.append(f"- {repo.title}: {repo.body[:100]}\n")
 
         return "\n".join(output)
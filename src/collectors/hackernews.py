@@ -1,43 +1,50 @@
 """Hacker News 데이터 수집기"""
 
 import os
-import requests
-from typing import List, Optional
-from dataclasses import dataclass
-from datetime import datetime
+import asyncio
+from typing import Iterable, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry, unique
 
 
 HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
 
 
-@dataclass
-class HNStory:
-    """Hacker News 스토리 데이터"""
-    id: int
-    title: str
-    url: str
-    score: int
-    num_comments: int
-    author: str
-    created_utc: datetime
+class HNStory(TrendItem):
+    """Hacker News 스토리"""
+    __slots__ = ("num_comments", "author")
+
+    def __init__(self, id: int, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, num_comments: int, author: str):
+        super().__init__("Hacker News", id, title, url, score, body, posted_at)
+        self.num_comments = num_comments
+        self.author = author
+
+    @property
+    def meta(self) -> str:
+        return f"comments:{self.num_comments} by:{self.author}"
+
+    @property
+    def metrics(self) -> dict:
+        return {"score": self.score, "comments": self.num_comments}
 
 
 class HackerNewsCollector:
     """Hacker News API를 사용하여 스토리를 수집하는 클래스"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
+        self.http = get_transport()
         self.cache = cache
 
     def _fetch_item(self, item_id: int) -> Optional[dict]:
         """단일 아이템 가져오기"""
         try:
-            resp = self.session.get(f"{HN_API_BASE}/item/{item_id}.json", timeout=10)
+            resp = self.http.get(f"{HN_API_BASE}/item/{item_id}.json", timeout=10)
             resp.raise_for_status()
             return resp.json()
         except Exception:
@@ -46,13 +53,68 @@ class HackerNewsCollector:
     def _fetch_story_ids(self, endpoint: str, limit: int) -> List[int]:
         """스토리 ID 목록 가져오기"""
         try:
-            resp = self.session.get(f"{HN_API_BASE}/{endpoint}.json", timeout=10)
-            resp.raise_for_status()
-            return resp.json()[:limit * 2]  # 캐시 고려해 더 가져옴
+            resp = self.http.get(f"{HN_API_BASE}/{endpoint}.json", timeout=10, revalidate=True)
+            return self._read_story_ids(resp, limit)
         except Exception as e:
             print(f"[HN] {endpoint} ID 목록 가져오기 실패: {e}")
             return []
 
+    def _read_story_ids(self, resp, limit: int) -> List[int]:
+        """ID 목록 응답에서 확인할 ID 추출 (동기/비동기 공용)
+
+        304여도 전송 계층이 저장된 본문을 채워 주므로 200과 같이 읽는다.
+        이전 실행에서 확정되지 않은 스토리가 있을 수 있으므로 목록을 비우지 않고
+        _unseen_ids가 걸러내게 둔다.
+        """
+        resp.raise_for_status()
+        return resp.json()[:limit * 2]  # 캐시 고려해 더 가져옴
+
+    def _unseen_ids(self, story_ids: List[int]) -> List[int]:
+        """이미 본 스토리는 아이템 요청 전에 제외 (목록 단위로 한 번에 확인)"""
+        if not self.cache:
+            return story_ids
+        unseen = set(self.cache.filter_unseen([f"hn_{sid}" for sid in story_ids]))
+        return [sid for sid in story_ids if f"hn_{sid}" in unseen]
+
+    def _parse_item(self, item: Optional[dict]) -> Optional[HNStory]:
+        """아이템 JSON을 스토리로 변환 (캐시된 스토리는 None)"""
+        if not item or item.get("type") != "story":
+            return None
+
+        # 캐시된 스토리 스킵
+        story_id = f"hn_{item['id']}"
+        if self.cache and not self.cache.claim(story_id):
+            return None
+
+        # URL이 없는 Ask HN 등도 포함
+        url = item.get("url", f"https://news.ycombinator.com/item?id={item['id']}")
+
+        return HNStory(
+            item["id"],
+            title=item.get("title", ""),
+            url=url,
+            score=item.get("score", 0),
+            posted_at=float(item.get("time", 0)),
+            num_comments=item.get("descendants", 0),
+            author=item.get("by", "unknown"),
+        )
+
+    def _select_stories(self, items: Iterable[Optional[dict]], limit: int) -> List[HNStory]:
+        """아이템 JSON을 도착 순서대로 스토리로 변환해 limit개까지 모은 뒤 점수순 정렬"""
+        stories = []
+        for item in items:
+            story = self._parse_item(item)
+            if not story:
+                continue
+            stories.append(story)
+
+            if len(stories) >= limit:
+                break
+
+        # 점수 기준 정렬
+        stories.sort(key=lambda x: x.score, reverse=True)
+        return stories
+
     def collect_stories(
         self,
         story_type: str = "top",
@@ -60,50 +122,12 @@ class HackerNewsCollector:
     ) -> List[HNStory]:
         """스토리 수집 (top, best, new)"""
         endpoint = f"{story_type}stories"
-        story_ids = self._fetch_story_ids(endpoint, limit)
-
-        stories = []
+        story_ids = self._unseen_ids(self._fetch_story_ids(endpoint, limit))
 
         # 병렬로 스토리 가져오기
         with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_id = {
-                executor.submit(self._fetch_item, sid): sid
-                for sid in story_ids
-            }
-
-            for future in as_completed(future_to_id):
-                item = future.result()
-                if not item or item.get("type") != "story":
-                    continue
-
-                # 캐시된 스토리 스킵
-                story_id = f"hn_{item['id']}"
-                if self.cache and self.cache.is_seen(story_id):
-                    continue
-
-                # URL이 없는 Ask HN 등도 포함
-                url = item.get("url", f"https://news.ycombinator.com/item?id={item['id']}")
-
-                stories.append(HNStory(
-                    id=item["id"],
-                    title=item.get("title", ""),
-                    url=url,
-                    score=item.get("score", 0),
-                    num_comments=item.get("descendants", 0),
-                    author=item.get("by", "unknown"),
-                    created_utc=datetime.fromtimestamp(item.get("time", 0))
-                ))
-
-                # 캐시에 추가
-                if self.cache:
-                    self.cache.mark_seen(story_id)
-
-                if len(stories) >= limit:
-                    break
-
-        # 점수 기준 정렬
-        stories.sort(key=lambda x: x.score, reverse=True)
-        return stories
+            futures = [executor.submit(self._fetch_item, sid) for sid in story_ids]
+            return self._select_stories((future.result() for future in as_completed(futures)), limit)
 
     def collect_all(self, top_limit: int = 30, best_limit: int = 20) -> dict:
         """top과 best 스토리 모두 수집"""
@@ -111,16 +135,57 @@ class HackerNewsCollector:
             "top": self.collect_stories("top", top_limit),
             "best": self.collect_stories("best", best_limit)
         }
+        return self._merge_results(results)
 
+    def _merge_results(self, results: dict) -> dict:
+        """best에서 top 중복 제거 후 결과 반환"""
         # 중복 제거 (best에서 top에 있는 것 제외)
-        top_ids = {s.id for s in results["top"]}
-        results["best"] = [s for s in results["best"] if s.id not in top_ids]
+        results["best"] = unique(results["best"], exclude=results["top"])
 
         total = len(results["top"]) + len(results["best"])
         print(f"[HN] 총 {total}개 새 스토리 수집")
 
         return results
 
+    async def _fetch_item_async(self, client: AsyncHTTPClient, item_id: int) -> Optional[dict]:
+        """단일 아이템 가져오기 (비동기)"""
+        try:
+            resp = await client.get(f"{HN_API_BASE}/item/{item_id}.json", timeout=10)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception:
+            return None
+
+    async def _fetch_story_ids_async(self, client: AsyncHTTPClient, endpoint: str, limit: int) -> List[int]:
+        """스토리 ID 목록 가져오기 (비동기)"""
+        try:
+            resp = await client.get(f"{HN_API_BASE}/{endpoint}.json", timeout=10, revalidate=True)
+            return self._read_story_ids(resp, limit)
+        except Exception as e:
+            print(f"[HN] {endpoint} ID 목록 가져오기 실패: {e}")
+            return []
+
+    async def collect_stories_async(
+        self,
+        client: AsyncHTTPClient,
+        story_type: str = "top",
+        limit: int = 30
+    ) -> List[HNStory]:
+        """스토리 수집 (비동기, 아이템 요청을 한 번에 발행)"""
+        endpoint = f"{story_type}stories"
+        story_ids = self._unseen_ids(await self._fetch_story_ids_async(client, endpoint, limit))
+
+        items = await asyncio.gather(*(self._fetch_item_async(client, sid) for sid in story_ids))
+        return self._select_stories(items, limit)  # ID 목록 순서대로 처리
+
+    async def collect_all_async(self, client: AsyncHTTPClient, top_limit: int = 30, best_limit: int = 20) -> dict:
+        """top과 best 스토리 모두 수집 (비동기)"""
+        results = {
+            "top": await self.collect_stories_async(client, "top", top_limit),
+            "best": await self.collect_stories_async(client, "best", best_limit),
+        }
+        return self._merge_results(results)
+
     def format_for_analysis(self, data: dict) -> str:
         """분석을 위한 텍스트 포맷 (상위 기사는 본문 핵심 문장 포함)"""
         from article_extractor import extract_batch
@@ -143,13 +208,12 @@ class HackerNewsCollector:
         extracted = extract_batch(extract_urls, max_sentences=3, timeout=5) if extract_urls else {}
 
         for i, story in enumerate(top_stories, 1):
-            output.append(
-                f"{i}. {story.title}\n"
-                f"   Score: {story.score} | Comments: {story.num_comments}\n"
-                f"   URL: {story.url}\n"
-            )
             body = extracted.get(story.url, "")
-            if body:
-                output.append(f"   본문: {body[:500]}\n")
+            output.append(format_entry(
+                f"{i}.", story.title,
+                f"Score: {story.score} | Comments: {story.num_comments}",
+                f"URL: {story.url}",
+                f"본문: {body[:500]}" if body else None,
+            ))
 
         return "\n".join(output)
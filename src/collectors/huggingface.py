@@ -1,137 +1,147 @@
 """Hugging Face 트렌딩 모델 수집기"""
 
 import os
-import requests
+import asyncio
 from typing import List, Optional
-from dataclasses import dataclass
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry, unique
 
 
 HF_API_BASE = "https://huggingface.co/api"
 
 
-@dataclass
-class HFModel:
-    """Hugging Face 모델 데이터"""
-    id: str
-    author: str
-    name: str
-    downloads: int
-    likes: int
-    pipeline_tag: str
-    tags: List[str]
-    url: str
+class HFModel(TrendItem):
+    """Hugging Face 모델 (모델 ID는 title, 다운로드 수는 score)"""
+    __slots__ = ("author", "name", "likes", "pipeline_tag", "tags")
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, author: str, name: str, likes: int,
+                 pipeline_tag: str, tags: List[str]):
+        super().__init__("Hugging Face", id, title, url, score, body, posted_at)
+        self.author = author
+        self.name = name
+        self.likes = likes
+        self.pipeline_tag = pipeline_tag
+        self.tags = tags
+
+    @property
+    def meta(self) -> str:
+        return f"likes:{self.likes} pipeline:{self.pipeline_tag}"
+
+    @property
+    def metrics(self) -> dict:
+        return {"downloads": self.score, "likes": self.likes}
 
 
 class HuggingFaceCollector:
     """Hugging Face Hub에서 트렌딩 모델을 수집하는 클래스"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
+        self.http = get_transport()
         self.cache = cache
+        # 이미 수집한(캐시된) 항목의 현재 수치. main이 item_metrics 시계열에 기록
+        self.metric_samples: List[dict] = []
 
     def collect_trending_models(self, limit: int = 15) -> List[HFModel]:
         """트렌딩 모델 수집 (다운로드순)"""
-        url = f"{HF_API_BASE}/models"
-        params = {
-            "sort": "downloads",
-            "direction": -1,
-            "limit": limit * 2,  # 캐시 고려
-            "full": "true"
-        }
-
         try:
-            resp = self.session.get(url, params=params, timeout=15)
+            resp = self.http.get(f"{HF_API_BASE}/models", params=self._trending_params(limit), timeout=15,
+                                 revalidate=True)
+            # 304도 저장된 본문으로 파싱 (본 모델은 claim이 제외하고 수치만 기록)
             resp.raise_for_status()
             data = resp.json()
         except Exception as e:
             print(f"[HuggingFace] 모델 목록 요청 실패: {e}")
             return []
 
+        return self._parse_trending(data, limit)
+
+    def _trending_params(self, limit: int) -> dict:
+        """다운로드순 목록 요청 파라미터"""
+        return {
+            "sort": "downloads",
+            "direction": -1,
+            "limit": limit * 2,  # 캐시 고려
+            "full": "true"
+        }
+
+    def _recent_params(self, limit: int) -> dict:
+        """최근 수정순 목록 요청 파라미터"""
+        return {
+            "sort": "lastModified",
+            "direction": -1,
+            "limit": limit * 3,
+            "full": "true"
+        }
+
+    def _parse_trending(self, data: list, limit: int) -> List[HFModel]:
+        """다운로드순 모델 목록 변환 (캐시된 모델 제외)"""
         models = []
         for item in data:
-            model_id = item.get("id", "")
+            model = self._model(item)
 
-            # 캐시된 모델 스킵
-            cache_id = f"hf_{model_id}"
-            if self.cache and self.cache.is_seen(cache_id):
+            # 캐시된 모델은 수치만 기록하고 스킵
+            if self.cache and not self.cache.claim(f"hf_{model.id}"):
+                self.metric_samples.append(model.metric_sample())
                 continue
 
-            # author/name 분리
-            parts = model_id.split("/")
-            author = parts[0] if len(parts) > 1 else ""
-            name = parts[-1]
-
-            models.append(HFModel(
-                id=model_id,
-                author=author,
-                name=name,
-                downloads=item.get("downloads", 0),
-                likes=item.get("likes", 0),
-                pipeline_tag=item.get("pipeline_tag", ""),
-                tags=item.get("tags", [])[:5],
-                url=f"https://huggingface.co/{model_id}"
-            ))
-
-            # 캐시에 추가
-            if self.cache:
-                self.cache.mark_seen(cache_id)
+            models.append(model)
 
             if len(models) >= limit:
                 break
 
         return models
 
+    def _model(self, item: dict) -> HFModel:
+        """API 모델 항목 변환 (id는 trending/recent 공통 모델 ID)"""
+        model_id = item.get("id", "")
+
+        # author/name 분리
+        parts = model_id.split("/")
+        return HFModel(
+            model_id,
+            title=model_id,
+            url=f"https://huggingface.co/{model_id}",
+            score=item.get("downloads", 0),
+            author=parts[0] if len(parts) > 1 else "",
+            name=parts[-1],
+            likes=item.get("likes", 0),
+            pipeline_tag=item.get("pipeline_tag", ""),
+            tags=item.get("tags", [])[:5],
+        )
+
     def collect_recent_models(self, limit: int = 10) -> List[HFModel]:
         """최근 업데이트된 인기 모델 수집"""
-        url = f"{HF_API_BASE}/models"
-        params = {
-            "sort": "lastModified",
-            "direction": -1,
-            "limit": limit * 3,
-            "full": "true"
-        }
-
         try:
-            resp = self.session.get(url, params=params, timeout=15)
+            resp = self.http.get(f"{HF_API_BASE}/models", params=self._recent_params(limit), timeout=15,
+                                 revalidate=True)
             resp.raise_for_status()
             data = resp.json()
         except Exception as e:
             print(f"[HuggingFace] 최근 모델 요청 실패: {e}")
             return []
 
+        return self._parse_recent(data, limit)
+
+    def _parse_recent(self, data: list, limit: int) -> List[HFModel]:
+        """최근 모델 목록 변환 (다운로드 1000 미만/캐시된 모델 제외)"""
         models = []
         for item in data:
             # 다운로드가 일정 수 이상인 것만
             if item.get("downloads", 0) < 1000:
                 continue
 
-            model_id = item.get("id", "")
+            model = self._model(item)
 
-            cache_id = f"hf_recent_{model_id}"
-            if self.cache and self.cache.is_seen(cache_id):
+            if self.cache and not self.cache.claim(f"hf_recent_{model.id}"):
+                self.metric_samples.append(model.metric_sample())
                 continue
 
-            parts = model_id.split("/")
-            author = parts[0] if len(parts) > 1 else ""
-            name = parts[-1]
-
-            models.append(HFModel(
-                id=model_id,
-                author=author,
-                name=name,
-                downloads=item.get("downloads", 0),
-                likes=item.get("likes", 0),
-                pipeline_tag=item.get("pipeline_tag", ""),
-                tags=item.get("tags", [])[:5],
-                url=f"https://huggingface.co/{model_id}"
-            ))
-
-            if self.cache:
-                self.cache.mark_seen(cache_id)
+            models.append(model)
 
             if len(models) >= limit:
                 break
@@ -144,10 +154,34 @@ class HuggingFaceCollector:
             "trending": self.collect_trending_models(trending_limit),
             "recent": self.collect_recent_models(recent_limit)
         }
+        return self._merge_results(results)
+
+    async def _fetch_models_async(self, client: AsyncHTTPClient, params: dict, label: str) -> list:
+        """모델 목록 가져오기 (비동기, 실패 시 빈 목록)"""
+        try:
+            resp = await client.get(f"{HF_API_BASE}/models", params=params, timeout=15, revalidate=True)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception as e:
+            print(f"[HuggingFace] {label} 요청 실패: {e}")
+            return []
+
+    async def collect_all_async(self, client: AsyncHTTPClient, trending_limit: int = 10, recent_limit: int = 5) -> dict:
+        """트렌딩과 최근 모델 목록을 동시에 요청"""
+        trending_data, recent_data = await asyncio.gather(
+            self._fetch_models_async(client, self._trending_params(trending_limit), "모델 목록"),
+            self._fetch_models_async(client, self._recent_params(recent_limit), "최근 모델"),
+        )
+        results = {
+            "trending": self._parse_trending(trending_data, trending_limit),
+            "recent": self._parse_recent(recent_data, recent_limit),
+        }
+        return self._merge_results(results)
 
+    def _merge_results(self, results: dict) -> dict:
+        """recent에서 trending 중복 제거 후 결과 반환"""
         # 중복 제거
-        trending_ids = {m.id for m in results["trending"]}
-        results["recent"] = [m for m in results["recent"] if m.id not in trending_ids]
+        results["recent"] = unique(results["recent"], exclude=results["trending"])
 
         total = len(results["trending"]) + len(results["recent"])
         print(f"[HuggingFace] 총 {total}개 모델 수집")
@@ -168,18 +202,16 @@ class HuggingFaceCollector:
             output.append("### 인기 AI 모델 (다운로드 순)\n")
             for i, model in enumerate(trending[:8], 1):
                 pipeline = f"[{model.pipeline_tag}] " if model.pipeline_tag else ""
-                output.append(
-                    f"{i}. {pipeline}{model.id}\n"
-                    f"   Downloads: {model.downloads:,} | Likes: {model.likes:,}\n"
-                    f"   Tags: {', '.join(model.tags[:3])}\n"
-                )
+                output.append(format_entry(
+                    f"{i}.", f"{pipeline}{model.title}",
+                    f"Downloads: {model.score:,} | Likes: {model.likes:,}",
+                    f"Tags: {', '.join(model.tags[:3])}",
+                ))
 
         if recent:
             output.append("\n### 최근 업데이트된 모델\n")
             for model in recent[:5]:
                 pipeline = f"[{model.pipeline_tag}] " if model.pipeline_tag else ""
-                output.append(
-                    f"- {pipeline}{model.id} (Downloads: {model.downloads:,})\n"
-                )
+                output.append(format_entry("-", f"{pipeline}{model.title} (Downloads: {model.score:,})"))
 
         return "\n".join(output)
@@ -1,41 +1,52 @@
 """Lobste.rs 데이터 수집기"""
 
 import os
-import requests
+import asyncio
 from typing import List, Optional
-from dataclasses import dataclass
 from datetime import datetime
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry, unique
 
 
 LOBSTERS_BASE = "https://lobste.rs"
 
 
-@dataclass
-class LobstersStory:
-    """Lobste.rs 스토리 데이터"""
-    id: str
-    title: str
-    url: str
-    score: int
-    comment_count: int
-    tags: List[str]
-    author: str
-    created_at: datetime
+class LobstersStory(TrendItem):
+    """Lobste.rs 스토리"""
+    __slots__ = ("comment_count", "tags", "author")
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, comment_count: int, tags: List[str],
+                 author: str):
+        super().__init__("Lobste.rs", id, title, url, score, body, posted_at)
+        self.comment_count = comment_count
+        self.tags = tags
+        self.author = author
+
+    @property
+    def meta(self) -> str:
+        return f"tags:{','.join(self.tags[:3])} comments:{self.comment_count}"
+
+    @property
+    def metrics(self) -> dict:
+        return {"score": self.score, "comments": self.comment_count}
 
 
 class LobstersCollector:
     """Lobste.rs JSON API를 사용하여 스토리를 수집하는 클래스"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "TrendReporter/1.0"
-        })
+        }
+        self.http = get_transport()
         self.cache = cache
+        # 이미 수집한(캐시된) 항목의 현재 수치. main이 item_metrics 시계열에 기록
+        self.metric_samples: List[dict] = []
 
     def collect_stories(
         self,
@@ -44,8 +55,9 @@ class LobstersCollector:
     ) -> List[LobstersStory]:
         """스토리 수집 (hottest, newest, active)"""
         try:
-            resp = self.session.get(
+            resp = self.http.get(
                 f"{LOBSTERS_BASE}/{story_type}.json",
+                headers=self.headers,
                 timeout=15
             )
             resp.raise_for_status()
@@ -54,38 +66,39 @@ class LobstersCollector:
             print(f"[Lobsters] {story_type} 수집 실패: {e}")
             return []
 
+        return self._parse_stories(stories_data, limit)
+
+    def _parse_stories(self, stories_data: list, limit: int) -> List[LobstersStory]:
+        """API 응답을 스토리 목록으로 변환 (캐시된 항목 제외)"""
         stories = []
         for item in stories_data:
-            story_id = f"lobsters_{item['short_id']}"
-
-            # 캐시된 스토리 스킵
-            if self.cache and self.cache.is_seen(story_id):
-                continue
-
             try:
                 created = datetime.fromisoformat(
                     item.get("created_at", "").replace("Z", "+00:00")
-                )
+                ).timestamp()
             except:
-                created = datetime.now()
+                created = None
 
             # URL이 없으면 Lobsters 페이지 사용
             url = item.get("url") or f"{LOBSTERS_BASE}/s/{item['short_id']}"
 
-            stories.append(LobstersStory(
-                id=item["short_id"],
+            story = LobstersStory(
+                item["short_id"],
                 title=item.get("title", ""),
                 url=url,
                 score=item.get("score", 0),
+                posted_at=created,
                 comment_count=item.get("comment_count", 0),
                 tags=item.get("tags", []),
                 author=item.get("submitter_user", "unknown"),
-                created_at=created
-            ))
+            )
 
-            # 캐시에 추가
-            if self.cache:
-                self.cache.mark_seen(story_id)
+            # 캐시된 스토리는 수치만 기록하고 스킵
+            if self.cache and not self.cache.claim(f"lobsters_{story.id}"):
+                self.metric_samples.append(story.metric_sample())
+                continue
+
+            stories.append(story)
 
             if len(stories) >= limit:
                 break
@@ -102,12 +115,39 @@ class LobstersCollector:
             "hottest": self.collect_stories("hottest", hottest_limit),
             "newest": self.collect_stories("newest", newest_limit)
         }
+        return self._merge_results(results)
+
+    async def _fetch_stories_async(self, client: AsyncHTTPClient, story_type: str) -> Optional[list]:
+        """스토리 JSON 가져오기 (비동기)"""
+        try:
+            resp = await client.get(f"{LOBSTERS_BASE}/{story_type}.json", headers=self.headers, timeout=15)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception as e:
+            print(f"[Lobsters] {story_type} 수집 실패: {e}")
+            return None
+
+    async def collect_all_async(
+        self,
+        client: AsyncHTTPClient,
+        hottest_limit: int = 25,
+        newest_limit: int = 10
+    ) -> dict:
+        """hottest와 newest 스토리 수집 (비동기, 두 목록을 동시에 요청)"""
+        hottest_data, newest_data = await asyncio.gather(
+            self._fetch_stories_async(client, "hottest"),
+            self._fetch_stories_async(client, "newest"),
+        )
+        results = {
+            "hottest": self._parse_stories(hottest_data, hottest_limit) if hottest_data else [],
+            "newest": self._parse_stories(newest_data, newest_limit) if newest_data else [],
+        }
+        return self._merge_results(results)
 
+    def _merge_results(self, results: dict) -> dict:
+        """newest에서 hottest 중복 제거 후 결과 반환"""
         # newest에서 hottest에 있는 것 제외
-        hottest_ids = {s.id for s in results["hottest"]}
-        results["newest"] = [
-            s for s in results["newest"] if s.id not in hottest_ids
-        ]
+        results["newest"] = unique(results["newest"], exclude=results["hottest"])
 
         total = len(results["hottest"]) + len(results["newest"])
         print(f"[Lobsters] 총 {total}개 새 스토리 수집")
@@ -126,11 +166,10 @@ class LobstersCollector:
 
         for i, story in enumerate(all_stories[:20], 1):
             tags_str = ", ".join(story.tags[:3]) if story.tags else "no tags"
-            output.append(
-                f"{i}. {story.title}\n"
-                f"   Score: {story.score} | Comments: {story.comment_count} | "
-                f"Tags: {tags_str}\n"
-                f"   URL: {story.url}\n"
-            )
+            output.append(format_entry(
+                f"{i}.", story.title,
+                f"Score: {story.score} | Comments: {story.comment_count} | Tags: {tags_str}",
+                f"URL: {story.url}",
+            ))
 
         return "\n".join(output)
@@ -1,37 +1,43 @@
 """OSV 취약점 수집기"""
 
-from dataclasses import dataclass
 from typing import List, Optional
 
-import requests
-
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
 OSV_API_URL = "https://api.osv.dev/v1/querybatch"
 
 
-@dataclass
-class OSVVulnerability:
-    """OSV 취약점 데이터"""
-    package: str
-    ecosystem: str
-    vuln_id: str
-    modified: str
-    aliases: List[str]
+class OSVVulnerability(TrendItem):
+    """OSV 취약점 (id는 취약점 ID, 제목은 "ID: 패키지 (생태계)")"""
+    __slots__ = ("ecosystem", "modified", "aliases")
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, ecosystem: str, modified: str,
+                 aliases: List[str]):
+        super().__init__("OSV", id, title, url, score, body, posted_at)
+        self.ecosystem = ecosystem
+        self.modified = modified
+        self.aliases = aliases
+
+    @property
+    def meta(self) -> str:
+        return f"aliases:{','.join(self.aliases[:3])}"
 
 
 class OSVCollector:
     """OSV 배치 API를 사용한 패키지 취약점 수집"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "TrendReporter/1.0"
-        })
+        }
+        self.http = get_transport()
         self.cache = cache
 
     def collect_all(self, packages: List[dict], max_vulns_per_package: int = 3) -> dict:
@@ -39,7 +45,37 @@ class OSVCollector:
         if not packages:
             return {}
 
-        payload = {
+        try:
+            resp = self.http.post(OSV_API_URL, json=self._build_payload(packages), headers=self.headers, timeout=30)
+            resp.raise_for_status()
+            response = resp.json()
+        except Exception as e:
+            print(f"[OSV] 수집 실패: {e}")
+            return {}
+
+        return self._parse_results(packages, response, max_vulns_per_package)
+
+    async def collect_all_async(self, client: AsyncHTTPClient, packages: List[dict],
+                                max_vulns_per_package: int = 3) -> dict:
+        """패키지 목록에 대한 취약점 조회 (비동기)"""
+        if not packages:
+            return {}
+
+        try:
+            resp = await client.post(OSV_API_URL, json=self._build_payload(packages),
+                                     headers=self.headers,
+                                     timeout=30)
+            resp.raise_for_status()
+            response = resp.json()
+        except Exception as e:
+            print(f"[OSV] 수집 실패: {e}")
+            return {}
+
+        return self._parse_results(packages, response, max_vulns_per_package)
+
+    def _build_payload(self, packages: List[dict]) -> dict:
+        """querybatch 요청 본문"""
+        return {
             "queries": [
                 {
                     "package": {
@@ -51,14 +87,8 @@ class OSVCollector:
             ]
         }
 
-        try:
-            resp = self.session.post(OSV_API_URL, json=payload, timeout=30)
-            resp.raise_for_status()
-            response = resp.json()
-        except Exception as e:
-            print(f"[OSV] 수집 실패: {e}")
-            return {}
-
+    def _parse_results(self, packages: List[dict], response: dict, max_vulns_per_package: int) -> dict:
+        """querybatch 응답을 패키지별 취약점 목록으로 변환 (캐시된 항목 제외)"""
         results = {}
         total = 0
         for pkg_cfg, result in zip(packages, response.get("results", [])):
@@ -67,20 +97,18 @@ class OSVCollector:
             vulns = []
             for vuln in result.get("vulns", []):
                 cache_id = f"osv_{ecosystem}_{name}_{vuln.get('id', '')}"
-                if self.cache and self.cache.is_seen(cache_id):
+                if self.cache and not self.cache.claim(cache_id):
                     continue
 
+                vuln_id = vuln.get("id", "")
                 vulns.append(OSVVulnerability(
-                    package=name,
+                    vuln_id,
+                    title=f"{vuln_id}: {name} ({ecosystem})",
                     ecosystem=ecosystem,
-                    vuln_id=vuln.get("id", ""),
                     modified=vuln.get("modified", ""),
                     aliases=vuln.get("aliases", [])[:3],
                 ))
 
-                if self.cache:
-                    self.cache.mark_seen(cache_id)
-
                 if len(vulns) >= max_vulns_per_package:
                     break
 
@@ -103,11 +131,11 @@ class OSVCollector:
             output.append(f"\n## OSV - {package}\n")
             for i, vuln in enumerate(vulns, 1):
                 aliases = ", ".join(vuln.aliases) if vuln.aliases else "N/A"
-                output.append(
-                    f"{i}. {vuln.vuln_id}\n"
-                    f"   Ecosystem: {vuln.ecosystem} | Modified: {vuln.modified}\n"
-                    f"   Aliases: {aliases}\n"
-                )
+                output.append(format_entry(
+                    f"{i}.", vuln.id,
+                    f"Ecosystem: {vuln.ecosystem} | Modified: {vuln.modified}",
+                    f"Aliases: {aliases}",
+                ))
                 total += 1
 
         if total == 0:
@@ -1,34 +1,36 @@
 """RSS 피드 수집기"""
 
 import os
+import asyncio
 import hashlib
+import time
 import feedparser
 from typing import List, Dict, Optional
-from dataclasses import dataclass
-from datetime import datetime
 from time import mktime
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
-@dataclass
-class RSSItem:
-    """RSS 피드 항목 데이터"""
-    id: str
-    title: str
-    url: str
-    source: str
-    category: str
-    published: datetime
-    summary: str = ""
+class RSSItem(TrendItem):
+    """RSS 피드 항목 (출처는 "RSS/<피드 이름>", 요약은 body, 게시 시각은 posted_at)"""
+    __slots__ = ("feed", "category")
+
+    def __init__(self, source: str, id: str, title: str, url: str = "", score: int = 0,
+                 body: str = "", posted_at: Optional[float] = None, *, feed: str, category: str):
+        super().__init__(source, id, title, url, score, body, posted_at)
+        self.feed = feed
+        self.category = category
 
 
 class RSSCollector:
     """RSS 피드를 수집하는 클래스"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
+        self.http = get_transport()
         self.cache = cache
 
     def _generate_id(self, url: str, title: str) -> str:
@@ -44,56 +46,57 @@ class RSSCollector:
         limit: int = 10
     ) -> List[RSSItem]:
         """단일 RSS 피드에서 항목 수집"""
+        try:
+            resp = self.http.get(feed_url, timeout=20)
+            resp.raise_for_status()
+            feed = feedparser.parse(resp.content)
+            return self._parse_feed(feed, feed_name, category, limit)
+        except Exception as e:
+            print(f"[RSS] {feed_name} 수집 실패: {e}")
+            return []
+
+    def _parse_feed(self, feed, feed_name: str, category: str, limit: int) -> List[RSSItem]:
+        """파싱된 피드에서 새 항목 추출 (캐시된 항목 제외)"""
         items = []
 
-        try:
-            feed = feedparser.parse(feed_url)
-
-            for entry in feed.entries[:limit * 2]:  # 캐시 고려
-                url = entry.get("link", "")
-                title = entry.get("title", "")
-
-                # ID 생성
-                item_id = f"rss_{self._generate_id(url, title)}"
-
-                # 캐시된 항목 스킵
-                if self.cache and self.cache.is_seen(item_id):
-                    continue
-
-                # 게시 시간 파싱
-                published = datetime.now()
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    published = datetime.fromtimestamp(mktime(entry.published_parsed))
-                elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                    published = datetime.fromtimestamp(mktime(entry.updated_parsed))
-
-                # 요약 추출
-                summary = ""
-                if hasattr(entry, "summary"):
-                    # HTML 태그 간단히 제거
-                    summary = entry.summary
-                    import re
-                    summary = re.sub(r'<[^>]+>', '', summary)[:500]
-
-                items.append(RSSItem(
-                    id=item_id,
-                    title=title,
-                    url=url,
-                    source=feed_name,
-                    category=category,
-                    published=published,
-                    summary=summary
-                ))
+        for entry in feed.entries[:limit * 2]:  # 캐시 고려
+            url = entry.get("link", "")
+            title = entry.get("title", "")
 
-                # 캐시에 추가
-                if self.cache:
-                    self.cache.mark_seen(item_id)
+            # ID 생성
+            item_id = f"rss_{self._generate_id(url, title)}"
 
-                if len(items) >= limit:
-                    break
+            # 캐시된 항목 스킵
+            if self.cache and not self.cache.claim(item_id):
+                continue
 
-        except Exception as e:
-            print(f"[RSS] {feed_name} 수집 실패: {e}")
+            # 게시 시간 파싱
+            published = time.time()
+            if hasattr(entry, "published_parsed") and entry.published_parsed:
+                published = mktime(entry.published_parsed)
+            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
+                published = mktime(entry.updated_parsed)
+
+            # 요약 추출
+            summary = ""
+            if hasattr(entry, "summary"):
+                # HTML 태그 간단히 제거
+                summary = entry.summary
+                import re
+                summary = re.sub(r'<[^>]+>', '', summary)[:500]
+
+            items.append(RSSItem(
+                f"RSS/{feed_name}", item_id,
+                title=title,
+                url=url,
+                body=summary,
+                posted_at=published,
+                feed=feed_name,
+                category=category,
+            ))
+
+            if len(items) >= limit:
+                break
 
         return items
 
@@ -103,29 +106,54 @@ class RSSCollector:
         items_per_feed: int = 10
     ) -> Dict[str, List[RSSItem]]:
         """모든 RSS 피드에서 카테고리별로 수집"""
+        feeds = [feed for feed in feeds_config if feed.get("url")]
+        return self._merge_results(feeds, [
+            self.collect_feed(feed["url"], feed.get("name", "Unknown"), feed.get("category", "general"),
+                              items_per_feed)
+            for feed in feeds
+        ])
+
+    def _merge_results(self, feeds: List[Dict], item_lists: List[List[RSSItem]]) -> Dict[str, List[RSSItem]]:
+        """피드별 항목을 카테고리별로 모아 시간순 정렬"""
         results = {}
-
-        for feed in feeds_config:
-            name = feed.get("name", "Unknown")
-            url = feed.get("url", "")
-            category = feed.get("category", "general")
-
-            if not url:
-                continue
-
-            items = self.collect_feed(url, name, category, items_per_feed)
-            print(f"[RSS] {name}: {len(items)}개 새 항목")
-
-            if category not in results:
-                results[category] = []
-            results[category].extend(items)
+        for feed, items in zip(feeds, item_lists):
+            print(f"[RSS] {feed.get('name', 'Unknown')}: {len(items)}개 새 항목")
+            results.setdefault(feed.get("category", "general"), []).extend(items)
 
         # 각 카테고리 시간순 정렬
         for category in results:
-            results[category].sort(key=lambda x: x.published, reverse=True)
+            results[category].sort(key=lambda x: x.posted_at, reverse=True)
 
         return results
 
+    async def collect_all_async(
+        self,
+        client: AsyncHTTPClient,
+        feeds_config: List[Dict],
+        items_per_feed: int = 10
+    ) -> Dict[str, List[RSSItem]]:
+        """모든 RSS 피드를 동시에 수집"""
+        feeds = [feed for feed in feeds_config if feed.get("url")]
+        fetched = await asyncio.gather(*(
+            client.get(feed["url"], timeout=20) for feed in feeds
+        ), return_exceptions=True)
+
+        item_lists = []
+        for feed, resp in zip(feeds, fetched):  # 설정 순서대로 파싱
+            name = feed.get("name", "Unknown")
+            try:
+                if isinstance(resp, Exception):
+                    raise resp
+                resp.raise_for_status()
+                items = self._parse_feed(feedparser.parse(resp.content), name,
+                                         feed.get("category", "general"), items_per_feed)
+            except Exception as e:
+                print(f"[RSS] {name} 수집 실패: {e}")
+                items = []
+            item_lists.append(items)
+
+        return self._merge_results(feeds, item_lists)
+
     def format_for_analysis(self, data: Dict[str, List[RSSItem]], categories: Optional[List[str]] = None) -> str:
         """분석을 위한 텍스트 포맷"""
         output = []
@@ -139,12 +167,11 @@ class RSSCollector:
 
             output.append(f"\n## RSS - {category.upper()}\n")
             for i, item in enumerate(items[:15], 1):
-                output.append(
-                    f"{i}. [{item.source}] {item.title}\n"
-                    f"   URL: {item.url}\n"
-                )
-                if item.summary:
-                    output.append(f"   요약: {item.summary[:500]}\n")
+                output.append(format_entry(
+                    f"{i}.", f"[{item.feed}] {item.title}",
+                    f"URL: {item.url}",
+                    f"요약: {item.body[:500]}" if item.body else None,
+                ))
                 total_items += 1
 
         if total_items == 0:
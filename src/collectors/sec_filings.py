@@ -1,56 +1,66 @@
 """SEC EDGAR 최근 공시 수집기"""
 
 import os
-from dataclasses import dataclass
+import asyncio
 from typing import List, Optional
 
-import requests
-
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
 SEC_BASE_URL = "https://data.sec.gov/submissions"
 SEC_ARCHIVES_BASE = "https://www.sec.gov/Archives/edgar/data"
 
 
-@dataclass
-class SECFiling:
-    """SEC 공시 데이터"""
-    company: str
-    ticker: str
-    form: str
-    filing_date: str
-    accession_number: str
-    primary_document: str
-    url: str
+class SECFiling(TrendItem):
+    """SEC 공시 (제목은 "회사 (티커) - 양식", id는 접수번호)"""
+    __slots__ = ("company", "form", "filing_date")
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, company: str, form: str, filing_date: str):
+        super().__init__("SEC", id, title, url, score, body, posted_at)
+        self.company = company
+        self.form = form
+        self.filing_date = filing_date
+
+    @property
+    def meta(self) -> str:
+        return f"date:{self.filing_date}"
 
 
 class SECFilingsCollector:
     """SEC submissions JSON을 사용한 최근 공시 수집"""
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": os.getenv(
                 "SEC_USER_AGENT",
                 "TrendReporter/1.0 trend-reporter@example.com",
             )
-        })
+        }
+        self.http = get_transport()
         self.cache = cache
 
     def collect_company(self, company_cfg: dict, limit: int = 5) -> List[SECFiling]:
         """단일 회사의 최근 공시 수집"""
         cik = str(company_cfg["cik"]).zfill(10)
         try:
-            resp = self.session.get(f"{SEC_BASE_URL}/CIK{cik}.json", timeout=20)
-            resp.raise_for_status()
+            resp = self.http.get(f"{SEC_BASE_URL}/CIK{cik}.json", headers=self.headers, timeout=20,
+                                 revalidate=True)
+            resp.raise_for_status()  # 304도 저장된 본문으로 파싱 (본 공시는 claim이 제외)
             payload = resp.json()
         except Exception as e:
             print(f"[SEC] {company_cfg.get('ticker', cik)} 수집 실패: {e}")
             return []
 
+        return self._parse_filings(company_cfg, payload, limit)
+
+    def _parse_filings(self, company_cfg: dict, payload: dict, limit: int) -> List[SECFiling]:
+        """submissions JSON에서 최근 공시 추출 (캐시된 공시 제외)"""
+        cik = str(company_cfg["cik"]).zfill(10)
         recent = payload.get("filings", {}).get("recent", {})
         forms = recent.get("form", [])
         accession_numbers = recent.get("accessionNumber", [])
@@ -70,26 +80,23 @@ class SECFilingsCollector:
                 continue
 
             cache_id = f"sec_{cik}_{accession}"
-            if self.cache and self.cache.is_seen(cache_id):
+            if self.cache and not self.cache.claim(cache_id):
                 continue
 
             accession_plain = accession.replace("-", "")
             archive_cik = str(int(cik))
             url = f"{SEC_ARCHIVES_BASE}/{archive_cik}/{accession_plain}/{primary_doc}"
 
+            company = company_cfg.get("name", company_cfg.get("ticker", cik))
             filings.append(SECFiling(
-                company=company_cfg.get("name", company_cfg.get("ticker", cik)),
-                ticker=company_cfg.get("ticker", ""),
+                accession,
+                title=f"{company} ({company_cfg.get('ticker', '')}) - {form}",
+                url=url,
+                company=company,
                 form=form,
                 filing_date=filing_date,
-                accession_number=accession,
-                primary_document=primary_doc,
-                url=url,
             ))
 
-            if self.cache:
-                self.cache.mark_seen(cache_id)
-
             if len(filings) >= limit:
                 break
 
@@ -97,12 +104,16 @@ class SECFilingsCollector:
 
     def collect_all(self, companies: List[dict], limit_per_company: int = 3) -> dict:
         """설정된 회사들의 최근 공시 수집"""
+        return self._merge_results(companies, [
+            self.collect_company(company_cfg, limit=limit_per_company) for company_cfg in companies
+        ])
+
+    def _merge_results(self, companies: List[dict], filing_lists: List[List[SECFiling]]) -> dict:
+        """티커별 결과 구성"""
         results = {}
         total = 0
-
-        for company_cfg in companies:
+        for company_cfg, filings in zip(companies, filing_lists):
             ticker = company_cfg.get("ticker", company_cfg.get("cik", "unknown"))
-            filings = self.collect_company(company_cfg, limit=limit_per_company)
             results[ticker] = filings
             total += len(filings)
             print(f"[SEC] {ticker}: {len(filings)}개 공시 수집")
@@ -110,6 +121,31 @@ class SECFilingsCollector:
         print(f"[SEC] 총 {total}개 공시 수집")
         return results
 
+    async def _fetch_company_async(self, client: AsyncHTTPClient, company_cfg: dict) -> Optional[dict]:
+        """단일 회사의 submissions JSON 가져오기 (비동기, 실패 시 None)"""
+        cik = str(company_cfg["cik"]).zfill(10)
+        try:
+            resp = await client.get(f"{SEC_BASE_URL}/CIK{cik}.json", headers=self.headers, timeout=20,
+                                    revalidate=True)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception as e:
+            print(f"[SEC] {company_cfg.get('ticker', cik)} 수집 실패: {e}")
+            return None
+
+    async def collect_all_async(self, client: AsyncHTTPClient, companies: List[dict],
+                                limit_per_company: int = 3) -> dict:
+        """설정된 회사들의 최근 공시를 동시에 수집"""
+        payloads = await asyncio.gather(*(
+            self._fetch_company_async(client, company_cfg)
+            for company_cfg in companies
+        ))
+
+        return self._merge_results(companies, [
+            self._parse_filings(company_cfg, payload, limit_per_company) if payload else []
+            for company_cfg, payload in zip(companies, payloads)
+        ])
+
     def format_for_analysis(self, data: dict) -> str:
         """분석용 텍스트 포맷"""
         output = []
@@ -121,11 +157,11 @@ class SECFilingsCollector:
 
             output.append(f"\n## SEC Filings - {ticker}\n")
             for i, filing in enumerate(filings, 1):
-                output.append(
-                    f"{i}. {filing.company} {filing.form}\n"
-                    f"   Filing Date: {filing.filing_date}\n"
-                    f"   URL: {filing.url}\n"
-                )
+                output.append(format_entry(
+                    f"{i}.", f"{filing.company} {filing.form}",
+                    f"Filing Date: {filing.filing_date}",
+                    f"URL: {filing.url}",
+                ))
                 total += 1
 
         if total == 0:
@@ -1,28 +1,33 @@
 """미국 재무부 보도자료 수집기"""
 
 import re
-from dataclasses import dataclass
 from html import unescape
 from typing import List, Optional
 
-import requests
-
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from cache import ContentCache
+from http_client import AsyncHTTPClient, get_transport
+from items import TrendItem, format_entry
 
 
 TREASURY_PRESS_URL = "https://home.treasury.gov/news/press-releases"
 TREASURY_BASE_URL = "https://home.treasury.gov"
 
 
-@dataclass
-class TreasuryPressRelease:
-    """재무부 보도자료 데이터"""
-    date: str
-    title: str
-    url: str
+class TreasuryPressRelease(TrendItem):
+    """재무부 보도자료"""
+    __slots__ = ("date",)
+
+    def __init__(self, id: str, title: str, url: str = "", score: int = 0, body: str = "",
+                 posted_at: Optional[float] = None, *, date: str):
+        super().__init__("Treasury", id, title, url, score, body, posted_at)
+        self.date = date
+
+    @property
+    def meta(self) -> str:
+        return f"date:{self.date}"
 
 
 class TreasuryPressCollector:
@@ -34,22 +39,38 @@ class TreasuryPressCollector:
     )
 
     def __init__(self, cache: Optional[ContentCache] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "TrendReporter/1.0"
-        })
+        }
+        self.http = get_transport()
         self.cache = cache
 
     def collect_all(self, limit: int = 6) -> List[TreasuryPressRelease]:
         """재무부 보도자료 목록 수집"""
         try:
-            resp = self.session.get(TREASURY_PRESS_URL, timeout=20)
+            resp = self.http.get(TREASURY_PRESS_URL, headers=self.headers, timeout=20)
+            resp.raise_for_status()
+            html = resp.text
+        except Exception as e:
+            print(f"[Treasury] 수집 실패: {e}")
+            return []
+
+        return self._parse_page(html, limit)
+
+    async def collect_all_async(self, client: AsyncHTTPClient, limit: int = 6) -> List[TreasuryPressRelease]:
+        """재무부 보도자료 목록 수집 (비동기)"""
+        try:
+            resp = await client.get(TREASURY_PRESS_URL, headers=self.headers, timeout=20)
             resp.raise_for_status()
             html = resp.text
         except Exception as e:
             print(f"[Treasury] 수집 실패: {e}")
             return []
 
+        return self._parse_page(html, limit)
+
+    def _parse_page(self, html: str, limit: int) -> List[TreasuryPressRelease]:
+        """보도자료 목록 HTML 파싱 (캐시된 항목 제외)"""
         items = []
         seen_urls = set()
         for date_str, href, raw_title in self.ROW_PATTERN.findall(html):
@@ -60,18 +81,16 @@ class TreasuryPressCollector:
             title = " ".join(unescape(re.sub(r"<[^>]+>", " ", raw_title)).split())
             url = f"{TREASURY_BASE_URL}{href}"
             cache_id = f"treasury_{href}"
-            if self.cache and self.cache.is_seen(cache_id):
+            if self.cache and not self.cache.claim(cache_id):
                 continue
 
             items.append(TreasuryPressRelease(
-                date=date_str,
+                url,
                 title=title,
                 url=url,
+                date=date_str,
             ))
 
-            if self.cache:
-                self.cache.mark_seen(cache_id)
-
             if len(items) >= limit:
                 break
 
@@ -88,10 +107,10 @@ class TreasuryPressCollector:
 
         output = ["\n## U.S. Treasury Press Releases\n"]
         for i, item in enumerate(data, 1):
-            output.append(
-                f"{i}. {item.title}\n"
-                f"   Date: {item.date}\n"
-                f"   URL: {item.url}\n"
-            )
+            output.append(format_entry(
+                f"{i}.", item.title,
+                f"Date: {item.date}",
+                f"URL: {item.url}",
+            ))
 
         return "\n".join(output)
@@ -0,0 +1,151 @@
+"""HTTP 재검증 캐시 (ETag / Last-Modified)
+
+JSON API 응답의 검증자(ETag, Last-Modified)와 본문을 URL별로 보관한다.
+다음 실행에서 If-None-Match / If-Modified-Since를 보내고,
+304 응답이면 저장된 본문을 돌려주어 수집기가 파싱을 건너뛸 수 있게 한다.
+
+저장 구조 (cache/http/):
+  index.json          — {key: {url, etag, last_modified, body, stored_at, used_at}}
+  <key>-<digest>.gz   — gzip 압축 본문 (digest는 본문 해시)
+
+본문 파일 이름에 내용 해시를 넣어 새 응답이 이전 본문을 덮어쓰지 않게 한다.
+인덱스는 실행이 성공했을 때만 저장되므로, 그 전에 본문을 덮어쓰면 디스크의
+인덱스(이전 검증자)와 새 본문이 짝지어질 수 있다. 더 이상 참조되지 않는 본문은
+인덱스를 저장할 때 정리한다.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class RevalidationCache:
+    """URL별 검증자와 본문을 보관하는 조건부 요청 캐시 (스레드 안전)"""
+
+    def __init__(self, cache_dir: str, max_age_days: int = 14):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / "index.json"
+        self.max_age = max_age_days * 86400
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load_index()
+
+    def _load_index(self):
+        """인덱스 로드 (손상된 경우 빈 캐시로 시작)"""
+        self.entries: Dict[str, dict] = {}
+        if not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[HTTP 캐시] 인덱스 로드 실패, 새로 시작합니다: {e}")
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        """최종 요청 URL(쿼리 포함) 기준 키"""
+        return hashlib.sha1(url.encode()).hexdigest()[:20]
+
+    def _body_path(self, key: str, entry: dict) -> Path:
+        """항목의 본문 파일 경로 (body 필드가 없는 이전 형식은 <key>.gz)"""
+        return self.cache_dir / entry.get("body", f"{key}.gz")
+
+    def conditional_headers(self, url: str) -> dict:
+        """저장된 검증자로 조건부 요청 헤더 생성 (본문이 없으면 빈 dict)"""
+        key = self.key_for(url)
+        with self._lock:
+            entry = self.entries.get(key)
+        if not entry or not self._body_path(key, entry).exists():
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def load_body(self, url: str) -> Optional[bytes]:
+        """304 응답 시 저장된 본문 반환"""
+        key = self.key_for(url)
+        with self._lock:
+            entry = self.entries.get(key)
+        if not entry:
+            return None
+        try:
+            with gzip.open(self._body_path(key, entry), 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+
+        with self._lock:
+            self.hits += 1
+            if key in self.entries:
+                self.entries[key]["used_at"] = time.time()
+                self._dirty = True
+        return body
+
+    def store(self, url: str, headers, body: bytes):
+        """200 응답의 검증자와 본문 저장 (검증자가 없으면 저장하지 않음)"""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+        if not etag and not last_modified:
+            return
+
+        key = self.key_for(url)
+        # 디스크 인덱스가 가리키는 이전 본문은 그대로 두고 새 파일에 기록
+        body_name = f"{key}-{hashlib.sha1(body).hexdigest()[:12]}.gz"
+        body_path = self.cache_dir / body_name
+        if not body_path.exists():
+            tmp = self.cache_dir / f"{body_name}.tmp"
+            with gzip.open(tmp, 'wb', compresslevel=5) as f:
+                f.write(body)
+            os.replace(tmp, body_path)
+
+        now = time.time()
+        with self._lock:
+            self.entries[key] = {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body_name,
+                "stored_at": now,
+                "used_at": now,
+            }
+            self._dirty = True
+
+    def save(self):
+        """오래 사용되지 않은 항목 정리 후 인덱스 저장"""
+        cutoff = time.time() - self.max_age
+        with self._lock:
+            expired = [k for k, e in self.entries.items() if e.get("used_at", 0) < cutoff]
+            for key in expired:
+                del self.entries[key]
+            if not self._dirty and not expired:
+                return
+            entries = dict(self.entries)
+            self._dirty = False
+
+        tmp = self.index_file.with_suffix(".json.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(entries, f)
+        os.replace(tmp, self.index_file)
+
+        # 새 인덱스가 참조하지 않는 본문 정리 (만료 항목, 교체된 본문, 실패한 실행이 남긴 본문)
+        referenced = {self._body_path(key, entry).name for key, entry in entries.items()}
+        for path in self.cache_dir.glob("*.gz"):
+            if path.name not in referenced:
+                path.unlink(missing_ok=True)
+
+        if self.hits or self.misses:
+            print(f"[HTTP 캐시] 304 재사용 {self.hits}회, 새 응답 {self.misses}회, 항목 {len(entries)}개")
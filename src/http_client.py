@@ -0,0 +1,396 @@
+"""수집기 공용 HTTP 전송 계층
+
+모든 수집기와 article_extractor가 이 모듈의 클라이언트만 사용한다.
+- HTTPTransport: 프로세스 전체에서 공유하는 requests 세션 (호스트별 커넥션 풀, keep-alive)
+- AsyncHTTPClient: 하나의 이벤트 루프에서 공유하는 httpx 비동기 클라이언트
+두 클라이언트는 같은 설정(User-Agent, 타임아웃, 재시도)과 호스트별 통계를 공유하므로
+같은 호스트(github.com, api.github.com, huggingface.co)의 TLS 핸드셰이크는 실행당 한 번만 발생한다.
+
+요청 직전에 호스트별 토큰 버킷(rate_limit.HostRateLimiter)을 거치며,
+429 또는 Retry-After 응답은 해당 호스트만 일정 시간 차단한다.
+
+get(..., revalidate=True)는 ETag/Last-Modified 조건부 요청을 보낸다 (http_cache.RevalidationCache).
+304 응답이면 status_code 304와 함께 저장된 본문을 담아 반환하므로 수집기는 200과 같이
+raise_for_status() 후 본문을 파싱한다. 목록이 그대로여도 지난 실행에서 limit에 밀렸거나
+확정되지 않은 항목이 있을 수 있으므로, 이미 본 항목은 ContentCache.claim()이 걸러낸다.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from urllib.parse import urlencode, urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+import profiler
+from http_cache import RevalidationCache
+from rate_limit import HostRateLimiter
+
+
+DEFAULT_USER_AGENT = "TrendReporter/1.0"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# 304 본문 교체 시 제거할 헤더 (저장된 본문은 이미 디코딩된 상태)
+_BODY_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class _RevalidatedResponse(httpx.Response):
+    """저장된 본문을 담은 304 응답 (requests와 같이 raise_for_status가 304를 성공으로 취급)"""
+
+    def raise_for_status(self) -> "httpx.Response":
+        if self.status_code == 304:
+            return self
+        return super().raise_for_status()
+
+
+def _throttle_delay(limiter: HostRateLimiter, url: str, status: int, headers) -> float:
+    """429 또는 Retry-After가 있는 503이면 호스트를 차단하고 차단 시간 반환 (아니면 0)"""
+    retry_after = headers.get("Retry-After")
+    if status == 429 or (status == 503 and retry_after):
+        return limiter.penalize(url, retry_after)
+    return 0.0
+
+
+def _cache_url(url: str, params: Optional[dict] = None) -> str:
+    """재검증 캐시 키로 쓰는 URL (쿼리 파라미터 포함, 동기/비동기 공통)"""
+    if not params:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}{urlencode(params, doseq=True)}"
+
+
+@dataclass
+class HostStats:
+    """호스트별 요청 통계"""
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+    statuses: Counter = field(default_factory=Counter)
+
+
+class RequestStats:
+    """스레드/이벤트 루프 공용 호스트별 요청 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hosts: Dict[str, HostStats] = {}
+
+    def record(self, url: str, status: Optional[int] = None, nbytes: int = 0,
+               elapsed: float = 0.0, error: bool = False, retry: bool = False):
+        host = urlsplit(url).hostname or "unknown"
+        with self._lock:
+            stats = self.hosts.setdefault(host, HostStats())
+            stats.requests += 1
+            stats.bytes += nbytes
+            stats.elapsed += elapsed
+            if status is not None:
+                stats.statuses[status] += 1
+            if error:
+                stats.errors += 1
+            if retry:
+                stats.retries += 1
+        # 요청을 보낸 수집 단계의 구간에도 기록
+        profiler.add(requests=1, bytes=nbytes, errors=int(error))
+
+    def summary(self) -> Dict[str, dict]:
+        """{host: {requests, errors, retries, bytes, elapsed, statuses}}"""
+        with self._lock:
+            return {
+                host: {
+                    "requests": s.requests,
+                    "errors": s.errors,
+                    "retries": s.retries,
+                    "bytes": s.bytes,
+                    "elapsed": round(s.elapsed, 3),
+                    "statuses": dict(s.statuses),
+                }
+                for host, s in sorted(self.hosts.items(), key=lambda kv: -kv[1].requests)
+            }
+
+    def print_summary(self, top: int = 15):
+        """요청 수 상위 호스트 출력"""
+        summary = self.summary()
+        if not summary:
+            return
+        total = sum(s["requests"] for s in summary.values())
+        total_bytes = sum(s["bytes"] for s in summary.values())
+        print(f"\n[HTTP] {len(summary)}개 호스트, {total}개 요청, {total_bytes / 1024:.0f}KB")
+        for host, s in list(summary.items())[:top]:
+            print(f"  - {host}: {s['requests']}회 {s['bytes'] / 1024:.0f}KB "
+                  f"{s['elapsed']:.1f}초 (오류 {s['errors']}, 재시도 {s['retries']})")
+
+
+@dataclass
+class HTTPSettings:
+    """config/sources.yaml의 http 섹션"""
+    user_agent: str = DEFAULT_USER_AGENT
+    timeout: float = 20.0
+    retries: int = 1              # 연결 오류/5xx 재시도 횟수
+    backoff: float = 0.5          # 재시도 대기 (backoff * 2^attempt 초)
+    pool_connections: int = 64    # 유지할 호스트별 풀 개수
+    pool_maxsize: int = 16        # 호스트당 최대 커넥션
+    max_connections: int = 100    # async: 전체 커넥션
+    max_keepalive: int = 20       # async: keep-alive 커넥션
+    max_concurrency: int = 50     # async: 동시 요청 수
+    revalidate: bool = True       # ETag/Last-Modified 재검증 캐시 사용
+    revalidate_max_age_days: int = 14  # 이 기간 동안 쓰이지 않은 캐시 항목 삭제
+
+    @classmethod
+    def from_config(cls, cfg: Optional[dict]) -> "HTTPSettings":
+        cfg = cfg or {}
+        known = {k: v for k, v in cfg.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+class HTTPTransport:
+    """프로세스 공용 동기 HTTP 클라이언트 (스레드 안전)"""
+
+    def __init__(self, settings: Optional[HTTPSettings] = None, stats: Optional[RequestStats] = None,
+                 revalidation: Optional[RevalidationCache] = None,
+                 limiter: Optional[HostRateLimiter] = None):
+        self.settings = settings or HTTPSettings()
+        self.stats = stats or RequestStats()
+        self.revalidation = revalidation
+        self.limiter = limiter or HostRateLimiter()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.settings.pool_connections,
+            pool_maxsize=self.settings.pool_maxsize,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": self.settings.user_agent})
+
+    def get(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+            timeout: Optional[float] = None, retries: Optional[int] = None,
+            revalidate: bool = False) -> requests.Response:
+        """GET 요청 (revalidate=True면 조건부 요청, 304 시 저장된 본문 반환)"""
+        if revalidate and self.revalidation is not None:
+            return self._get_revalidated(url, params, headers, timeout, retries)
+        return self.request("GET", url, params=params, headers=headers, timeout=timeout, retries=retries)
+
+    def _get_revalidated(self, url: str, params: Optional[dict], headers: Optional[dict],
+                         timeout: Optional[float], retries: Optional[int]) -> requests.Response:
+        """저장된 검증자로 조건부 GET, 200 응답은 검증자/본문 저장"""
+        cache_url = _cache_url(url, params)
+        conditional = self.revalidation.conditional_headers(cache_url)
+        resp = self.request("GET", url, params=params, headers={**(headers or {}), **conditional},
+                            timeout=timeout, retries=retries)
+
+        if resp.status_code == 304:
+            body = self.revalidation.load_body(cache_url)
+            if body is None:
+                # 본문 유실 시 조건 없이 다시 요청
+                return self.request("GET", url, params=params, headers=headers, timeout=timeout, retries=retries)
+            resp._content = body
+        elif resp.status_code == 200:
+            self.revalidation.store(cache_url, resp.headers, resp.content)
+        return resp
+
+    def post(self, url: str, json: Optional[dict] = None, headers: Optional[dict] = None,
+             timeout: Optional[float] = None, retries: Optional[int] = None) -> requests.Response:
+        """POST 요청 (JSON 본문)"""
+        return self.request("POST", url, json=json, headers=headers, timeout=timeout, retries=retries)
+
+    def request(self, method: str, url: str, timeout: Optional[float] = None,
+                retries: Optional[int] = None, **kwargs) -> requests.Response:
+        """공통 속도 제한/타임아웃/재시도/통계를 적용한 요청"""
+        timeout = timeout if timeout is not None else self.settings.timeout
+        retries = retries if retries is not None else self.settings.retries
+
+        for attempt in range(retries + 1):
+            self.limiter.acquire(url)
+            start = time.monotonic()
+            try:
+                resp = self.session.request(method, url, timeout=timeout, **kwargs)
+            except requests.ConnectionError:
+                self.stats.record(url, elapsed=time.monotonic() - start, error=True, retry=attempt < retries)
+                if attempt < retries:
+                    time.sleep(self.settings.backoff * (2 ** attempt))
+                    continue
+                raise
+            except requests.RequestException:
+                self.stats.record(url, elapsed=time.monotonic() - start, error=True)
+                raise
+
+            should_retry = resp.status_code in RETRY_STATUSES and attempt < retries
+            self.stats.record(url, status=resp.status_code, nbytes=len(resp.content),
+                              elapsed=time.monotonic() - start,
+                              error=resp.status_code >= 400, retry=should_retry)
+            # 429/Retry-After는 리미터가 다음 acquire에서 대기
+            throttled = _throttle_delay(self.limiter, url, resp.status_code, resp.headers)
+            if should_retry:
+                if not throttled:
+                    time.sleep(self.settings.backoff * (2 ** attempt))
+                continue
+            return resp
+
+        return resp
+
+
+class AsyncHTTPClient:
+    """httpx.AsyncClient 기반 공유 비동기 클라이언트
+
+    - 커넥션 풀/keep-alive 공유 (호스트별 TLS 핸드셰이크 재사용)
+    - 세마포어로 동시 요청 수 제한
+    - 수집기별 헤더는 요청 단위로 전달
+    """
+
+    def __init__(self, settings: Optional[HTTPSettings] = None, stats: Optional[RequestStats] = None,
+                 revalidation: Optional[RevalidationCache] = None,
+                 limiter: Optional[HostRateLimiter] = None):
+        self.settings = settings or HTTPSettings()
+        self.stats = stats or RequestStats()
+        self.revalidation = revalidation
+        self.limiter = limiter or HostRateLimiter()
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.settings.max_connections,
+                max_keepalive_connections=self.settings.max_keepalive,
+            ),
+            timeout=self.settings.timeout,
+            headers={"User-Agent": self.settings.user_agent},
+            follow_redirects=True,
+        )
+        self._semaphore = asyncio.Semaphore(self.settings.max_concurrency)
+
+    async def get(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+                  timeout: Optional[float] = None, retries: Optional[int] = None,
+                  revalidate: bool = False) -> httpx.Response:
+        """GET 요청 (revalidate=True면 조건부 요청, 304 시 저장된 본문 반환)"""
+        if revalidate and self.revalidation is not None:
+            return await self._get_revalidated(url, params, headers, timeout, retries)
+        return await self.request("GET", url, params=params, headers=headers, timeout=timeout, retries=retries)
+
+    async def _get_revalidated(self, url: str, params: Optional[dict], headers: Optional[dict],
+                               timeout: Optional[float], retries: Optional[int]) -> httpx.Response:
+        """저장된 검증자로 조건부 GET, 200 응답은 검증자/본문 저장"""
+        cache_url = _cache_url(url, params)
+        conditional = self.revalidation.conditional_headers(cache_url)
+        resp = await self.request("GET", url, params=params, headers={**(headers or {}), **conditional},
+                                  timeout=timeout, retries=retries)
+
+        if resp.status_code == 304:
+            body = await asyncio.to_thread(self.revalidation.load_body, cache_url)
+            if body is None:
+                # 본문 유실 시 조건 없이 다시 요청
+                return await self.request("GET", url, params=params, headers=headers,
+                                          timeout=timeout, retries=retries)
+            kept = {k: v for k, v in resp.headers.items() if k.lower() not in _BODY_HEADERS}
+            return _RevalidatedResponse(304, headers=kept, content=body, request=resp.request)
+        if resp.status_code == 200:
+            await asyncio.to_thread(self.revalidation.store, cache_url, resp.headers, resp.content)
+        return resp
+
+    async def post(self, url: str, json: Optional[dict] = None, headers: Optional[dict] = None,
+                   timeout: Optional[float] = None, retries: Optional[int] = None) -> httpx.Response:
+        """POST 요청 (JSON 본문)"""
+        return await self.request("POST", url, json=json, headers=headers, timeout=timeout, retries=retries)
+
+    async def request(self, method: str, url: str, timeout: Optional[float] = None,
+                      retries: Optional[int] = None, **kwargs) -> httpx.Response:
+        """동시성 제한 하에 공통 속도 제한/타임아웃/재시도/통계를 적용한 요청"""
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        retries = retries if retries is not None else self.settings.retries
+
+        for attempt in range(retries + 1):
+            # 속도 제한 대기는 세마포어 밖에서 (다른 호스트 요청을 막지 않도록)
+            await self.limiter.acquire_async(url)
+            start = time.monotonic()
+            try:
+                async with self._semaphore:
+                    resp = await self._client.request(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.RemoteProtocolError):
+                self.stats.record(url, elapsed=time.monotonic() - start, error=True, retry=attempt < retries)
+                if attempt < retries:
+                    await asyncio.sleep(self.settings.backoff * (2 ** attempt))
+                    continue
+                raise
+            except httpx.HTTPError:
+                self.stats.record(url, elapsed=time.monotonic() - start, error=True)
+                raise
+
+            should_retry = resp.status_code in RETRY_STATUSES and attempt < retries
+            self.stats.record(url, status=resp.status_code, nbytes=len(resp.content),
+                              elapsed=time.monotonic() - start,
+                              error=resp.status_code >= 400, retry=should_retry)
+            throttled = _throttle_delay(self.limiter, url, resp.status_code, resp.headers)
+            if should_retry:
+                if not throttled:
+                    await asyncio.sleep(self.settings.backoff * (2 ** attempt))
+                continue
+            return resp
+
+        return resp
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+# ── 프로세스 공용 인스턴스 ──
+
+_settings = HTTPSettings()
+_stats = RequestStats()
+_revalidation: Optional[RevalidationCache] = None
+_limiter = HostRateLimiter()
+_transport: Optional[HTTPTransport] = None
+_transport_lock = threading.Lock()
+
+
+def configure(cfg: Optional[dict] = None, cache_dir: Optional[str] = None):
+    """config/sources.yaml의 http 섹션으로 공용 설정 지정 (수집기 생성 전에 호출)
+
+    cache_dir가 주어지면 <cache_dir>/http에 재검증 캐시를 둔다.
+    """
+    global _settings, _transport, _revalidation, _limiter
+    with _transport_lock:
+        _settings = HTTPSettings.from_config(cfg)
+        _limiter = HostRateLimiter.from_config((cfg or {}).get("rate_limits"))
+        _revalidation = None
+        if cache_dir and _settings.revalidate:
+            _revalidation = RevalidationCache(os.path.join(cache_dir, "http"),
+                                              max_age_days=_settings.revalidate_max_age_days)
+        _transport = None
+
+
+def get_transport() -> HTTPTransport:
+    """공용 동기 클라이언트 반환 (최초 호출 시 생성)"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HTTPTransport(_settings, _stats, _revalidation, _limiter)
+        return _transport
+
+
+def create_async_client() -> AsyncHTTPClient:
+    """공용 설정/통계를 사용하는 비동기 클라이언트 생성 (이벤트 루프 안에서 호출)"""
+    return AsyncHTTPClient(_settings, _stats, _revalidation, _limiter)
+
+
+def save_cache():
+    """재검증 캐시 인덱스 저장 (실행 종료 시 호출)"""
+    if _revalidation is not None:
+        _revalidation.save()
+
+
+def get_stats() -> RequestStats:
+    """호스트별 요청 통계"""
+    return _stats
+
+
+def get_limiter() -> HostRateLimiter:
+    """호스트별 속도 제한 (누적 대기 시간 보고용)"""
+    return _limiter
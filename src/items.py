@@ -0,0 +1,102 @@
+"""수집 항목 공통 레코드
+
+모든 수집기는 TrendItem을 만든다. 출처/제목/URL/점수/본문처럼 모든 소스에 있는 값은 TrendItem 슬롯에,
+소스마다 다른 값(HN 댓글 수, SEC 공시 양식 등)은 수집기 모듈의 하위 클래스가 __slots__로 추가한다.
+항목마다 __dict__나 별도 객체가 없다 (benchmarks/trend_items.py로 측정).
+
+하위 클래스 __init__은 공통 필드를 위치 인자로 super().__init__에 넘긴다 (**kwargs로 넘기면 생성 비용이 크게 는다).
+필요하면 meta / metrics 속성을 덮어쓴다.
+- meta -> str: 저장용 부가 정보 ("comments:12 by:pg")
+- metrics -> dict: item_metrics 시계열에 기록할 수치 ({"score": 120, "comments": 12})
+
+저장 행(to_row, metric_sample), 분석용 텍스트 항목(format_entry), id 기준 중복 제거(unique)는
+모든 소스가 같은 함수를 쓴다.
+
+    story = HNStory(1, "Show HN: ...", url, score=120, posted_at=ts, num_comments=12, author="pg")
+    rows = [item.to_row("dev") for item in iter_items(raw_data)]
+"""
+
+from typing import Any, Collection, Dict, Hashable, Iterable, Iterator, List, Optional
+
+
+class TrendItem:
+    """수집기 공통 항목
+
+    source: 저장용 출처 ("Hacker News", "RSS/Reuters")
+    id: 소스 안에서 항목을 구분하는 값 (API ID, 없으면 URL 등 이미 가진 값). unique()의 기준
+        ContentCache 키(hn_123)는 claim할 때만 만들고 보관하지 않는다
+    title/url/body: 저장되는 값 그대로 (FRED처럼 URL이 없으면 제목+본문이 저장 키)
+    posted_at: 게시 시각 epoch 초 (모르면 None)
+    """
+
+    __slots__ = ("source", "id", "title", "url", "score", "body", "posted_at")
+
+    def __init__(self, source: str, id: Hashable, title: str, url: str = "", score: int = 0,
+                 body: str = "", posted_at: Optional[float] = None):
+        self.source = source
+        self.id = id
+        self.title = title
+        self.url = url
+        self.score = score
+        self.body = body
+        self.posted_at = posted_at
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.source!r}, {self.id!r}, {self.title!r})"
+
+    @property
+    def meta(self) -> str:
+        """저장용 부가 정보"""
+        return ""
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """시계열 수치"""
+        return {}
+
+    def to_row(self, category: str) -> dict:
+        """TrendStorage.save_items 형식 dict"""
+        return {"source": self.source, "category": category, "title": self.title, "url": self.url,
+                "score": self.score, "body": self.body, "meta": self.meta,
+                "metrics": self.metrics, "posted_at": self.posted_at}
+
+    def metric_sample(self) -> dict:
+        """TrendStorage.record_metrics 형식 dict (캐시되어 다시 저장하지 않는 항목의 현재 수치)"""
+        return {"source": self.source, "title": self.title, "url": self.url, "body": self.body,
+                "metrics": self.metrics, "posted_at": self.posted_at}
+
+
+def iter_items(data: Any, keys: Optional[Collection[str]] = None) -> Iterator[TrendItem]:
+    """수집 결과(리스트, {이름: 리스트}, 중첩 dict)에 든 TrendItem을 순서대로 반환
+
+    keys가 있으면 최상위 dict에서 해당 키만 본다 (RSS 카테고리 버킷 분리).
+    TrendItem이 아닌 값(Claude Code npm 패키지 정보 등)은 건너뛴다.
+    """
+    if isinstance(data, TrendItem):
+        yield data
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            if keys is None or key in keys:
+                yield from iter_items(value)
+    elif isinstance(data, (list, tuple)):
+        for value in data:
+            if isinstance(value, TrendItem):  # 항목마다 하위 제너레이터를 만들지 않음
+                yield value
+            else:
+                yield from iter_items(value)
+
+
+def unique(items: Iterable[TrendItem], exclude: Iterable[TrendItem] = ()) -> List[TrendItem]:
+    """id 기준 중복 제거 (먼저 나온 항목 유지, exclude에 있는 항목은 제외)"""
+    seen = {item.id for item in exclude}
+    result = []
+    for item in items:
+        if item.id not in seen:
+            seen.add(item.id)
+            result.append(item)
+    return result
+
+
+def format_entry(marker: str, headline: str, *lines: Optional[str], indent: str = "   ") -> str:
+    """분석용 텍스트 항목: '<marker> <headline>' 아래에 들여쓴 상세 줄 (None인 줄은 생략)"""
+    return "".join([f"{marker} {headline}\n", *(f"{indent}{line}\n" for line in lines if line is not None)])
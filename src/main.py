@@ -3,6 +3,7 @@
 
 import os
 import sys
+import time
 from pathlib import Path
 
 # 프로젝트 루트를 path에 추가
@@ -10,21 +11,19 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
+import functools
 import json
 import yaml
 from dotenv import load_dotenv
 
 from cache import ContentCache
-from storage import TrendStorage
-from collectors import (
-    HackerNewsCollector, RSSCollector, DevToCollector, LobstersCollector,
-    GitHubTrendingCollector, HuggingFaceCollector, GitHubAPICollector,
-    ArxivCollector, OSVCollector, GDELTCollector, FREDCollector,
-    SECFilingsCollector, TreasuryPressCollector, ClaudeCodeCollector,
-    GeekNewsNewCollector
-)
+from items import iter_items
+from storage import StorageWriter, TrendStorage
+import http_client
+import profiler
+from collection import CollectionEngine, CollectionTask
+import collectors
 from analyzer import TrendAnalyzer
-from publisher import GitHubPagesPublisher
 
 
 def load_config():
@@ -61,150 +60,143 @@ def load_previous_reports(limit: int = 10) -> dict:
     return previous
 
 
-def store_collected_data(storage: TrendStorage, collectors: dict):
-    """수집기별 구조화된 데이터를 항목 단위로 DB에 저장"""
+def stream_to_storage(writer: StorageWriter, task: CollectionTask, raw_data):
+    """수집기 하나가 끝나는 즉시 항목 행을 저장 큐에 전달 (엔진 워커 스레드에서 호출)
+
+    엔진은 결과를 버리지 않기로 확정한 작업에만 호출하므로 여기서 넘긴 행은 ok 결과의 것뿐이다.
+
+    캐시 때문에 이번에 수집되지 않은 항목의 수치(collector.metric_samples)도 함께 넘겨 시계열에 기록한다.
+    """
+    if raw_data is not None:
+        if task.splits:
+            # RSS처럼 버킷별로 나뉘는 수집기는 버킷의 카테고리 항목만 해당 버킷으로 저장
+            items = [row for bucket, keys in task.splits.items()
+                     for row in _extract_items(raw_data, bucket, keys)]
+        else:
+            items = _extract_items(raw_data, task.category or "dev")
+        if items:
+            writer.put_items(task.label, items)
+            print(f"[Storage] {task.label}: {len(items)}개 항목")
+    writer.put_metrics(task.label, getattr(task.collector, "metric_samples", None) or [])
+
+
+def finish_storage(storage: TrendStorage, writer: StorageWriter):
+    """저장 큐를 비운 뒤 결과 출력 및 수집량이 줄어든 소스 경고"""
+    summary = writer.close()
+    print(f"[Storage] 총 {summary['received']}개 항목 중 신규 {summary['inserted']}개 저장 (나머지는 기존 항목 갱신)")
+    if summary["recorded"]:
+        print(f"[Storage] 기존 항목 수치 {summary['recorded']}개 기록")
+    if summary["dropped"] or summary["errors"]:
+        print(f"[Storage] 버린 항목 {summary['dropped']}개, 저장 실패 {summary['errors']}회")
     try:
-        for name, (collector, raw_data, category) in collectors.items():
-            if raw_data is None:
-                continue
-            items = _extract_items(name, raw_data, category)
-            if items:
-                storage.save_items(items)
-                print(f"[Storage] {name}: {len(items)}개 항목 저장")
-        storage.flush()
+        unhealthy = [h for h in storage.source_health() if h["status"] != "ok"]
+        if unhealthy:
+            print("[Storage] 수집량이 줄어든 소스: " + ", ".join(
+                f"{h['source']}({h['status']}, 마지막 {h['last_date']})" for h in unhealthy))
     except Exception as e:
-        print(f"[Storage] 저장 실패: {e}")
-
-
-def _extract_items(source: str, raw_data, category: str) -> list:
-    """수집기 데이터를 항목 단위 dict 리스트로 변환"""
-    items = []
-
-    if source == "Hacker News":
-        for stories in raw_data.values():
-            for s in stories:
-                items.append({"source": source, "category": category,
-                              "title": s.title, "url": s.url, "score": s.score,
-                              "meta": f"comments:{s.num_comments} by:{s.author}"})
-
-    elif source == "DEV.to":
-        for articles in raw_data.values():
-            for a in articles:
-                items.append({"source": source, "category": category,
-                              "title": a.title, "url": a.url,
-                              "score": a.positive_reactions_count,
-                              "body": a.description,
-                              "meta": f"tags:{','.join(a.tags[:3])} comments:{a.comments_count}"})
-
-    elif source == "Lobsters":
-        for stories in raw_data.values():
-            for s in stories:
-                items.append({"source": source, "category": category,
-                              "title": s.title, "url": s.url, "score": s.score,
-                              "meta": f"tags:{','.join(s.tags[:3])} comments:{s.comment_count}"})
-
-    elif source.startswith("RSS"):
-        market_cats = {"world", "stocks", "macro", "community"}
-        dev_cats = {"tech", "ai", "trending"}
-        target_cats = market_cats if category == "market" else dev_cats
-        for cat_name, cat_items in raw_data.items():
-            if cat_name not in target_cats:
-                continue
-            for r in cat_items:
-                items.append({"source": f"RSS/{r.source}", "category": category,
-                              "title": r.title, "url": r.url, "body": r.summary})
-
-    elif source == "GitHub Trending":
-        for repos in raw_data.values():
-            for r in repos:
-                items.append({"source": source, "category": category,
-                              "title": r.name, "url": r.url, "score": r.stars,
-                              "body": r.description,
-                              "meta": f"lang:{r.language} today:+{r.stars_today}"})
-
-    elif source == "GitHub API":
-        for repos in raw_data.values():
-            for r in repos:
-                items.append({"source": source, "category": category,
-                              "title": r.full_name, "url": r.url, "score": r.stars,
-                              "body": r.description,
-                              "meta": f"lang:{r.language} query:{r.query_name}"})
-
-    elif source == "arXiv":
-        for papers in raw_data.values():
-            for p in papers:
-                items.append({"source": source, "category": category,
-                              "title": p.title, "url": p.url,
-                              "body": p.summary[:500],
-                              "meta": f"authors:{','.join(p.authors[:3])}"})
-
-    elif source == "GDELT":
-        for articles in raw_data.values():
-            for a in articles:
-                items.append({"source": source, "category": category,
-                              "title": a.title, "url": a.url,
-                              "meta": f"domain:{a.domain}"})
-
-    elif source == "FRED":
-        for obs in (raw_data if isinstance(raw_data, list) else []):
-            items.append({"source": source, "category": category,
-                          "title": f"{obs.name} ({obs.series_id})",
-                          "body": f"{obs.date}: {obs.value} (prev: {obs.previous_value})",
-                          "meta": f"category:{obs.category}"})
-
-    elif source == "SEC":
-        for filings in raw_data.values():
-            for f in filings:
-                items.append({"source": source, "category": category,
-                              "title": f"{f.company} ({f.ticker}) - {f.form}",
-                              "url": f.url,
-                              "meta": f"date:{f.filing_date}"})
-
-    elif source == "Treasury":
-        for pr in (raw_data if isinstance(raw_data, list) else []):
-            items.append({"source": source, "category": category,
-                          "title": pr.title, "url": pr.url,
-                          "meta": f"date:{pr.date}"})
-
-    elif source == "Claude Code":
-        releases = raw_data.get("releases", [])
-        for r in releases:
-            items.append({"source": source, "category": category,
-                          "title": f"Release {r.tag_name}", "url": r.url,
-                          "body": r.body[:500] if r.body else ""})
-        for bucket_name, issues in raw_data.get("issues", {}).items():
-            for iss in issues:
-                items.append({"source": source, "category": category,
-                              "title": iss.title, "url": iss.url,
-                              "meta": f"labels:{','.join(iss.labels[:3])}"})
-
-    elif source == "GeekNews":
-        for g in (raw_data if isinstance(raw_data, list) else []):
-            items.append({"source": source, "category": category,
-                          "title": g.title, "url": g.source_url,
-                          "score": g.points,
-                          "body": g.summary,
-                          "meta": f"domain:{g.source_domain}"})
-
-    elif source == "Hugging Face":
-        for models in raw_data.values():
-            for m in models:
-                items.append({"source": source, "category": category,
-                              "title": m.id, "url": m.url, "score": m.downloads,
-                              "meta": f"likes:{m.likes} pipeline:{m.pipeline_tag}"})
-
-    elif source == "OSV":
-        for vulns in raw_data.values():
-            for v in vulns:
-                items.append({"source": source, "category": category,
-                              "title": f"{v.vuln_id}: {v.package} ({v.ecosystem})",
-                              "meta": f"aliases:{','.join(v.aliases[:3])}"})
-
-    return items
+        print(f"[Storage] 상태 확인 실패: {e}")
+
+
+def _extract_items(raw_data, category: str, keys=None) -> list:
+    """수집 결과의 TrendItem을 저장 행(save_items 형식 dict) 리스트로 변환 (keys: 최상위 키 필터)"""
+    return [item.to_row(category) for item in iter_items(raw_data, keys)]
+
+
+# 버킷 텍스트가 이보다 짧으면 "새 데이터 거의 없음"으로 처리
+MIN_ANALYSIS_CHARS = 300
+
+
+def collection_deadline(engine_cfg: dict, elapsed: float):
+    """수집 제한 시간(초) 계산
+
+    budget(전체 실행 예산)에서 reserve(저장/분석/발행 예약 시간)와 이미 지난 시간을 뺀 값.
+    run_deadline이 함께 지정되면 둘 중 작은 값을 사용한다.
+    """
+    run_deadline = engine_cfg.get("run_deadline")
+    budget = engine_cfg.get("budget")
+    if not budget:
+        return run_deadline
+
+    reserve = engine_cfg.get("reserve", 0)
+    available = max(engine_cfg.get("min_collection", 30), budget - reserve - elapsed)
+    if run_deadline:
+        available = min(available, run_deadline)
+    print(f"[수집] 실행 예산 {budget}초 중 수집 {available:.0f}초 (저장/분석/발행 예약 {reserve}초)")
+    return available
+
+
+def finish_content_cache(cache: ContentCache, engine: CollectionEngine, results: list,
+                         succeeded: dict):
+    """수집기별로 이번 실행에서 본 ID를 확정하거나 취소한 뒤 저장
+
+    succeeded는 리포트(버킷)별 분석/발행 성공 여부. 결과가 ok이고 결과가 들어간 리포트가 모두
+    성공한 수집기의 ID만 확정하고, 결과를 버린 수집기(timeout, cancelled, error)나 실패한 리포트에
+    들어간 수집기의 ID는 취소해 다음 실행에서 다시 수집한다.
+
+    HTTP 재검증 캐시는 아무것도 취소하지 않은 경우에만 저장한다. 취소한 항목의 목록이 304로 응답되면
+    수집기가 '변경 없음'으로 건너뛰어 다음 실행에서 다시 수집하지 못하기 때문.
+    실행 중 예외가 발생하면 이 함수가 호출되지 않으므로 아무것도 저장되지 않는다.
+    """
+    with profiler.span("cache.finish") as span:
+        kept, dropped = [], []
+        for result in results:
+            if result.status == "ok" and all(succeeded.get(bucket, False) for bucket in result.task.buckets):
+                kept.append(engine.scope(result.task).name)
+            else:
+                dropped.append(result.task.label)
+        committed = cache.commit(kept)
+        rolled_back = 0
+
+        # 수집기 밖에서 표시한 ID는 모든 리포트가 성공했을 때만 확정. 아니면 버린 수집기의 ID와 함께
+        # 한 번에 취소 (취소한 항목의 first_seen 복원은 테이블을 다시 만들므로 scope별로 나누지 않음)
+        complete = not dropped and bool(succeeded) and all(succeeded.values())
+        if complete:
+            committed += cache.commit()
+        else:
+            rolled_back = cache.rollback()
+
+        print(f"\n[캐시] 이번 실행 항목 {committed}개 확정")
+        if rolled_back or dropped:
+            print(f"[캐시] 리포트에 반영되지 않은 항목 {rolled_back}개는 다음 실행에서 다시 수집합니다"
+                  + (f" ({', '.join(dropped)})" if dropped else ""))
+        cache.save()
+        if complete:
+            http_client.save_cache()
+        span.set(committed=committed, rolled_back=rolled_back, content_cache=cache.stats())
+
+
+def print_import_times(task_count: int):
+    """수집기 모듈 import 소요 시간 출력 (느린 순)"""
+    times = collectors.import_times()
+    total = sum(times.values())
+    print(f"[Import] 수집기 {task_count}개 사용, 모듈 {len(times)}개 import {total:.2f}초")
+    for module, elapsed in sorted(times.items(), key=lambda kv: -kv[1])[:5]:
+        print(f"  - {module}: {elapsed * 1000:.0f}ms")
 
 
 def main():
-    """메인 실행 함수"""
+    """메인 실행 함수 (실행마다 data/runs/<timestamp>.json 보고서 기록)"""
+    run_profiler = profiler.get_profiler()
+    run_profiler.start("main")
+    exit_code = 1
+    try:
+        exit_code = run_pipeline()
+        return exit_code
+    finally:
+        run_profiler.finish(exit_code=exit_code)
+        run_profiler.print_summary()
+        run_profiler.write_report(
+            str(project_root / "data" / "runs"),
+            http=http_client.get_stats().summary(),
+            rate_limits=http_client.get_limiter().summary(),
+            imports=collectors.import_times(),
+        )
+
+
+def run_pipeline() -> int:
+    """수집 → 저장 → 분석 → 발행"""
+    run_start = time.monotonic()
+
     # 환경변수 로드
     load_dotenv(project_root / ".env")
 
@@ -214,151 +206,182 @@ def main():
 
     # 설정 로드
     config = load_config()
+    http_client.configure(config.get("http"), cache_dir=str(project_root / "cache"))
 
     # 캐시 및 저장소 초기화
-    cache = ContentCache(cache_dir=str(project_root / "cache"))
-    storage = TrendStorage()
+    cache_cfg = config.get("cache", {})
+    cache = ContentCache(
+        cache_dir=str(project_root / "cache"),
+        ttl_days=cache_cfg.get("ttl_days", 7),
+        max_entries=cache_cfg.get("max_entries", 10000),
+        compact=cache_cfg.get("compact", False),
+        namespaces=cache_cfg.get("namespaces"),
+    )
+    # 이번 실행에서 본 ID는 분석/발행이 끝난 뒤에 확정 (finish_content_cache)
+    cache.begin()
+    # 수집기가 끝나는 대로 writer 스레드가 저장 (storage는 close 전까지 writer 스레드만 사용)
+    storage = TrendStorage(check_same_thread=False)
+    writer = StorageWriter(storage, max_pending=config.get("storage", {}).get("writer_queue", 32)).start()
 
     # 수집 데이터를 market/dev 버퍼로 분리
     data_buckets = {
         "market": [],
         "dev": [],
     }
-    total_steps = 15  # run_collection_step 호출 수와 일치시킬 것
-    hn_collector = HackerNewsCollector(cache=cache)
-    devto_collector = DevToCollector(cache=cache)
-    lobsters_collector = LobstersCollector(cache=cache)
-    rss_collector = RSSCollector(cache=cache)
-    github_trending_collector = GitHubTrendingCollector(cache=cache)
-    github_api_collector = GitHubAPICollector(cache=cache)
-    arxiv_collector = ArxivCollector(cache=cache)
-    osv_collector = OSVCollector(cache=cache)
-    gdelt_collector = GDELTCollector(cache=cache)
-    fred_collector = FREDCollector(cache=cache)
-    sec_collector = SECFilingsCollector(cache=cache)
-    treasury_collector = TreasuryPressCollector(cache=cache)
-    claude_code_collector = ClaudeCodeCollector(cache=cache)
-    geeknews_collector = GeekNewsNewCollector(cache=cache)
-    hf_collector = HuggingFaceCollector(cache=cache)
-
-    # 수집 파이프라인 정의: (step, label, collector, category, collect_kwargs, format_kwargs)
-    # category가 None이면 RSS처럼 특수 처리
+
+    def timeout_of(section: str):
+        """소스별 제한 시간 (config/sources.yaml의 <section>.timeout)"""
+        return (config.get(section) or {}).get("timeout")
+
+    def priority_of(section: str) -> int:
+        """소스별 우선순위 (config/sources.yaml의 <section>.priority, 1이 가장 높음)"""
+        return (config.get(section) or {}).get("priority", 2)
+
+    # TREND_SOURCES=hackernews,rss 처럼 지정하면 해당 소스만 수집
+    selected_sources = {s.strip() for s in os.getenv("TREND_SOURCES", "").split(",") if s.strip()}
+
+    def source_enabled(section: str) -> bool:
+        """<section>.enabled가 false이거나 TREND_SOURCES 목록에 없으면 수집하지 않음"""
+        if (config.get(section) or {}).get("enabled", True) is False:
+            return False
+        return not selected_sources or section in selected_sources
+
+    def task(step: int, label: str, section: str, category, collect_kwargs: dict, **options):
+        """수집 작업 생성 (수집기 모듈은 활성화된 소스만 import)"""
+        if not source_enabled(section):
+            return None
+        collector = collectors.create_collector(section, cache=cache)
+        return CollectionTask(step, label, collector, category, collect_kwargs,
+                              timeout=timeout_of(section), priority=priority_of(section), **options)
+
+    # 수집 파이프라인 정의 (config/sources.yaml 섹션 이름으로 수집기 선택)
+    # category가 None이면 RSS처럼 splits 기준으로 market/dev 분리
     pipeline = [
-        (1, "Hacker News", hn_collector, "dev",
-         {"top_limit": config["hackernews"].get("top_stories", 20),
-          "best_limit": config["hackernews"].get("best_stories", 10)}, {}),
-        (2, "DEV.to", devto_collector, "dev",
-         {"general_limit": config.get("devto", {}).get("limit", 20),
-          "tags": config.get("devto", {}).get("tags")}, {}),
-        (3, "Lobste.rs", lobsters_collector, "dev",
-         {"hottest_limit": config.get("lobsters", {}).get("hottest", 20),
-          "newest_limit": config.get("lobsters", {}).get("newest", 10)}, {}),
-        (4, "RSS", rss_collector, None,  # 특수: market/dev 분리
-         {"feeds_config": config["rss"].get("feeds", []),
-          "items_per_feed": config["rss"].get("items_per_feed", 8)}, {}),
-        (5, "GitHub Trending", github_trending_collector, "dev",
-         {"limit": 10}, {}),
-        (6, "GitHub API", github_api_collector, "dev",
-         {"queries": config.get("github_api", {}).get("queries", []),
-          "days_back": config.get("github_api", {}).get("days_back", 7),
-          "per_query": config.get("github_api", {}).get("per_query", 5)}, {}),
-        (7, "Claude Code", claude_code_collector, "dev",
-         {"release_limit": config.get("claude_code", {}).get("release_limit", 3),
-          "issue_buckets": config.get("claude_code", {}).get("issue_buckets", []),
-          "issue_limit": config.get("claude_code", {}).get("issue_limit", 3)}, {}),
-        (8, "GeekNews", geeknews_collector, "dev",
-         {"limit": config.get("geeknews_new", {}).get("limit", 12)}, {}),
-        (9, "arXiv", arxiv_collector, "dev",
-         {"queries": config.get("arxiv", {}).get("queries", []),
-          "per_query": config.get("arxiv", {}).get("per_query", 5)}, {}),
-        (10, "OSV", osv_collector, "dev",
-         {"packages": config.get("osv", {}).get("packages", []),
-          "max_vulns_per_package": config.get("osv", {}).get("max_vulns_per_package", 3)}, {}),
-        (11, "GDELT", gdelt_collector, "market",
-         {"queries": config.get("gdelt", {}).get("queries", []),
-          "max_records": config.get("gdelt", {}).get("max_records", 8),
-          "timespan": config.get("gdelt", {}).get("timespan", "24h")}, {}),
-        (12, "FRED", fred_collector, "market",
-         {"series": config.get("fred", {}).get("series", [])}, {}),
-        (13, "SEC", sec_collector, "market",
-         {"companies": config.get("sec", {}).get("companies", []),
-          "limit_per_company": config.get("sec", {}).get("limit_per_company", 3)}, {}),
-        (14, "Treasury", treasury_collector, "market",
-         {"limit": config.get("treasury", {}).get("limit", 6)}, {}),
-        (15, "Hugging Face", hf_collector, "dev",
-         {"trending_limit": 8, "recent_limit": 5}, {}),
+        task(1, "Hacker News", "hackernews", "dev",
+             {"top_limit": config["hackernews"].get("top_stories", 20),
+              "best_limit": config["hackernews"].get("best_stories", 10)}),
+        task(2, "DEV.to", "devto", "dev",
+             {"general_limit": config.get("devto", {}).get("limit", 20),
+              "tags": config.get("devto", {}).get("tags")}),
+        task(3, "Lobste.rs", "lobsters", "dev",
+             {"hottest_limit": config.get("lobsters", {}).get("hottest", 20),
+              "newest_limit": config.get("lobsters", {}).get("newest", 10)}),
+        task(4, "RSS", "rss", None,
+             {"feeds_config": config["rss"].get("feeds", []),
+              "items_per_feed": config["rss"].get("items_per_feed", 8)},
+             splits={"market": ["world", "stocks", "macro", "community"],
+                     "dev": ["tech", "ai", "trending"]}),
+        task(5, "GitHub Trending", "github_trending", "dev",
+             {"limit": 10}),
+        task(6, "GitHub API", "github_api", "dev",
+             {"queries": config.get("github_api", {}).get("queries", []),
+              "days_back": config.get("github_api", {}).get("days_back", 7),
+              "per_query": config.get("github_api", {}).get("per_query", 5)}),
+        task(7, "Claude Code", "claude_code", "dev",
+             {"release_limit": config.get("claude_code", {}).get("release_limit", 3),
+              "issue_buckets": config.get("claude_code", {}).get("issue_buckets", []),
+              "issue_limit": config.get("claude_code", {}).get("issue_limit", 3)}),
+        task(8, "GeekNews", "geeknews_new", "dev",
+             {"limit": config.get("geeknews_new", {}).get("limit", 12)}),
+        task(9, "arXiv", "arxiv", "dev",
+             {"queries": config.get("arxiv", {}).get("queries", []),
+              "per_query": config.get("arxiv", {}).get("per_query", 5)}),
+        task(10, "OSV", "osv", "dev",
+             {"packages": config.get("osv", {}).get("packages", []),
+              "max_vulns_per_package": config.get("osv", {}).get("max_vulns_per_package", 3)}),
+        task(11, "GDELT", "gdelt", "market",
+             {"queries": config.get("gdelt", {}).get("queries", []),
+              "max_records": config.get("gdelt", {}).get("max_records", 8),
+              "timespan": config.get("gdelt", {}).get("timespan", "24h")}),
+        task(12, "FRED", "fred", "market",
+             {"series": config.get("fred", {}).get("series", [])}),
+        task(13, "SEC", "sec", "market",
+             {"companies": config.get("sec", {}).get("companies", []),
+              "limit_per_company": config.get("sec", {}).get("limit_per_company", 3)}),
+        task(14, "Treasury", "treasury", "market",
+             {"limit": config.get("treasury", {}).get("limit", 6)}),
+        task(15, "Hugging Face", "huggingface", "dev",
+             {"trending_limit": 8, "recent_limit": 5}),
     ]
+    pipeline = [t for t in pipeline if t is not None]
+    print_import_times(len(pipeline))
+
+    # 수집기 병렬 실행 후 step 순서대로 병합
+    engine_cfg = config.get("collection", {})
+    engine = CollectionEngine(
+        max_workers=engine_cfg.get("max_workers", 6),
+        collector_timeout=engine_cfg.get("collector_timeout", 120),
+        run_deadline=collection_deadline(engine_cfg, time.monotonic() - run_start),
+        mode=engine_cfg.get("mode", "threads"),
+        low_water=engine_cfg.get("low_water", 0),
+    )
 
-    # raw 데이터 보존용
-    raw_collected = {}
-
-    for step, label, collector, category, collect_kw, format_kw in pipeline:
-        print(f"\n[{step}/{total_steps}] {label} 데이터 수집 중...")
+    # 버킷(market/dev) 수집이 끝나는 즉시 해당 리포트 분석 시작
+    # (market 리포트는 dev 소스를 수집하는 동안 생성됨)
+    previous_reports = load_previous_reports(limit=5)
+    analyzer = TrendAnalyzer(report_timeout=config.get("analysis", {}).get("timeout"))
+    date_str = analyzer.create_report_header()
+    analysis_jobs = {}
+
+    def on_bucket_done(bucket: str, bucket_results: list):
+        """데이터가 충분하면 바로 분석 시작 (부족하면 전체 수집 후 판단)"""
+        data = CollectionEngine.bucket_text(bucket_results, bucket)
+        if bucket in TrendAnalyzer.REPORTS and len(data) >= MIN_ANALYSIS_CHARS:
+            print(f"\n[분석] {bucket} 소스 수집 완료 - 리포트 생성 시작")
+            analysis_jobs[bucket] = analyzer.submit_report(bucket, data, previous_reports[bucket])
+
+    with profiler.span("collection", mode=engine.mode) as collection_span:
+        results = engine.run(pipeline, on_bucket_done=on_bucket_done,
+                             on_collected=functools.partial(stream_to_storage, writer))
+        collection_span.set(results=[
+            {"label": r.task.label, "status": r.status, "elapsed": round(r.elapsed, 3), "error": r.error}
+            for r in results
+        ])
+
+    CollectionEngine.merge(results, data_buckets)
+
+    http_client.get_stats().print_summary()
+    http_client.get_limiter().print_summary()
+
+    # 남은 저장 큐를 비우고 오래된 달 보관
+    with profiler.span("storage"):
+        finish_storage(storage, writer)
         try:
-            raw_data = collector.collect_all(**collect_kw)
-            raw_collected[label] = (collector, raw_data, category or "dev")
-
-            # RSS는 market/dev 분리
-            if label == "RSS":
-                market_text = collector.format_for_analysis(raw_data, categories=["world", "stocks", "macro", "community"])
-                dev_text = collector.format_for_analysis(raw_data, categories=["tech", "ai", "trending"])
-                if market_text:
-                    data_buckets["market"].append(market_text)
-                if dev_text:
-                    data_buckets["dev"].append(dev_text)
-                # RSS는 양쪽 카테고리로 저장
-                raw_collected["RSS/market"] = (collector, raw_data, "market")
-                raw_collected["RSS/dev"] = (collector, raw_data, "dev")
-            else:
-                text = collector.format_for_analysis(raw_data, **format_kw)
-                if text:
-                    data_buckets[category].append(text)
+            storage.archive_old(keep_months=config.get("storage", {}).get("hot_months", 3))
         except Exception as e:
-            print(f"[{label}] 수집 실패: {e}")
-
-    # 구조화 데이터를 항목 단위로 DB 저장
-    store_collected_data(storage, raw_collected)
-
-    # 캐시 및 저장소 저장
-    cache.save()
-    storage.close()
+            print(f"[Storage] 보관 실패: {e}")
+        storage.close()
 
     market_data = "\n".join(data_buckets["market"]).strip()
     dev_data = "\n".join(data_buckets["dev"]).strip()
 
     # 수집 데이터가 거의 없으면 분석 없이 종료
-    if len(market_data) < 300 and len(dev_data) < 300:
+    if len(market_data) < MIN_ANALYSIS_CHARS and len(dev_data) < MIN_ANALYSIS_CHARS:
         print("\n새로운 데이터가 거의 없습니다. 분석을 건너뜁니다.")
+        analyzer.close()
+        finish_content_cache(cache, engine, results, succeeded={})
         return 0
 
-    if len(market_data) < 300:
+    if len(market_data) < MIN_ANALYSIS_CHARS:
         market_data = "[시장/정세 관련 새 데이터가 거의 없습니다. 리포트가 필요하면 '새로운 업데이트 없음'을 중심으로 정리하세요.]\n"
 
-    if len(dev_data) < 300:
+    if len(dev_data) < MIN_ANALYSIS_CHARS:
         dev_data = "[개발/AI 관련 새 데이터가 거의 없습니다. 리포트가 필요하면 '새로운 업데이트 없음'을 중심으로 정리하세요.]\n"
 
-    # 이전 리포트 로드 (중복 방지)
-    previous_reports = load_previous_reports(limit=5)
-
-    # Gemini로 분석 (두 개의 리포트 생성)
+    # Gemini로 분석 (두 리포트 동시 생성, 수집 중 시작된 리포트는 결과만 수집)
     print("\n[분석] Gemini API로 분석 중...")
-    analyzer = TrendAnalyzer()
-    date_str = analyzer.create_report_header()
+    reports = analyzer.generate_reports({
+        "market": (market_data, previous_reports["market"]),
+        "dev": (dev_data, previous_reports["dev"]),
+    }, submitted=analysis_jobs)
+    analyzer.close()
 
     # 1. 세계 정세 & 주식 리포트
-    print("  - 세계 정세 & 주식 리포트 생성 중...")
-    world_headline, world_keywords, world_insight, world_report = analyzer.analyze_world_market(
-        market_data,
-        previous_titles=previous_reports["market"]
-    )
+    world_headline, world_keywords, world_insight, world_report = reports["market"]
     world_title = f"{world_headline} | {date_str}"
 
     # 2. 개발 & AI 리포트
-    print("  - 개발 & AI 리포트 생성 중...")
-    dev_headline, dev_keywords, dev_insight, dev_report = analyzer.analyze_dev_ai(
-        dev_data,
-        previous_titles=previous_reports["dev"]
-    )
+    dev_headline, dev_keywords, dev_insight, dev_report = reports["dev"]
     dev_title = f"{dev_headline} | {date_str}"
 
     print("\n" + "=" * 50)
@@ -374,9 +397,11 @@ def main():
     # GitHub Pages로 저장 (오전 실행 또는 수동 실행일 때만)
     publish_pages = os.getenv("PUBLISH_PAGES", "true").lower() == "true"
     publish_success = True
+    world_success = dev_success = True
 
     if publish_pages:
         print("\n[저장] GitHub Pages용 HTML 생성 중...")
+        from publisher import GitHubPagesPublisher
         publisher = GitHubPagesPublisher()
 
         world_success = publisher.publish(world_title, world_report, category="market", keywords=world_keywords, insight=world_insight)
@@ -390,6 +415,12 @@ def main():
     else:
         print("\n[저장] GitHub Pages 저장 건너뜀 (오전 실행에서만 저장)")
 
+    # 리포트별로 확정 (한 리포트가 실패해도 다른 리포트에 들어간 수집기의 항목은 확정)
+    finish_content_cache(cache, engine, results, succeeded={
+        "market": world_success and not TrendAnalyzer.is_failed(reports["market"]),
+        "dev": dev_success and not TrendAnalyzer.is_failed(reports["dev"]),
+    })
+
     return 0 if publish_success else 1
 
 
@@ -0,0 +1,224 @@
+"""실행 단계별 프로파일러
+
+main() 전체를 루트 구간으로 두고 수집/포맷/저장/분석/발행 단계를 중첩 구간(span)으로 기록한다.
+- 현재 구간은 contextvars로 추적하므로 asyncio 태스크와 asyncio.to_thread에서는 자동으로 이어지고,
+  스레드 풀에서는 contextvars.copy_context().run으로 제출하면 부모 구간 아래에 기록된다
+- 구간마다 소요 시간, 바이트/항목/요청/오류 수, 오류 메시지를 남긴다
+- HTTP 요청 바이트는 http_client가 현재 구간에 더한다
+- 실행이 끝나면 data/runs/<timestamp>.json으로 보고서 저장
+
+사용 예:
+    with profiler.span("storage.save_items") as span:
+        ...
+        span.add(items=len(items))
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytz
+
+
+COUNTERS = ("bytes", "items", "requests", "errors")
+
+
+class Span:
+    """시간 구간 하나 (자식 구간 포함)"""
+
+    def __init__(self, name: str, start: float, attrs: Optional[dict] = None):
+        self.name = name
+        self.start = start
+        self.duration: Optional[float] = None
+        self.attrs: Dict[str, Any] = dict(attrs or {})
+        self.counters: Dict[str, int] = {}
+        self.error = ""
+        self.thread = threading.current_thread().name
+        self.children: List["Span"] = []
+        self._lock = threading.Lock()
+
+    def add(self, **counts: int):
+        """카운터 증가 (bytes, items, requests, errors 등)"""
+        with self._lock:
+            for key, value in counts.items():
+                if value:
+                    self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, **attrs):
+        """속성 지정"""
+        with self._lock:
+            self.attrs.update(attrs)
+
+    def fail(self, message: str):
+        """예외 없이 처리된 실패 기록"""
+        with self._lock:
+            self.error = message
+            self.counters["errors"] = self.counters.get("errors", 0) + 1
+
+    def _attach(self, child: "Span"):
+        with self._lock:
+            self.children.append(child)
+
+    def to_dict(self, origin: float) -> dict:
+        """보고서용 dict (totals는 자식 구간 포함 합계)"""
+        with self._lock:
+            children = list(self.children)
+            data = {
+                "name": self.name,
+                "start": round(self.start - origin, 4),
+                "duration": round(self.duration, 4) if self.duration is not None else None,
+                "thread": self.thread,
+            }
+            if self.attrs:
+                data["attrs"] = dict(self.attrs)
+            if self.counters:
+                data["counters"] = dict(self.counters)
+            if self.error:
+                data["error"] = self.error
+
+        child_dicts = [child.to_dict(origin) for child in sorted(children, key=lambda c: c.start)]
+        totals = dict(data.get("counters", {}))
+        for child in child_dicts:
+            for key, value in child.get("totals", {}).items():
+                totals[key] = totals.get(key, 0) + value
+        if totals:
+            data["totals"] = totals
+        if child_dicts:
+            data["children"] = child_dicts
+        return data
+
+
+_current: ContextVar[Optional[Span]] = ContextVar("profiler_span", default=None)
+
+
+class RunProfiler:
+    """실행 하나의 구간 트리"""
+
+    def __init__(self):
+        self.root: Optional[Span] = None
+        self.origin = time.perf_counter()
+        self.started_at = ""
+
+    def start(self, name: str = "run") -> Span:
+        """루트 구간 시작 (현재 컨텍스트의 부모로 지정)"""
+        self.origin = time.perf_counter()
+        self.started_at = datetime.now(pytz.timezone('Asia/Seoul')).isoformat()
+        self.root = Span(name, self.origin)
+        _current.set(self.root)
+        return self.root
+
+    def finish(self, **attrs):
+        """루트 구간 종료"""
+        if self.root is None:
+            return
+        self.root.duration = time.perf_counter() - self.root.start
+        self.root.set(**attrs)
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """중첩 구간 기록. 예외는 오류로 기록 후 다시 발생"""
+        parent = _current.get() or self.root
+        span = Span(name, time.perf_counter(), attrs)
+        if parent is not None:
+            parent._attach(span)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            # 오류 수는 예외가 처음 발생한 구간에만 더함 (바깥 구간은 메시지만 기록)
+            if getattr(e, "_profiler_counted", False):
+                span.error = f"{type(e).__name__}: {e}"
+            else:
+                span.fail(f"{type(e).__name__}: {e}")
+                try:
+                    e._profiler_counted = True
+                except AttributeError:
+                    pass
+            raise
+        finally:
+            span.duration = time.perf_counter() - span.start
+            _current.reset(token)
+
+    def current(self) -> Optional[Span]:
+        """현재 컨텍스트의 구간 (없으면 루트)"""
+        return _current.get() or self.root
+
+    def add(self, **counts: int):
+        """현재 구간 카운터 증가"""
+        span = self.current()
+        if span is not None:
+            span.add(**counts)
+
+    def report(self, **sections) -> dict:
+        """보고서 dict (sections는 http 통계 등 추가 항목)"""
+        report = {
+            "started_at": self.started_at,
+            "spans": self.root.to_dict(self.origin) if self.root else None,
+        }
+        report.update(sections)
+        return report
+
+    def write_report(self, runs_dir: str, keep: int = 100, **sections) -> Optional[Path]:
+        """data/runs/<timestamp>.json 저장 후 오래된 보고서 정리"""
+        runs_path = Path(runs_dir)
+        try:
+            runs_path.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.now(pytz.timezone('Asia/Seoul')).strftime("%Y%m%d-%H%M%S")
+            path = runs_path / f"{stamp}.json"
+            tmp = path.with_suffix(".json.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.report(**sections), f, ensure_ascii=False, indent=2)
+            os.replace(tmp, path)
+
+            for old in sorted(runs_path.glob("*.json"))[:-keep]:
+                old.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"[Profiler] 실행 보고서 저장 실패: {e}")
+            return None
+
+        print(f"[Profiler] 실행 보고서 저장: {path}")
+        return path
+
+    def print_summary(self, depth: int = 2):
+        """상위 구간 소요 시간 출력"""
+        if self.root is None:
+            return
+        print("\n[Profiler] 단계별 소요 시간")
+        self._print_span(self.root.to_dict(self.origin), 0, depth)
+
+    def _print_span(self, data: dict, level: int, depth: int):
+        duration = data.get("duration")
+        duration_str = f"{duration:.2f}초" if duration is not None else "진행 중"
+        totals = data.get("totals", {})
+        extras = [f"{k} {totals[k]:,}" for k in COUNTERS if totals.get(k)]
+        suffix = f" ({', '.join(extras)})" if extras else ""
+        print(f"  {'  ' * level}- {data['name']}: {duration_str}{suffix}")
+        if level < depth:
+            for child in data.get("children", []):
+                self._print_span(child, level + 1, depth)
+
+
+# ── 프로세스 공용 인스턴스 ──
+
+_profiler = RunProfiler()
+
+
+def get_profiler() -> RunProfiler:
+    """공용 프로파일러"""
+    return _profiler
+
+
+def span(name: str, **attrs):
+    """공용 프로파일러의 중첩 구간"""
+    return _profiler.span(name, **attrs)
+
+
+def add(**counts: int):
+    """공용 프로파일러의 현재 구간 카운터 증가"""
+    _profiler.add(**counts)
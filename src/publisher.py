@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Optional
 import pytz
 
+import profiler
+
 
 class GitHubPagesPublisher:
     """리포트를 GitHub Pages용 HTML로 저장 (SEO 최적화)"""
@@ -43,39 +45,42 @@ class GitHubPagesPublisher:
         """
         if keywords is None:
             keywords = []
-        try:
-            # 디렉토리 생성
-            self.docs_dir.mkdir(exist_ok=True)
-            self.reports_dir.mkdir(exist_ok=True)
+        with profiler.span("publisher.publish", category=category) as span:
+            try:
+                # 디렉토리 생성
+                self.docs_dir.mkdir(exist_ok=True)
+                self.reports_dir.mkdir(exist_ok=True)
 
-            # 파일명 생성 (날짜 + 카테고리 기반)
-            kst = pytz.timezone('Asia/Seoul')
-            now = datetime.now(kst)
-            filename = now.strftime("%Y-%m-%d-%H%M") + f"-{category}.html"
-            filepath = self.reports_dir / filename
+                # 파일명 생성 (날짜 + 카테고리 기반)
+                kst = pytz.timezone('Asia/Seoul')
+                now = datetime.now(kst)
+                filename = now.strftime("%Y-%m-%d-%H%M") + f"-{category}.html"
+                filepath = self.reports_dir / filename
 
-            # 메타 설명 추출
-            description = self._extract_description(content)
+                # 메타 설명 추출
+                description = self._extract_description(content)
 
-            # 읽기 시간 계산
-            reading_time = self._calculate_reading_time(content)
+                # 읽기 시간 계산
+                reading_time = self._calculate_reading_time(content)
 
-            # HTML 생성
-            report_html = self._generate_html(title, content, now, category, filename, description, reading_time)
-            filepath.write_text(report_html, encoding='utf-8')
-            print(f"[Publisher] 리포트 저장: {filepath}")
+                # HTML 생성
+                report_html = self._generate_html(title, content, now, category, filename, description, reading_time)
+                filepath.write_text(report_html, encoding='utf-8')
+                span.add(bytes=len(report_html.encode('utf-8')))
+                print(f"[Publisher] 리포트 저장: {filepath}")
 
-            # 인덱스 업데이트
-            self._update_index(title, filename, now, category, description, reading_time, keywords, insight)
+                # 인덱스 업데이트
+                self._update_index(title, filename, now, category, description, reading_time, keywords, insight)
 
-            # robots.txt 생성 (없으면)
-            self._generate_robots()
+                # robots.txt 생성 (없으면)
+                self._generate_robots()
 
-            return True
+                return True
 
-        except Exception as e:
-            print(f"[Publisher] 저장 실패: {e}")
-            return False
+            except Exception as e:
+                print(f"[Publisher] 저장 실패: {e}")
+                span.fail(f"{type(e).__name__}: {e}")
+                return False
 
     def _calculate_reading_time(self, content: str) -> int:
         """콘텐츠 읽기 시간 계산 (분 단위)"""
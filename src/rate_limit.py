@@ -0,0 +1,149 @@
+"""호스트별 토큰 버킷 요청 속도 제한
+
+HTTPTransport / AsyncHTTPClient가 요청 직전에 호출한다.
+- 호스트마다 독립된 버킷을 두므로 제한이 필요한 호스트만 대기하고 다른 요청은 그대로 진행
+- 버킷은 interval초마다 토큰 1개씩 채워지며 최대 burst개까지 모아 둘 수 있음
+- 429 / Retry-After 응답을 받으면 해당 호스트를 지정 시간 동안 차단
+- 호스트별 대기 횟수와 누적 대기 시간을 기록
+
+대기 시간은 락 안에서 토큰을 예약하며 계산하므로 스레드와 이벤트 루프에서 함께 사용할 수 있다.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+@dataclass
+class HostLimit:
+    """config/sources.yaml의 http.rate_limits 항목"""
+    interval: float = 0.0   # 토큰 1개가 채워지는 시간(초), 0이면 속도 제한 없음
+    burst: int = 1          # 연속으로 보낼 수 있는 최대 요청 수
+    penalty: float = 5.0    # Retry-After 없는 429 응답 시 차단 시간(초)
+
+
+class _Bucket:
+    """단일 호스트의 토큰 버킷 상태"""
+
+    def __init__(self, limit: HostLimit):
+        self.limit = limit
+        self.tokens = float(limit.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.waits = 0
+        self.throttled = 0.0
+        self.penalties = 0
+
+    def reserve(self, now: float) -> float:
+        """토큰 1개를 예약하고 필요한 대기 시간 반환 (토큰은 음수까지 허용)"""
+        wait = 0.0
+        if self.limit.interval > 0:
+            elapsed = now - self.updated
+            self.tokens = min(float(self.limit.burst), self.tokens + elapsed / self.limit.interval)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait = -self.tokens * self.limit.interval
+
+        wait = max(wait, self.blocked_until - now)
+        if wait > 0:
+            self.waits += 1
+            self.throttled += wait
+        return wait
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 모음 (스레드 안전)"""
+
+    def __init__(self, limits: Optional[Dict[str, HostLimit]] = None, max_penalty: float = 60.0):
+        self.limits = limits or {}
+        self.max_penalty = max_penalty
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cfg: Optional[dict]) -> "HostRateLimiter":
+        """{host: {interval, burst, penalty}} 형식의 설정으로 생성"""
+        limits = {}
+        for host, options in (cfg or {}).items():
+            known = {k: v for k, v in (options or {}).items() if k in HostLimit.__dataclass_fields__}
+            limits[host] = HostLimit(**known)
+        return cls(limits)
+
+    def _bucket(self, host: str) -> _Bucket:
+        """호스트 버킷 반환 (설정이 없는 호스트는 속도 제한 없는 버킷)"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(self.limits.get(host, HostLimit()))
+        return bucket
+
+    def _reserve(self, url: str) -> float:
+        host = urlsplit(url).hostname or "unknown"
+        with self._lock:
+            return self._bucket(host).reserve(time.monotonic())
+
+    def acquire(self, url: str):
+        """요청 전 호출 (현재 스레드만 대기)"""
+        wait = self._reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, url: str):
+        """요청 전 호출 (현재 코루틴만 대기)"""
+        wait = self._reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, url: str, retry_after: Optional[str] = None) -> float:
+        """429/503 응답 후 호스트 차단. 적용된 차단 시간 반환"""
+        host = urlsplit(url).hostname or "unknown"
+        with self._lock:
+            bucket = self._bucket(host)
+            delay = self._parse_retry_after(retry_after)
+            if delay is None:
+                delay = bucket.limit.penalty
+            delay = min(delay, self.max_penalty)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+            bucket.penalties += 1
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After 헤더 (초 또는 HTTP 날짜) 파싱"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def summary(self) -> Dict[str, dict]:
+        """{host: {waits, throttled, penalties}} (대기가 있었던 호스트만)"""
+        with self._lock:
+            return {
+                host: {
+                    "waits": b.waits,
+                    "throttled": round(b.throttled, 3),
+                    "penalties": b.penalties,
+                }
+                for host, b in sorted(self._buckets.items(), key=lambda kv: -kv[1].throttled)
+                if b.waits or b.penalties
+            }
+
+    def print_summary(self):
+        """호스트별 누적 대기 시간 출력"""
+        summary = self.summary()
+        if not summary:
+            return
+        total = sum(s["throttled"] for s in summary.values())
+        print(f"[속도 제한] {len(summary)}개 호스트, 누적 대기 {total:.1f}초")
+        for host, s in summary.items():
+            print(f"  - {host}: 대기 {s['waits']}회 {s['throttled']:.1f}초 (429/Retry-After {s['penalties']}회)")
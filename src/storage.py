@@ -3,25 +3,264 @@
 2단계 조회 패턴으로 컨텍스트/토큰 사용 최소화:
   Step 1: browse() — 제목+메타만 반환 (~50 bytes/항목)
   Step 2: get_detail() — 필요한 항목의 body만 반환
+
+항목은 item_key(정규화한 URL, URL이 없으면 출처+제목+본문의 해시)로 한 번만 저장된다.
+같은 항목을 다시 저장하면 새 행을 만들지 않고 score(최댓값), last_seen, seen_count만 갱신한다.
+
+점수/스타/다운로드 같은 수치는 item_metrics에 (item_id, metric, ts, value) 시계열로 쌓고,
+velocity()가 기간 내 증가량/시간당 증가율을 SQL로 계산한다.
+
+body/meta는 일정 길이 이상이면 zlib으로 압축한 BLOB으로 저장하고(짧은 값과 이전 행은 TEXT 그대로),
+get_detail()에서만 푼다. FTS는 SQL 함수 unz()로 풀어 보여 주는 items_text 뷰를 색인한다.
+
+(date, source, category)별 항목 수/점수 합계/최고 점수는 트리거가 item_rollup에 바로 반영하므로
+stats(), daily_stats(), source_health()는 항목 수가 아니라 날짜×소스 수에 비례해 계산된다.
+
+최근 몇 달(hot)만 data/trends.db에 두고, 그 이전 달은 archive_old()가 월별 읽기 전용 DB
+(data/archive/trends-YYYY-MM.db.gz)로 옮긴다. browse/search/get_detail/stats는 필요한 보관 DB만
+압축을 풀어 ATTACH해 전체 기간을 그대로 조회한다.
+보관한 항목의 item_key -> id는 hot DB의 archived_keys에 남겨, 같은 항목을 다시 수집하면 새 행을 만들지 않고
+archived_keys의 last_seen/seen_count를 갱신하며 수치 샘플은 기존 id로 기록한다.
 """
 
+import contextvars
+import gzip
+import hashlib
+import os
+import queue
+import shutil
 import sqlite3
-from datetime import datetime
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
 import pytz
 
+import profiler
+
+
+KST = pytz.timezone('Asia/Seoul')
+
+ITEM_COLUMNS = ("date", "source", "category", "title", "url", "score", "body", "meta",
+                "created_at", "item_key", "last_seen")
+INSERT_ITEM_SQL = (
+    f"INSERT INTO items ({', '.join(ITEM_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(ITEM_COLUMNS))}) "
+    "ON CONFLICT(item_key) DO UPDATE SET "
+    "score = MAX(items.score, excluded.score), "
+    "last_seen = excluded.last_seen, "
+    "seen_count = items.seen_count + 1"
+)
+
+# URL 비교 시 제외할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "ref_src", "mc_cid", "mc_eid", "igshid", "spm", "cmpid"}
+
+
+def normalize_url(url: str) -> str:
+    """같은 문서를 가리키는 URL을 같은 문자열로 정규화
+
+    스킴/www./fragment/끝 슬래시/추적 파라미터(utm_* 등)를 제거하고 쿼리 순서를 정렬한다.
+    """
+    parts = urlsplit((url or "").strip())
+    if not parts.netloc:
+        return ""
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/")
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    return f"{host}{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def item_key(source: str, title: str, url: str = "", body: str = "") -> str:
+    """항목 고유 키: 정규화한 URL, URL이 없으면 출처+제목+본문 (FRED 관측값처럼 본문만 바뀌는 항목 구분)"""
+    normalized = normalize_url(url)
+    if normalized:
+        basis = f"url:{normalized}"
+    else:
+        basis = "text:" + "|".join(" ".join(part.split()).casefold() for part in (source, title, body or ""))
+    return hashlib.sha1(basis.encode('utf-8')).hexdigest()
+
+ITEM_KEY_INDEX = ITEM_COLUMNS.index("item_key")
+# save_items 항목 dict 중 items 행이 아니라 item_metrics로 가는 키
+METRIC_FIELDS = ("metrics", "posted_at")
+
+# 이 길이(바이트) 이상인 body/meta만 압축 (짧은 문자열은 zlib 헤더 때문에 오히려 커짐)
+COMPRESS_MIN = 64
+# 공유 사전 크기 (zlib 창 크기 32KB를 넘는 부분은 쓰이지 않음)
+ZDICT_SIZE = 32 * 1024
+
+
+def primed_compressor(zdict: bytes):
+    """사전을 미리 읽어 둔 압축기 (pack_text가 행마다 복사해 사용, 사전 설정 비용을 한 번만 냄)"""
+    return zlib.compressobj(6, zdict=zdict)
+
+
+def pack_text(text: str, min_size: int = COMPRESS_MIN, primed=None, dict_id: int = 0):
+    """저장용 값: min_size 바이트 이상이고 압축이 이득이면 BLOB, 아니면 문자열 그대로
+
+    BLOB은 [사전 id 1바이트] + zlib 스트림이다 (id 0은 사전 없이 압축).
+    primed: dict_id 사전으로 만든 primed_compressor
+    """
+    if min_size is None:
+        return text
+    raw = text.encode('utf-8')
+    if len(raw) < min_size:
+        return text
+    if primed is None:
+        packed = b"\x00" + zlib.compress(raw, 6)
+    else:
+        compressor = primed.copy()
+        packed = bytes([dict_id]) + compressor.compress(raw) + compressor.flush()
+    return packed if len(packed) < len(raw) else text
+
+
+def unpack_text(value, dicts: dict = None) -> str:
+    """pack_text의 역변환. dicts: {사전 id: 사전} (SQL에서는 unz()로 등록)"""
+    if isinstance(value, bytes):
+        dict_id = value[0]
+        decompressor = zlib.decompressobj(zdict=dicts[dict_id]) if dict_id else zlib.decompressobj()
+        return (decompressor.decompress(value[1:]) + decompressor.flush()).decode('utf-8')
+    return value
+
+
+def connect(path: str, dicts: dict = None, **kwargs) -> sqlite3.Connection:
+    """unz() 함수를 등록한 연결 (FTS 트리거/뷰가 사용하므로 items를 쓰는 모든 연결에 필요)
+
+    dicts는 나중에 채워도 되도록 참조로 보관한다.
+    """
+    db = sqlite3.connect(path, **kwargs)
+    dicts = {} if dicts is None else dicts
+    db.create_function("unz", 1, lambda value: unpack_text(value, dicts), deterministic=True)
+    return db
+
+
+# FTS는 압축을 푼 items_text 뷰를 외부 콘텐츠로 사용 (snippet/rebuild도 평문 기준)
+FTS_SCHEMA = """
+    CREATE VIEW IF NOT EXISTS items_text AS
+        SELECT id, title, unz(body) AS body, source, category FROM items;
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+        title, body, source, category,
+        content='items_text', content_rowid='id',
+        tokenize='unicode61'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN
+        INSERT INTO items_fts(items_fts, rowid, title, body, source, category)
+        VALUES ('delete', old.id, old.title, unz(old.body), old.source, old.category);
+    END;
+"""
+
+FTS_INSERT_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN
+        INSERT INTO items_fts(rowid, title, body, source, category)
+        VALUES (new.id, new.title, unz(new.body), new.source, new.category);
+    END;
+"""
+
+# (date, source, category)별 집계. 삭제/변경 시 최고 점수는 해당 그룹만 다시 계산
+_ROLLUP_REMOVE_OLD = """
+        UPDATE item_rollup SET
+            item_count = item_count - 1,
+            score_sum = score_sum - old.score,
+            score_max = CASE WHEN old.score < score_max THEN score_max ELSE (
+                SELECT MAX(score) FROM items
+                WHERE source = old.source AND date = old.date AND category = old.category
+            ) END
+        WHERE date = old.date AND source = old.source AND category = old.category;
+        DELETE FROM item_rollup
+        WHERE date = old.date AND source = old.source AND category = old.category AND item_count <= 0;
+"""
+_ROLLUP_ADD_NEW = """
+        INSERT INTO item_rollup (date, source, category, item_count, score_sum, score_max)
+        VALUES (new.date, new.source, new.category, 1, new.score, new.score)
+        ON CONFLICT(date, source, category) DO UPDATE SET
+            item_count = item_count + 1,
+            score_sum = score_sum + excluded.score_sum,
+            score_max = MAX(score_max, excluded.score_max);
+"""
+
+# save_items는 두 트리거를 내리고 배치가 건드린 그룹만 한 번에 다시 계산 (_refresh_rollup)
+ROLLUP_INSERT_TRIGGER = f"""
+    CREATE TRIGGER IF NOT EXISTS item_rollup_ai AFTER INSERT ON items BEGIN
+        {_ROLLUP_ADD_NEW}
+    END;
+"""
+ROLLUP_UPDATE_TRIGGER = f"""
+    CREATE TRIGGER IF NOT EXISTS item_rollup_au AFTER UPDATE OF date, source, category, score ON items BEGIN
+        {_ROLLUP_REMOVE_OLD}
+        {_ROLLUP_ADD_NEW}
+    END;
+"""
+
+ROLLUP_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS item_rollup (
+        date TEXT NOT NULL,
+        source TEXT NOT NULL,
+        category TEXT NOT NULL,
+        item_count INTEGER NOT NULL,
+        score_sum INTEGER NOT NULL,
+        score_max INTEGER,
+        PRIMARY KEY (date, source, category)
+    ) WITHOUT ROWID;
+""" + ROLLUP_INSERT_TRIGGER + ROLLUP_UPDATE_TRIGGER
+
+ROLLUP_DELETE_TRIGGER = f"""
+    CREATE TRIGGER IF NOT EXISTS item_rollup_ad AFTER DELETE ON items BEGIN
+        {_ROLLUP_REMOVE_OLD}
+    END;
+"""
+
 
 class TrendStorage:
 
-    def __init__(self, db_path: str = None):
+    # 이 개수 이상을 한 번에 저장하면 FTS 트리거 대신 저장 후 한 번에 색인
+    FTS_DEFER_MIN = 2000
+
+    # body/meta 압축 기준 길이 (None이면 압축하지 않음)
+    COMPRESS_MIN = COMPRESS_MIN
+    # 항목이 이 개수 이상 쌓이면 최근 본문으로 공유 사전을 만듦 (train_dictionary)
+    DICT_TRAIN_MIN = 500
+    DICT_SAMPLE_ROWS = 2000
+
+    # item_key -> id 조회 시 IN (...) 한 번에 넣을 키 개수 (SQLite 변수 개수 제한 고려)
+    KEY_LOOKUP_CHUNK = 500
+
+    # 동시에 ATTACH해 둘 보관 DB 수 (SQLite 기본 한도 10 미만)
+    MAX_ATTACHED = 8
+
+    def __init__(self, db_path: str = None, archive_dir: str = None, check_same_thread: bool = True):
         if db_path is None:
             db_path = str(Path(__file__).parent.parent / "data" / "trends.db")
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-        self.db = sqlite3.connect(db_path)
+        self.db_path = db_path
+        self.archive_dir = Path(archive_dir) if archive_dir else Path(db_path).parent / "archive"
+        self._dicts = {}  # 압축 사전 {id: bytes}
+        self._dict_id = 0  # 새로 압축할 때 쓸 사전 (0: 없음)
+        self._primed = None  # _dict_id 사전의 primed_compressor
+        # StorageWriter처럼 다른 스레드에 넘길 때는 check_same_thread=False (동시에 한 스레드만 사용)
+        self.db = connect(db_path, self._dicts, uri=True, check_same_thread=check_same_thread)
         self.db.execute("PRAGMA journal_mode=WAL")
+        self._attached: "OrderedDict[str, str]" = OrderedDict()  # 월 -> 스키마 이름 (LRU)
+        self._tmp_dir = None  # 압축을 푼 보관 DB 위치 (close 시 삭제)
         self._init_tables()
 
     def _init_tables(self):
+        had_rollup = self.db.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'item_rollup'"
+        ).fetchone() is not None
+        had_archived_keys = self.db.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'archived_keys'"
+        ).fetchone() is not None
         self.db.executescript("""
             CREATE TABLE IF NOT EXISTS items (
                 id INTEGER PRIMARY KEY,
@@ -33,62 +272,645 @@ class TrendStorage:
                 score INTEGER DEFAULT 0,
                 body TEXT DEFAULT '',
                 meta TEXT DEFAULT '',
-                created_at TEXT NOT NULL
+                created_at TEXT NOT NULL,
+                item_key TEXT,
+                last_seen TEXT,
+                seen_count INTEGER DEFAULT 1
             );
 
-            CREATE INDEX IF NOT EXISTS idx_items_date ON items(date);
-            CREATE INDEX IF NOT EXISTS idx_items_source ON items(source);
-            CREATE INDEX IF NOT EXISTS idx_items_category ON items(category);
+            -- browse 정렬(date DESC, score DESC, id DESC) 순서의 커버링 인덱스
+            -- 필터 없음 / category / source 조회가 각각 임시 정렬 없이 인덱스만 읽는다
+            DROP INDEX IF EXISTS idx_items_date;
+            DROP INDEX IF EXISTS idx_items_source;
+            DROP INDEX IF EXISTS idx_items_category;
+            CREATE INDEX IF NOT EXISTS idx_items_browse
+                ON items(date, score, id, source, category, title);
+            CREATE INDEX IF NOT EXISTS idx_items_category_browse
+                ON items(category, date, score, id, source, title);
+            CREATE INDEX IF NOT EXISTS idx_items_source_browse
+                ON items(source, date, score, id, category, title);
 
-            CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
-                title, body, source, category,
-                content='items', content_rowid='id',
-                tokenize='unicode61'
-            );
+            -- 수치 시계열: ts는 epoch 초, 같은 항목/지표/시각은 한 값만 유지
+            CREATE TABLE IF NOT EXISTS item_metrics (
+                item_id INTEGER NOT NULL,
+                metric TEXT NOT NULL,
+                ts INTEGER NOT NULL,
+                value REAL NOT NULL,
+                PRIMARY KEY (item_id, metric, ts)
+            ) WITHOUT ROWID;
 
-            CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN
-                INSERT INTO items_fts(rowid, title, body, source, category)
-                VALUES (new.id, new.title, new.body, new.source, new.category);
-            END;
+            -- 지표+기간 조회용 커버링 인덱스 (테이블을 읽지 않고 인덱스만으로 처리)
+            CREATE INDEX IF NOT EXISTS idx_metrics_metric_ts ON item_metrics(metric, ts, item_id, value);
 
-            CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN
-                INSERT INTO items_fts(items_fts, rowid, title, body, source, category)
-                VALUES ('delete', old.id, old.title, old.body, old.source, old.category);
+            CREATE TRIGGER IF NOT EXISTS item_metrics_ad AFTER DELETE ON items BEGIN
+                DELETE FROM item_metrics WHERE item_id = old.id;
             END;
-        """)
+
+            -- body/meta 압축 공유 사전 (한 번 만든 사전은 바꾸지 않음)
+            CREATE TABLE IF NOT EXISTS compression_dicts (
+                id INTEGER PRIMARY KEY,
+                dict BLOB NOT NULL,
+                sample_rows INTEGER,
+                created_at TEXT NOT NULL
+            );
+
+            -- 월별 보관 DB 목록 (archive_old가 기록)
+            CREATE TABLE IF NOT EXISTS archives (
+                month TEXT PRIMARY KEY,
+                file TEXT NOT NULL,
+                items INTEGER NOT NULL,
+                min_id INTEGER,
+                max_id INTEGER,
+                date_from TEXT,
+                date_to TEXT,
+                days INTEGER,
+                sources TEXT,
+                archived_at TEXT NOT NULL
+            );
+
+            -- 보관 DB로 옮긴 항목의 키 (다시 수집해도 hot DB에 새 행을 만들지 않기 위함)
+            CREATE TABLE IF NOT EXISTS archived_keys (
+                item_key TEXT PRIMARY KEY,
+                item_id INTEGER NOT NULL,
+                month TEXT NOT NULL,
+                last_seen TEXT,
+                seen_count INTEGER DEFAULT 1
+            ) WITHOUT ROWID;
+        """ + FTS_SCHEMA + FTS_INSERT_TRIGGER + ROLLUP_SCHEMA + ROLLUP_DELETE_TRIGGER)
         self.db.commit()
+        self._migrate_item_keys()
+        self.db.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_items_key ON items(item_key)")
+        self.db.commit()
+        for dict_id, zdict in self.db.execute("SELECT id, dict FROM compression_dicts ORDER BY id"):
+            self._dicts[dict_id] = zdict
+            self._use_dictionary(dict_id)
+        self._migrate_compression()
+        if not had_rollup:
+            self._backfill_rollup()
+        if not had_archived_keys:
+            self._backfill_archived_keys()
+
+    def _backfill_rollup(self):
+        """item_rollup 도입 이전 DB: hot DB와 보관 DB 항목으로 집계 채우기"""
+        with profiler.span("storage.backfill_rollup") as span:
+            schemas = list(self._schemas())
+            with self.db:
+                for schema in schemas:
+                    self.db.execute(f"""
+                        INSERT INTO item_rollup (date, source, category, item_count, score_sum, score_max)
+                        SELECT date, source, category, COUNT(*), SUM(score), MAX(score)
+                        FROM {schema}.items WHERE true GROUP BY date, source, category
+                        ON CONFLICT(date, source, category) DO UPDATE SET
+                            item_count = item_count + excluded.item_count,
+                            score_sum = score_sum + excluded.score_sum,
+                            score_max = MAX(score_max, excluded.score_max)
+                    """)
+            groups = self.db.execute("SELECT COUNT(*) FROM item_rollup").fetchone()[0]
+            span.add(items=groups)
+        if groups:
+            print(f"[Storage] 집계 테이블 생성: {groups}개 (날짜, 소스, 카테고리)")
+
+    def _backfill_archived_keys(self):
+        """archived_keys 도입 이전 DB: 보관 DB의 item_key로 채우기"""
+        months = [row[0] for row in self.db.execute("SELECT month FROM archives ORDER BY month")]
+        if not months:
+            return
+        with profiler.span("storage.backfill_archived_keys") as span:
+            for month in months:
+                schema = self._attach(month)
+                if schema is None:
+                    continue
+                with self.db:
+                    self.db.execute(f"""
+                        INSERT OR IGNORE INTO archived_keys (item_key, item_id, month, last_seen, seen_count)
+                        SELECT item_key, id, ?, last_seen, seen_count FROM {schema}.items
+                        WHERE item_key IS NOT NULL
+                    """, (month,))
+            keys = self.db.execute("SELECT COUNT(*) FROM archived_keys").fetchone()[0]
+            span.add(items=keys)
+        print(f"[Storage] 보관 항목 키 {keys}개 기록")
+
+    def _migrate_compression(self):
+        """압축 도입 이전 DB 변환: FTS를 items_text 기준으로 다시 만들고 기존 body/meta 압축"""
+        fts_sql = self.db.execute("SELECT sql FROM sqlite_master WHERE name = 'items_fts'").fetchone()[0]
+        if "items_text" in fts_sql:
+            return
+        with profiler.span("storage.migrate_compression") as span:
+            self._ensure_dictionary()
+            self.db.execute("BEGIN")
+            try:
+                for statement in ("DROP TRIGGER IF EXISTS items_fts_ai", "DROP TRIGGER IF EXISTS items_fts_ad",
+                                  "DROP TABLE items_fts"):
+                    self.db.execute(statement)
+                rows = self.db.execute("SELECT id, body, meta FROM items").fetchall()
+                self.db.executemany("UPDATE items SET body = ?, meta = ? WHERE id = ?", [
+                    (self._pack(body or ""), self._pack(meta or ""), row_id) for row_id, body, meta in rows
+                ])
+                self.db.commit()
+            except BaseException:
+                self.db.rollback()
+                raise
+            # executescript는 트랜잭션 밖에서 실행 (중간 커밋)
+            self.db.executescript(FTS_SCHEMA + FTS_INSERT_TRIGGER)
+            self.db.execute("INSERT INTO items_fts(items_fts) VALUES('rebuild')")
+            self.db.commit()
+            self.db.execute("VACUUM")
+            span.add(items=len(rows))
+        print(f"[Storage] body/meta 압축 변환: {len(rows)}개 행")
+
+    def _migrate_item_keys(self):
+        """item_key 도입 이전 DB 변환: 키 채우기 후 중복 행을 가장 먼저 저장된 행으로 합침"""
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(items)")}
+        if "item_key" in columns:
+            if not self.db.execute("SELECT 1 FROM items WHERE item_key IS NULL LIMIT 1").fetchone():
+                return
+        with profiler.span("storage.migrate_item_keys") as span:
+            self.db.execute("BEGIN")
+            try:
+                if "item_key" not in columns:
+                    self.db.execute("ALTER TABLE items ADD COLUMN item_key TEXT")
+                    self.db.execute("ALTER TABLE items ADD COLUMN last_seen TEXT")
+                    self.db.execute("ALTER TABLE items ADD COLUMN seen_count INTEGER DEFAULT 1")
+
+                rows = self.db.execute(
+                    "SELECT id, source, title, url, unz(body) FROM items WHERE item_key IS NULL"
+                ).fetchall()
+                self.db.executemany(
+                    "UPDATE items SET item_key = ?, last_seen = created_at, seen_count = 1 WHERE id = ?",
+                    [(item_key(source, title, url, body), row_id) for row_id, source, title, url, body in rows],
+                )
+
+                removed = self._merge_duplicate_keys()
+                self.db.commit()
+            except BaseException:
+                self.db.rollback()
+                raise
+            span.add(items=len(rows))
+        print(f"[Storage] item_key 변환: {len(rows)}개 행, 중복 {removed}개 정리")
+
+    def _merge_duplicate_keys(self) -> int:
+        """키별로 가장 먼저 저장된 행만 남기고 점수/마지막 수집 시각/수집 횟수를 합침. 삭제한 행 수 반환
+
+        executescript는 진행 중인 트랜잭션을 커밋하므로 문장별로 실행한다.
+        """
+        statements = [
+            """CREATE TEMP TABLE item_key_dups (
+                   keep_id INTEGER PRIMARY KEY, item_key TEXT UNIQUE,
+                   score INTEGER, last_seen TEXT, n INTEGER
+               )""",
+            """INSERT INTO item_key_dups
+                   SELECT MIN(id), item_key, MAX(score), MAX(last_seen), SUM(seen_count)
+                   FROM items GROUP BY item_key HAVING COUNT(*) > 1""",
+            """UPDATE items SET
+                   score = (SELECT score FROM item_key_dups WHERE keep_id = items.id),
+                   last_seen = (SELECT last_seen FROM item_key_dups WHERE keep_id = items.id),
+                   seen_count = (SELECT n FROM item_key_dups WHERE keep_id = items.id)
+               WHERE id IN (SELECT keep_id FROM item_key_dups)""",
+        ]
+        for sql in statements:
+            self.db.execute(sql)
+        removed = self.db.execute("""
+            DELETE FROM items
+            WHERE item_key IN (SELECT item_key FROM item_key_dups)
+              AND id NOT IN (SELECT keep_id FROM item_key_dups)
+        """).rowcount
+        self.db.execute("DROP TABLE item_key_dups")
+        return removed
 
     # ── 저장 ──
 
+    def _row(self, now: datetime, source: str, category: str, title: str,
+             url: str = "", score: int = 0, body: str = "", meta: str = "") -> tuple:
+        """INSERT 파라미터 (ITEM_COLUMNS 순서, body/meta는 압축)"""
+        title, url, body = title.strip(), (url or "").strip(), (body or "").strip()
+        timestamp = now.isoformat()
+        return (now.strftime("%Y-%m-%d"), source, category, title, url, score or 0,
+                self._pack(body), self._pack((meta or "").strip()),
+                timestamp, item_key(source, title, url, body), timestamp)
+
+    def _pack(self, text: str):
+        return pack_text(text, self.COMPRESS_MIN, self._primed, self._dict_id)
+
+    def _use_dictionary(self, dict_id: int):
+        self._dict_id = dict_id
+        self._primed = primed_compressor(self._dicts[dict_id])
+
+    def _ensure_dictionary(self):
+        """사전이 없고 항목이 DICT_TRAIN_MIN개 이상이면 사전 생성"""
+        if self._dict_id or self.COMPRESS_MIN is None:
+            return
+        if self.db.execute("SELECT COUNT(*) FROM items").fetchone()[0] >= self.DICT_TRAIN_MIN:
+            self.train_dictionary()
+
+    def train_dictionary(self, sample_rows: int = None):
+        """최근 본문으로 zlib 공유 사전을 만들고 이후 압축에 사용. 새 사전 id 반환 (만들지 못하면 None)
+
+        짧은 본문은 행 하나만으로는 반복이 적어 압축이 잘 안 되지만, 자주 나오는 단어/문구를 담은 사전을
+        함께 쓰면 행 단위로도 압축률이 오른다. 기존 행은 만들 때 쓴 사전 id를 그대로 가리킨다.
+        """
+        if self._dict_id >= 255:
+            print("[Storage] 압축 사전 개수 한도(255) 초과")
+            return None
+        with profiler.span("storage.train_dictionary") as span:
+            sample = [body for (body,) in self.db.execute(
+                "SELECT unz(body) FROM items WHERE body != '' ORDER BY id DESC LIMIT ?",
+                (sample_rows or self.DICT_SAMPLE_ROWS,)
+            )]
+            # zlib은 사전의 뒤쪽을 더 가까운 거리로 참조하므로 최근 본문을 뒤에 둔다
+            zdict = " ".join(reversed(sample)).encode('utf-8')[-ZDICT_SIZE:]
+            if not zdict:
+                return None
+            with self.db:
+                dict_id = self.db.execute(
+                    "INSERT INTO compression_dicts (dict, sample_rows, created_at) VALUES (?, ?, ?)",
+                    (zdict, len(sample), datetime.now(KST).isoformat())
+                ).lastrowid
+            span.add(items=len(sample))
+        self._dicts[dict_id] = zdict
+        self._use_dictionary(dict_id)
+        print(f"[Storage] 압축 사전 #{dict_id} 생성 ({len(zdict):,} bytes, 본문 {len(sample)}개)")
+        return dict_id
+
     def save_item(self, source: str, category: str, title: str,
                   url: str = "", score: int = 0, body: str = "", meta: str = ""):
         """개별 항목 저장"""
         if not title or not title.strip():
             return
-        kst = pytz.timezone('Asia/Seoul')
-        now = datetime.now(kst)
-        self.db.execute(
-            "INSERT INTO items (date, source, category, title, url, score, body, meta, created_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (now.strftime("%Y-%m-%d"), source, category, title.strip(),
-             url.strip(), score, body.strip(), meta.strip(), now.isoformat())
-        )
-
-    def save_items(self, items: list):
-        """여러 항목 일괄 저장. items: list of dict with keys matching save_item params"""
+        row = self._row(datetime.now(KST), source, category, title, url, score, body, meta)
+        if self._touch_archived([row]):
+            return
+        self.db.execute(INSERT_ITEM_SQL, row)
+
+    def save_items(self, items: list, defer_fts: bool = None) -> int:
+        """여러 항목 일괄 저장. items: list of dict with keys matching save_item params
+
+        배치 전체에 같은 시각을 쓰고, executemany로 한 트랜잭션에서 저장한다.
+        defer_fts가 True이면(None이면 FTS_DEFER_MIN개 이상일 때) 행마다 FTS 트리거를 실행하지 않고
+        저장이 끝난 뒤 새 행만 한 번에 색인한다.
+        item_rollup도 행마다 트리거로 갱신하지 않고, 배치가 건드린 (date, source, category)만 다시 집계한다.
+        이미 있는 항목(item_key 충돌)은 score/last_seen/seen_count만 갱신한다. 새로 추가된 행 수 반환.
+        보관 DB로 옮긴 항목은 hot DB에 넣지 않고 archived_keys의 last_seen/seen_count만 갱신한다.
+        항목에 metrics({지표: 값})가 있으면 같은 트랜잭션에서 item_metrics에 샘플로 기록한다.
+        """
+        self._ensure_dictionary()
+        now = datetime.now(KST)
+        rows, samples = [], []
         for item in items:
-            self.save_item(**item)
-        self.db.commit()
+            if not item.get("title") or not item["title"].strip():
+                continue
+            row = self._row(now, **{k: v for k, v in item.items() if k not in METRIC_FIELDS})
+            rows.append(row)
+            if item.get("metrics"):
+                samples.append((row[ITEM_KEY_INDEX], item["metrics"], item.get("posted_at")))
+        if not rows:
+            return 0
+        if defer_fts is None:
+            defer_fts = len(rows) >= self.FTS_DEFER_MIN
+
+        with profiler.span("storage.save_items", defer_fts=defer_fts) as span:
+            # 트리거 삭제/재생성까지 한 트랜잭션으로 묶어 실패 시 함께 롤백
+            if self.db.in_transaction:
+                self.db.commit()
+            self.db.execute("BEGIN")
+            try:
+                last_id = self.db.execute("SELECT COALESCE(MAX(id), 0) FROM items").fetchone()[0]
+                if defer_fts:
+                    self.db.execute("DROP TRIGGER IF EXISTS items_fts_ai")
+                self.db.execute("DROP TRIGGER IF EXISTS item_rollup_ai")
+                self.db.execute("DROP TRIGGER IF EXISTS item_rollup_au")
+                archived = self._touch_archived(rows)
+                self.db.executemany(INSERT_ITEM_SQL, (row for row in rows if row[ITEM_KEY_INDEX] not in archived))
+                inserted = self.db.execute("SELECT COUNT(*) FROM items WHERE id > ?", (last_id,)).fetchone()[0]
+                if defer_fts:
+                    self.db.execute("""
+                        INSERT INTO items_fts(rowid, title, body, source, category)
+                        SELECT id, title, unz(body), source, category FROM items WHERE id > ?
+                    """, (last_id,))
+                    self.db.execute(FTS_INSERT_TRIGGER)
+                self._refresh_rollup([row[ITEM_KEY_INDEX] for row in rows])
+                self.db.execute(ROLLUP_INSERT_TRIGGER)
+                self.db.execute(ROLLUP_UPDATE_TRIGGER)
+                recorded = self._insert_metrics(samples, int(now.timestamp()))
+                self.db.commit()
+            except BaseException:
+                self.db.rollback()
+                raise
+            span.add(items=inserted)
+            span.set(upserted=len(rows) - inserted, metrics=recorded)
+        return inserted
+
+    def _archived_ids(self, keys: list) -> dict:
+        """보관한 항목의 {item_key: id} (archived_keys가 비어 있으면 조회하지 않음)"""
+        if self.db.execute("SELECT 1 FROM archived_keys LIMIT 1").fetchone() is None:
+            return {}
+        ids = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), self.KEY_LOOKUP_CHUNK):
+            chunk = unique[start:start + self.KEY_LOOKUP_CHUNK]
+            ids.update(self.db.execute(
+                f"SELECT item_key, item_id FROM archived_keys WHERE item_key IN ({','.join('?' * len(chunk))})",
+                chunk
+            ).fetchall())
+        return ids
+
+    def _touch_archived(self, rows: list) -> dict:
+        """rows 중 보관한 항목의 last_seen/seen_count 갱신. {item_key: id} 반환 (트랜잭션은 호출자가 관리)"""
+        archived = self._archived_ids([row[ITEM_KEY_INDEX] for row in rows])
+        if archived:
+            last_seen = ITEM_COLUMNS.index("last_seen")
+            self.db.executemany(
+                "UPDATE archived_keys SET last_seen = ?, seen_count = seen_count + 1 WHERE item_key = ?",
+                [(row[last_seen], row[ITEM_KEY_INDEX]) for row in rows if row[ITEM_KEY_INDEX] in archived]
+            )
+        return archived
+
+    def _refresh_rollup(self, keys: list):
+        """keys 항목이 속한 (date, source, category) 집계를 items에서 다시 계산 (트랜잭션은 호출자가 관리)
+
+        새 행과 upsert로 점수가 바뀐 기존 행의 그룹만 다시 세므로 비용은 배치가 건드린 그룹 크기에 비례한다.
+        보관한 달은 hot DB에 행이 없으므로 건드리지 않는다.
+        """
+        self.db.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS rollup_dirty (
+                date TEXT, source TEXT, category TEXT, PRIMARY KEY (date, source, category)
+            ) WITHOUT ROWID
+        """)
+        self.db.execute("DELETE FROM temp.rollup_dirty")
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), self.KEY_LOOKUP_CHUNK):
+            chunk = unique[start:start + self.KEY_LOOKUP_CHUNK]
+            self.db.execute(f"""
+                INSERT OR IGNORE INTO temp.rollup_dirty
+                SELECT date, source, category FROM items WHERE item_key IN ({','.join('?' * len(chunk))})
+            """, chunk)
+        self.db.execute("""
+            DELETE FROM item_rollup
+            WHERE (date, source, category) IN (SELECT date, source, category FROM temp.rollup_dirty)
+        """)
+        # CROSS JOIN으로 rollup_dirty를 바깥 루프에 고정 (그룹마다 source/date 인덱스 검색, items 전체를 훑지 않음)
+        self.db.execute("""
+            INSERT INTO item_rollup (date, source, category, item_count, score_sum, score_max)
+            SELECT i.date, i.source, i.category, COUNT(*), SUM(i.score), MAX(i.score)
+            FROM temp.rollup_dirty d
+            CROSS JOIN items i ON i.source = d.source AND i.date = d.date AND i.category = d.category
+            GROUP BY i.date, i.source, i.category
+        """)
+
+    def record_metrics(self, samples: list) -> int:
+        """이미 저장된 항목의 수치 샘플 기록. 기록한 샘플 수 반환
+
+        samples: list of dict (source, title, url, body, metrics, posted_at)
+        캐시 때문에 다시 저장되지 않는 항목도 시계열이 이어지도록 수집기가 목록에서 본 값을 넘긴다.
+        DB에 없는 항목은 건너뛴다.
+        """
+        rows = [(item_key(s.get("source", ""), (s.get("title") or "").strip(), (s.get("url") or "").strip(),
+                          (s.get("body") or "").strip()),
+                 s["metrics"], s.get("posted_at"))
+                for s in samples if s.get("metrics")]
+        if not rows:
+            return 0
+        with profiler.span("storage.record_metrics") as span:
+            if self.db.in_transaction:
+                self.db.commit()
+            self.db.execute("BEGIN")
+            try:
+                recorded = self._insert_metrics(rows, int(datetime.now(KST).timestamp()))
+                self.db.commit()
+            except BaseException:
+                self.db.rollback()
+                raise
+            span.add(items=recorded)
+        return recorded
+
+    def _item_ids(self, keys: list) -> dict:
+        """{item_key: id} (KEY_LOOKUP_CHUNK개씩 나눠 조회, hot DB에 없으면 보관한 항목의 id)"""
+        ids = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), self.KEY_LOOKUP_CHUNK):
+            chunk = unique[start:start + self.KEY_LOOKUP_CHUNK]
+            ids.update(self.db.execute(
+                f"SELECT item_key, id FROM items WHERE item_key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall())
+        missing = [key for key in unique if key not in ids]
+        if missing:
+            ids.update(self._archived_ids(missing))
+        return ids
+
+    def _insert_metrics(self, samples: list, ts: int) -> int:
+        """(item_key, {지표: 값}, posted_at) 목록을 ts 시각 샘플로 기록 (트랜잭션은 호출자가 관리)
+
+        posted_at(게시 시각 epoch 초)이 있으면 그 시각에 값 0인 기준 샘플도 넣는다.
+        HN 점수처럼 게시 시점에 0에서 시작하는 지표는 한 번만 수집해도 시간당 증가율을 구할 수 있다.
+        """
+        if not samples:
+            return 0
+        ids = self._item_ids([key for key, _, _ in samples])
+        rows, origins = [], []
+        for key, metrics, posted_at in samples:
+            item_id = ids.get(key)
+            if item_id is None:
+                continue
+            for metric, value in metrics.items():
+                if value is None:
+                    continue
+                rows.append((item_id, metric, ts, float(value)))
+                if posted_at and int(posted_at) < ts:
+                    origins.append((item_id, metric, int(posted_at), 0.0))
+        self.db.executemany("INSERT OR REPLACE INTO item_metrics (item_id, metric, ts, value) VALUES (?, ?, ?, ?)",
+                            rows)
+        self.db.executemany("INSERT OR IGNORE INTO item_metrics (item_id, metric, ts, value) VALUES (?, ?, ?, ?)",
+                            origins)
+        return len(rows)
+
+    def rebuild_fts(self):
+        """FTS 색인 전체 재구성 (items 테이블 기준)"""
+        with profiler.span("storage.rebuild_fts"):
+            self.db.execute("INSERT INTO items_fts(items_fts) VALUES('rebuild')")
+            self.db.commit()
 
     def flush(self):
         """버퍼 커밋"""
         self.db.commit()
 
+    # ── 보관 (hot/cold 분리) ──
+
+    @staticmethod
+    def _month_range(month: str) -> tuple:
+        """"YYYY-MM" -> date BETWEEN 조건 (date 인덱스 사용)"""
+        return f"{month}-00", f"{month}-99"
+
+    def archive_old(self, keep_months: int = 3, now: datetime = None) -> list:
+        """keep_months개월 이전 항목을 월별 보관 DB로 옮긴 뒤 hot DB를 VACUUM. 보관한 월 목록 반환
+
+        가장 최근에 저장된 행(최대 id)이 속한 달은 남긴다. hot DB가 비어 id가 다시 1부터 할당되면
+        보관 DB의 id와 겹치기 때문이다.
+        """
+        now = now or datetime.now(KST)
+        index = now.year * 12 + now.month - 1 - keep_months
+        cutoff = f"{index // 12:04d}-{index % 12 + 1:02d}"
+        latest = self.db.execute("SELECT substr(date, 1, 7) FROM items ORDER BY id DESC LIMIT 1").fetchone()
+        if latest is None:
+            return []
+        months = [row[0] for row in self.db.execute(
+            "SELECT DISTINCT substr(date, 1, 7) FROM items WHERE date < ? ORDER BY 1",
+            (f"{min(cutoff, latest[0])}-00",)
+        )]
+        if not months:
+            return []
+
+        with profiler.span("storage.archive", months=len(months)) as span:
+            for month in months:
+                moved = self._archive_month(month)
+                span.add(items=moved)
+                print(f"[Storage] {month} 항목 {moved}개 보관")
+            self.db.execute("VACUUM")
+        return months
+
+    def _archive_month(self, month: str) -> int:
+        """한 달 치 항목을 data/archive/trends-YYYY-MM.db.gz로 옮김. 옮긴 행 수 반환
+
+        VACUUM INTO로 hot DB를 복사한 뒤 다른 달을 지워 같은 스키마(FTS/지표 포함)의 보관 DB를 만든다.
+        같은 달 보관 DB가 이미 있으면 기존 행을 합친다.
+        """
+        self.db.commit()
+        self._detach(month)
+        work = self._temp_dir() / f"build-{month}.db"
+        if work.exists():
+            work.unlink()
+        self.db.execute("VACUUM INTO ?", (str(work),))
+
+        low, high = self._month_range(month)
+        archive = connect(str(work), self._dicts)
+        try:
+            archive.execute("PRAGMA journal_mode=DELETE")
+            # 집계는 hot DB의 item_rollup이 전체 기간을 유지하므로 보관 DB에는 두지 않음
+            for statement in ("DROP TABLE IF EXISTS archives", "DROP TABLE IF EXISTS archived_keys",
+                              "DROP TRIGGER IF EXISTS item_rollup_ai",
+                              "DROP TRIGGER IF EXISTS item_rollup_au", "DROP TRIGGER IF EXISTS item_rollup_ad",
+                              "DROP TABLE IF EXISTS item_rollup"):
+                archive.execute(statement)
+            archive.execute("DELETE FROM items WHERE date NOT BETWEEN ? AND ?", (low, high))
+            # 이전에 보관한 항목의 수치 샘플(hot DB에 남은 것)은 이 달 보관 DB에 넣지 않음
+            archive.execute("DELETE FROM item_metrics WHERE item_id NOT IN (SELECT id FROM items)")
+            previous = self.archive_dir / f"trends-{month}.db.gz"
+            if previous.exists():
+                archive.commit()
+                archive.execute("ATTACH DATABASE ? AS previous", (str(self._extract(previous)),))
+                archive.execute("INSERT OR IGNORE INTO items SELECT * FROM previous.items")
+                archive.execute("INSERT OR IGNORE INTO item_metrics SELECT * FROM previous.item_metrics")
+                archive.commit()
+                archive.execute("DETACH DATABASE previous")
+            archive.execute("INSERT INTO items_fts(items_fts) VALUES('optimize')")
+            archive.commit()
+            summary = archive.execute("""
+                SELECT COUNT(*), MIN(id), MAX(id), MIN(date), MAX(date), COUNT(DISTINCT date),
+                       (SELECT group_concat(source, ',') FROM (SELECT DISTINCT source FROM items))
+                FROM items
+            """).fetchone()
+            archive.execute("VACUUM")
+        finally:
+            archive.close()
+
+        # 압축본을 원자적으로 교체한 뒤에 hot DB에서 삭제
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        target = self.archive_dir / f"trends-{month}.db.gz"
+        partial = target.with_name(target.name + ".tmp")
+        with open(work, "rb") as src, gzip.open(partial, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(partial, target)
+        work.unlink()
+        (self._temp_dir() / f"trends-{month}.db").unlink(missing_ok=True)  # 이전 압축 해제본
+
+        # 보관한 행은 item_rollup에서 빼지 않음 (삭제 트리거를 잠시 내리고 같은 트랜잭션에서 복구)
+        self.db.execute("BEGIN")
+        try:
+            self.db.execute("""
+                INSERT OR REPLACE INTO archived_keys (item_key, item_id, month, last_seen, seen_count)
+                SELECT item_key, id, ?, last_seen, seen_count FROM items
+                WHERE date BETWEEN ? AND ? AND item_key IS NOT NULL
+            """, (month, low, high))
+            self.db.execute("DROP TRIGGER IF EXISTS item_rollup_ad")
+            moved = self.db.execute("DELETE FROM items WHERE date BETWEEN ? AND ?", (low, high)).rowcount
+            self.db.execute(ROLLUP_DELETE_TRIGGER)
+            self.db.execute("""
+                INSERT OR REPLACE INTO archives
+                    (month, file, items, min_id, max_id, date_from, date_to, days, sources, archived_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (month, target.name, *summary, datetime.now(KST).isoformat()))
+            self.db.commit()
+        except BaseException:
+            self.db.rollback()
+            raise
+        return moved
+
+    def archived_months(self, date_from: str = None, date_to: str = None) -> list:
+        """보관된 월 목록 (최신순). 기간을 주면 겹치는 달만"""
+        rows = self.db.execute("""
+            SELECT month FROM archives
+            WHERE (? IS NULL OR date_to >= ?) AND (? IS NULL OR date_from <= ?)
+            ORDER BY month DESC
+        """, (date_from, date_from, date_to, date_to)).fetchall()
+        return [row[0] for row in rows]
+
+    def _temp_dir(self) -> Path:
+        if self._tmp_dir is None:
+            self._tmp_dir = Path(tempfile.mkdtemp(prefix="trends-archive-"))
+        return self._tmp_dir
+
+    def _extract(self, path: Path) -> Path:
+        """보관 DB 압축 해제 (이번 프로세스에서 한 번만)"""
+        target = self._temp_dir() / path.name[:-len(".gz")]
+        if not target.exists():
+            partial = target.with_name(target.name + ".tmp")
+            with gzip.open(path, "rb") as src, open(partial, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(partial, target)
+        return target
+
+    def _attach(self, month: str):
+        """보관 DB를 읽기 전용으로 ATTACH하고 스키마 이름 반환. 파일이 없으면 None
+
+        MAX_ATTACHED개를 넘으면 가장 오래 쓰지 않은 DB부터 DETACH한다.
+        """
+        if month in self._attached:
+            self._attached.move_to_end(month)
+            return self._attached[month]
+        path = self.archive_dir / f"trends-{month}.db.gz"
+        if not path.exists():
+            print(f"[Storage] 보관 DB 없음: {path.name}")
+            return None
+        while len(self._attached) >= self.MAX_ATTACHED:
+            self._detach(next(iter(self._attached)))
+        schema = f"archive_{month.replace('-', '_')}"
+        with profiler.span("storage.attach", month=month):
+            extracted = self._extract(path)
+            self.db.commit()  # 트랜잭션 중에는 ATTACH 불가
+            self.db.execute("ATTACH DATABASE ? AS " + schema,
+                            (f"file:{extracted}?mode=ro&immutable=1",))
+        self._attached[month] = schema
+        return schema
+
+    def _detach(self, month: str):
+        schema = self._attached.pop(month, None)
+        if schema:
+            self.db.commit()
+            self.db.execute(f"DETACH DATABASE {schema}")
+
     # ── Step 1: 가벼운 조회 (제목+메타만, 컨텍스트 최소) ──
 
     def browse(self, date_from: str = None, date_to: str = None,
                category: str = None, source: str = None, limit: int = 50) -> list:
         """제목+메타 목록 반환. body 제외로 컨텍스트 절약."""
+        return self.browse_page(date_from=date_from, date_to=date_to, category=category,
+                                source=source, limit=limit)["items"]
+
+    def browse_page(self, cursor: str = None, date_from: str = None, date_to: str = None,
+                    category: str = None, source: str = None, limit: int = 50) -> dict:
+        """browse의 커서(keyset) 페이지 버전. {"items": [...], "next_cursor": str 또는 None} 반환
+
+        다음 페이지는 next_cursor를 그대로 넘겨 요청한다. OFFSET 대신 마지막 행의 (date, score, id)
+        이후부터 인덱스를 읽으므로 페이지 깊이와 관계없이 페이지당 비용이 같다.
+        """
         conditions = []
         params = []
 
@@ -104,44 +926,80 @@ class TrendStorage:
         if source:
             conditions.append("source = ?")
             params.append(source)
+        if cursor:
+            conditions.append("(date, score, id) < (?, ?, ?)")
+            params.extend(self._decode_cursor(cursor))
 
         where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        params.append(limit)
 
-        rows = self.db.execute(f"""
-            SELECT id, date, source, category, title, score
-            FROM items {where}
-            ORDER BY date DESC, score DESC
-            LIMIT ?
-        """, params).fetchall()
+        # hot DB부터 최신 달 순으로 읽고 limit을 채우면 멈춤 (달끼리는 날짜가 겹치지 않음)
+        rows = []
+        upper = self._decode_cursor(cursor)[0] if cursor else date_to
+        for schema in self._schemas(date_from, upper):
+            rows += self.db.execute(f"""
+                SELECT id, date, source, category, title, score
+                FROM {schema}.items {where}
+                ORDER BY date DESC, score DESC, id DESC
+                LIMIT ?
+            """, params + [limit - len(rows)]).fetchall()
+            if len(rows) >= limit:
+                break
 
-        return [{"id": r[0], "date": r[1], "source": r[2], "category": r[3],
-                 "title": r[4], "score": r[5]} for r in rows]
+        items = [{"id": r[0], "date": r[1], "source": r[2], "category": r[3],
+                  "title": r[4], "score": r[5]} for r in rows]
+        next_cursor = None
+        if len(rows) == limit:
+            last = items[-1]
+            next_cursor = f"{last['date']}|{last['score']}|{last['id']}"
+        return {"items": items, "next_cursor": next_cursor}
+
+    def _schemas(self, date_from: str = None, date_to: str = None):
+        """조회할 스키마를 최신순으로 (main 다음 기간과 겹치는 보관 DB를 필요할 때 ATTACH)"""
+        yield "main"
+        for month in self.archived_months(date_from, date_to):
+            schema = self._attach(month)
+            if schema:
+                yield schema
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple:
+        """browse_page 커서 "date|score|id" -> (date, score, id)"""
+        try:
+            date, score, row_id = cursor.split("|")
+            return date, int(score), int(row_id)
+        except ValueError:
+            raise ValueError(f"잘못된 커서: {cursor!r}") from None
 
     def search(self, query: str, limit: int = 20, category: str = None) -> list:
-        """FTS 키워드 검색. 제목 snippet만 반환."""
-        conditions = ["items_fts MATCH ?"]
+        """FTS 키워드 검색. 제목 snippet만 반환.
+
+        보관 DB까지 검색한다. 순위(bm25)는 DB별로 계산되므로 DB 사이의 순서는 근사치다.
+        """
+        conditions = ["f.items_fts MATCH ?"]
         params = [query]
         if category:
-            conditions.append("category = ?")
+            conditions.append("i.category = ?")
             params.append(category)
 
         where = " AND ".join(conditions)
         params.append(limit)
 
-        rows = self.db.execute(f"""
-            SELECT i.id, i.date, i.source, i.category,
-                   snippet(items_fts, 0, '>>>', '<<<', '...', 32),
-                   i.score
-            FROM items_fts
-            JOIN items i ON i.id = items_fts.rowid
-            WHERE {where}
-            ORDER BY rank
-            LIMIT ?
-        """, params).fetchall()
+        rows = []
+        for schema in self._schemas():
+            rows += self.db.execute(f"""
+                SELECT i.id, i.date, i.source, i.category,
+                       snippet(f.items_fts, 0, '>>>', '<<<', '...', 32),
+                       i.score, f.rank
+                FROM {schema}.items_fts AS f
+                JOIN {schema}.items i ON i.id = f.rowid
+                WHERE {where}
+                ORDER BY f.rank
+                LIMIT ?
+            """, params).fetchall()
+        rows.sort(key=lambda r: r[6])
 
         return [{"id": r[0], "date": r[1], "source": r[2], "category": r[3],
-                 "title_snippet": r[4], "score": r[5]} for r in rows]
+                 "title_snippet": r[4], "score": r[5]} for r in rows[:limit]]
 
     # ── Step 2: 상세 조회 (필요한 항목만) ──
 
@@ -149,30 +1007,317 @@ class TrendStorage:
         """특정 항목의 전체 데이터 (body 포함) 반환."""
         if not item_ids:
             return []
-        placeholders = ",".join("?" * len(item_ids))
-        rows = self.db.execute(f"""
-            SELECT id, date, source, category, title, url, score, body, meta
-            FROM items WHERE id IN ({placeholders})
-            ORDER BY date DESC, score DESC
-        """, item_ids).fetchall()
+        rows = self._detail_rows("main", list(item_ids))
+        missing = set(item_ids) - {r[0] for r in rows}
+        if missing:
+            # id 범위로 보관 DB별 id를 나눈 뒤 해당 보관 DB만 ATTACH해 그 id만 조회
+            ranges = self.db.execute(
+                "SELECT month, min_id, max_id FROM archives WHERE min_id IS NOT NULL ORDER BY month"
+            ).fetchall()
+            by_month: dict = {}
+            for item_id in sorted(missing):
+                for month, min_id, max_id in ranges:
+                    if min_id <= item_id <= max_id:
+                        by_month.setdefault(month, []).append(item_id)
+            for month, ids in by_month.items():
+                schema = self._attach(month)
+                if schema:
+                    rows += self._detail_rows(schema, ids)
+        rows.sort(key=lambda r: (r[1], r[6]), reverse=True)
 
         return [{"id": r[0], "date": r[1], "source": r[2], "category": r[3],
-                 "title": r[4], "url": r[5], "score": r[6], "body": r[7], "meta": r[8]}
+                 "title": r[4], "url": r[5], "score": r[6], "body": unpack_text(r[7], self._dicts),
+                 "meta": unpack_text(r[8], self._dicts)}
                 for r in rows]
 
+    # ── 수치 시계열 ──
+
+    def metric_history(self, item_id: int, metric: str, since: int = None) -> list:
+        """항목 하나의 지표 샘플 목록 (시간순). since: epoch 초"""
+        rows = self.db.execute("""
+            SELECT ts, value FROM item_metrics
+            WHERE item_id = ? AND metric = ? AND ts >= ?
+            ORDER BY ts
+        """, (item_id, metric, since or 0)).fetchall()
+        return [{"ts": r[0], "value": r[1]} for r in rows]
+
+    def velocity(self, metric: str, hours: float = 24, source: str = None, category: str = None,
+                 limit: int = 20, per_hour: bool = False, now: int = None) -> list:
+        """최근 hours 동안 지표 증가량이 큰 항목 (예: 24시간 동안 늘어난 스타 수)
+
+        기간 안의 마지막 샘플과 기준 샘플(기간 시작 이전의 마지막 샘플, 없으면 기간 안의 첫 샘플)의
+        차이를 gain으로, 두 샘플 사이 시간으로 나눈 값을 per_hour로 반환한다.
+        per_hour=True이면 시간당 증가율 순, 아니면 증가량 순으로 정렬한다.
+        """
+        end = now if now is not None else int(datetime.now(KST).timestamp())
+        params = {"metric": metric, "start": int(end - hours * 3600), "end": end, "limit": limit}
+        conditions = ["b.t1 > b.t0"]
+        if source:
+            conditions.append("i.source = :source")
+            params["source"] = source
+        if category:
+            conditions.append("i.category = :category")
+            params["category"] = category
+
+        rows = self.db.execute(f"""
+            WITH latest AS (
+                SELECT item_id, MAX(ts) AS t1 FROM item_metrics
+                WHERE metric = :metric AND ts > :start AND ts <= :end
+                GROUP BY item_id
+            ),
+            b AS (
+                SELECT item_id, t1, COALESCE(
+                    (SELECT MAX(ts) FROM item_metrics m
+                     WHERE m.item_id = latest.item_id AND m.metric = :metric AND m.ts <= :start),
+                    (SELECT MIN(ts) FROM item_metrics m
+                     WHERE m.item_id = latest.item_id AND m.metric = :metric AND m.ts > :start)
+                ) AS t0
+                FROM latest
+            )
+            SELECT i.id, i.source, i.category, i.title, i.url,
+                   v1.value - v0.value AS gain,
+                   (v1.value - v0.value) * 3600.0 / (b.t1 - b.t0) AS per_hour,
+                   v1.value, b.t0, b.t1
+            FROM b
+            JOIN item_metrics v1 ON v1.item_id = b.item_id AND v1.metric = :metric AND v1.ts = b.t1
+            JOIN item_metrics v0 ON v0.item_id = b.item_id AND v0.metric = :metric AND v0.ts = b.t0
+            JOIN items i ON i.id = b.item_id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY {'per_hour' if per_hour else 'gain'} DESC
+            LIMIT :limit
+        """, params).fetchall()
+
+        return [{"id": r[0], "source": r[1], "category": r[2], "title": r[3], "url": r[4],
+                 "gain": r[5], "per_hour": round(r[6], 2), "value": r[7], "from_ts": r[8], "to_ts": r[9]}
+                for r in rows]
+
+    def rising(self, source: str = "Hacker News", metric: str = "score",
+               hours: float = 24, limit: int = 10) -> list:
+        """시간당 증가율이 가장 높은 항목 (기본: 빠르게 뜨는 HN 스토리)"""
+        return self.velocity(metric, hours=hours, source=source, limit=limit, per_hour=True)
+
+    def _detail_rows(self, schema: str, item_ids: list) -> list:
+        """id 목록의 상세 행 (KEY_LOOKUP_CHUNK개씩 나눠 조회)"""
+        rows = []
+        for start in range(0, len(item_ids), self.KEY_LOOKUP_CHUNK):
+            chunk = item_ids[start:start + self.KEY_LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows += self.db.execute(f"""
+                SELECT id, date, source, category, title, url, score, body, meta
+                FROM {schema}.items WHERE id IN ({placeholders})
+            """, chunk).fetchall()
+        return rows
+
     # ── 유틸리티 ──
 
     def stats(self) -> dict:
-        """DB 요약 통계"""
+        """DB 요약 통계 (보관 DB 포함, item_rollup에서 계산)"""
         row = self.db.execute("""
-            SELECT MIN(date), MAX(date), COUNT(*),
+            SELECT MIN(date), MAX(date), COALESCE(SUM(item_count), 0),
                    COUNT(DISTINCT source), COUNT(DISTINCT date)
-            FROM items
+            FROM item_rollup
         """).fetchone()
+        archives, archived_items = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(items), 0) FROM archives"
+        ).fetchone()
         return {
             "date_from": row[0], "date_to": row[1],
-            "total_items": row[2], "sources": row[3], "days": row[4]
+            "total_items": row[2], "sources": row[3], "days": row[4],
+            "hot_items": row[2] - archived_items, "archives": archives
         }
 
+    def daily_stats(self, date_from: str = None, date_to: str = None, source: str = None,
+                    category: str = None, by_source: bool = False) -> list:
+        """날짜별(by_source면 날짜×소스별) 항목 수/점수 합계/최고 점수 (최신 날짜부터)"""
+        conditions, params = self._rollup_filter(date_from, date_to, source, category)
+        group = "date, source" if by_source else "date"
+        rows = self.db.execute(f"""
+            SELECT {group}, SUM(item_count), SUM(score_sum), MAX(score_max)
+            FROM item_rollup {conditions}
+            GROUP BY {group}
+            ORDER BY date DESC{', SUM(item_count) DESC' if by_source else ''}
+        """, params).fetchall()
+        keys = ("date", "source") if by_source else ("date",)
+        return [dict(zip(keys, r[:len(keys)]), items=r[-3], score_sum=r[-2], score_max=r[-1],
+                     avg_score=round(r[-2] / r[-3], 1) if r[-3] else 0)
+                for r in rows]
+
+    def source_stats(self, date_from: str = None, date_to: str = None, category: str = None) -> list:
+        """소스별 항목 수/수집일 수/첫·마지막 수집일/점수 (항목 수 많은 순)"""
+        conditions, params = self._rollup_filter(date_from, date_to, None, category)
+        rows = self.db.execute(f"""
+            SELECT source, SUM(item_count), COUNT(DISTINCT date), MIN(date), MAX(date),
+                   SUM(score_sum), MAX(score_max)
+            FROM item_rollup {conditions}
+            GROUP BY source
+            ORDER BY SUM(item_count) DESC
+        """, params).fetchall()
+        return [{"source": r[0], "items": r[1], "days": r[2], "first_date": r[3], "last_date": r[4],
+                 "avg_score": round(r[5] / r[1], 1) if r[1] else 0, "score_max": r[6]}
+                for r in rows]
+
+    def source_health(self, days: int = 7, baseline_days: int = 28, now: datetime = None) -> list:
+        """소스별 최근 수집량을 이전 기간과 비교
+
+        최근 days일 동안 하루 평균 항목 수를 그 이전 baseline_days일 평균과 비교한다.
+        status: stale(최근 기간에 항목 없음), dropping(이전 평균의 절반 미만), ok
+        """
+        today = (now or datetime.now(KST)).date()
+        recent_start = (today - timedelta(days=days)).isoformat()
+        baseline_start = (today - timedelta(days=days + baseline_days)).isoformat()
+        rows = self.db.execute("""
+            SELECT source, MAX(date),
+                   SUM(CASE WHEN date > :recent THEN item_count ELSE 0 END),
+                   SUM(CASE WHEN date <= :recent THEN item_count ELSE 0 END)
+            FROM item_rollup
+            WHERE date > :baseline AND date <= :today
+            GROUP BY source
+            ORDER BY source
+        """, {"recent": recent_start, "baseline": baseline_start, "today": today.isoformat()}).fetchall()
+
+        health = []
+        for source, last_date, recent, baseline in rows:
+            recent_rate, baseline_rate = recent / days, baseline / baseline_days
+            if not recent:
+                status = "stale"
+            elif baseline_rate and recent_rate < baseline_rate / 2:
+                status = "dropping"
+            else:
+                status = "ok"
+            health.append({"source": source, "status": status, "last_date": last_date,
+                           "recent_per_day": round(recent_rate, 2), "baseline_per_day": round(baseline_rate, 2)})
+        return health
+
+    @staticmethod
+    def _rollup_filter(date_from: str, date_to: str, source: str, category: str) -> tuple:
+        """item_rollup WHERE 절과 파라미터"""
+        conditions, params = [], []
+        for clause, value in (("date >= ?", date_from), ("date <= ?", date_to),
+                              ("source = ?", source), ("category = ?", category)):
+            if value:
+                conditions.append(clause)
+                params.append(value)
+        return (f"WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
     def close(self):
         self.db.close()
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+
+class StorageWriter:
+    """수집 중에 항목을 백그라운드 스레드에서 저장하는 write-behind 큐
+
+    수집기가 끝날 때마다 put_items()로 행을 넘기면 writer 스레드가 모아서 save_items로 저장한다.
+    큐는 max_pending개 묶음(묶음당 최대 chunk_rows행)까지만 쌓이고, 가득 차면 put이 기다린다.
+    close() 전까지 storage는 writer 스레드만 사용해야 한다 (check_same_thread=False로 생성).
+
+        writer = StorageWriter(storage).start()
+        writer.put_items("Hacker News", rows)
+        summary = writer.close()
+    """
+
+    _STOP = object()
+
+    def __init__(self, storage: TrendStorage, max_pending: int = 32, chunk_rows: int = 200,
+                 batch_rows: int = 1000):
+        self.storage = storage
+        self.chunk_rows = chunk_rows
+        self.batch_rows = batch_rows
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._thread = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._putting = 0  # _closed 확인을 통과했지만 아직 큐에 넣지 못한 put 수
+        self.counts: dict = {}  # 라벨 -> 받은 행 수
+        self.received = 0
+        self.inserted = 0
+        self.recorded = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def start(self) -> "StorageWriter":
+        # 저장 구간이 writer를 시작한 컨텍스트 아래에 기록되도록 복사
+        context = contextvars.copy_context()
+        self._thread = threading.Thread(target=context.run, args=(self._run,),
+                                        name="storage-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def put_items(self, label: str, rows: list):
+        """항목 행(save_items 형식 dict) 전달. 큐가 가득 차면 빌 때까지 기다림"""
+        for start in range(0, len(rows), self.chunk_rows):
+            self._put(("items", label, rows[start:start + self.chunk_rows]))
+
+    def put_metrics(self, label: str, samples: list):
+        """이미 저장된 항목의 수치 샘플(record_metrics 형식) 전달"""
+        if samples:
+            self._put(("metrics", label, list(samples)))
+
+    def _put(self, message: tuple):
+        with self._lock:
+            if self._closed:
+                # 제한 시간을 넘겨 늦게 끝난 수집기 등 close 이후 도착한 행은 버림
+                self.dropped += len(message[2])
+                return
+            if message[0] == "items":
+                self.counts[message[1]] = self.counts.get(message[1], 0) + len(message[2])
+            self._putting += 1
+        # 큐가 가득 차면 기다려야 하므로 락 밖에서 넣고, close는 _putting이 0이 될 때까지 STOP을 미룸
+        try:
+            self._queue.put(message)
+        finally:
+            with self._idle:
+                self._putting -= 1
+                if not self._putting:
+                    self._idle.notify_all()
+
+    def close(self, timeout: float = None) -> dict:
+        """남은 행을 모두 저장한 뒤 스레드 종료. 요약 dict 반환
+
+        이미 받아들인 put이 큐에 들어간 뒤에 STOP을 넣으므로 close와 겹친 행도 저장된다.
+        """
+        with self._idle:
+            self._closed = True
+            self._idle.wait_for(lambda: not self._putting, timeout)
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+        return {"received": self.received, "inserted": self.inserted, "recorded": self.recorded,
+                "dropped": self.dropped, "errors": self.errors, "sources": dict(self.counts)}
+
+    def _run(self):
+        stop = False
+        while not stop:
+            message = self._queue.get()
+            if message is self._STOP:
+                break
+            # 이미 쌓인 묶음은 batch_rows행까지 한 트랜잭션으로 합쳐 저장
+            rows, samples = [], []
+            while True:
+                kind, _, payload = message
+                (rows if kind == "items" else samples).extend(payload)
+                if len(rows) >= self.batch_rows:
+                    break
+                try:
+                    message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if message is self._STOP:
+                    stop = True
+                    break
+            self._write(rows, samples)
+
+    def _write(self, rows: list, samples: list):
+        try:
+            if rows:
+                self.received += len(rows)
+                self.inserted += self.storage.save_items(rows)
+            # 수치 샘플은 같은 묶음의 새 항목이 저장된 뒤 기록
+            if samples:
+                self.recorded += self.storage.record_metrics(samples)
+        except Exception as e:
+            self.errors += 1
+            print(f"[Storage] 저장 실패 ({len(rows)}개 항목): {e}")
+
@@ -0,0 +1,65 @@
+"""CollectionEngine 전체 데드라인 테스트
+
+멈춘 수집기가 있어도 엔진과 프로세스가 데드라인 근처에서 끝나는지 확인한다.
+인터프리터 종료 시 워커 join 여부까지 보려면 별도 프로세스로 실행해야 한다.
+"""
+
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+DEADLINE = 1.0
+HANG = 30.0
+
+SCRIPT = textwrap.dedent("""
+    import sys, time
+    sys.path.insert(0, {src!r})
+    from collection import CollectionEngine, CollectionTask
+
+    class Hung:
+        def collect_all(self):
+            time.sleep({hang})
+            return []
+
+        def format_for_analysis(self, data):
+            return ""
+
+    class Quick:
+        def collect_all(self):
+            return ["a"]
+
+        def format_for_analysis(self, data):
+            return "x"
+
+    engine = CollectionEngine(run_deadline={deadline}, poll_interval=0.05, mode={mode!r})
+    results = engine.run([
+        CollectionTask(1, "hung", Hung(), "dev", priority=1),
+        CollectionTask(2, "quick", Quick(), "dev"),
+    ])
+    print(",".join(result.status for result in results))
+""")
+
+
+def _run(mode: str):
+    script = SCRIPT.format(src=str(SRC), hang=HANG, deadline=DEADLINE, mode=mode)
+    start = time.monotonic()
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=HANG)
+    return proc, time.monotonic() - start
+
+
+def test_hung_collector_does_not_outlive_deadline_threads():
+    proc, elapsed = _run("threads")
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip().splitlines()[-1] == "timeout,ok"
+    assert elapsed < DEADLINE + 3.0
+
+
+def test_hung_collector_does_not_outlive_deadline_async():
+    proc, elapsed = _run("async")
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip().splitlines()[-1] == "timeout,ok"
+    assert elapsed < DEADLINE + 3.0